@@ -8,12 +8,13 @@ Usage:
 import sys
 from pathlib import Path
 
-# Add src/ to path so all existing imports work
+# Add src/ to path so all existing imports work.
+# Also add scripts/ so we can import helper functions from existing scripts.
+# Entries already on sys.path are not duplicated.
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root / 'src'))
-
-# Also add scripts/ so we can import helper functions from existing scripts
-sys.path.insert(0, str(project_root / 'scripts'))
+for _path in (str(project_root / 'src'), str(project_root / 'scripts')):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from web import create_app
 
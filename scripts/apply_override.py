@@ -24,60 +24,135 @@ Usage:
 
     python scripts/apply_override.py AAPL --from-file override_request.json
 
+    python scripts/apply_override.py AAPL --from-file override_request.json \\
+        --cache data/processed/latest_scores.pkl
+
 Author: Stock Analysis Framework v2.0
 """
 
 import argparse
-import json
+import bisect
+import functools
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import orjson
 
-# Add project root to path
+# Add project root to path (skipped when already importable, e.g. under pytest)
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
-from models.composite import CompositeScore, Recommendation
-from overrides import (
-    ConvictionLevel,
-    OverrideDocumentation,
-    OverrideLogger,
-    OverrideManager,
-    OverrideRequest,
-    OverrideType,
-    OverrideValidationError,
-    SentimentOverride,
-    WeightOverride,
-)
-
-
-def load_latest_scores(scores_path: Path) -> list:
+_src_path = str(project_root / "src")
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
+
+# Model and override imports are deferred to the functions that use them so
+# --help and argument errors exit without loading the scoring packages.
+if TYPE_CHECKING:
+    from models.composite import CompositeScore
+    from overrides import OverrideRequest
+
+from utils.cache import read_cache, write_cache
+
+
+def _load_json(path) -> dict:
+    """Read and parse a JSON file with orjson.
+
+    orjson only parses bytes/str, so the file is read in one go rather
+    than streamed through json.load.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+# Bump when CompositeScore or the JSON-to-score mapping changes, so sidecars
+# pickled by older code are re-parsed instead of loading stale objects
+SCORES_CACHE_VERSION = 1
+
+
+def load_latest_scores(scores_path: Path, cache_path: Optional[Path] = None) -> list:
     """Load latest composite scores from JSON file.
 
+    With ``cache_path`` set, parsed scores are memoized in that pickle file,
+    keyed on SCORES_CACHE_VERSION and the JSON file's mtime and size, so
+    repeated override runs against the same scoring output skip JSON parsing.
+
     Args:
         scores_path: Path to latest_scores.json
+        cache_path: Optional pickle file caching the parsed scores. None
+                    always parses the JSON and writes no cache.
 
     Returns:
-        List of CompositeScore objects
+        List of CompositeScore objects. Stocks persisted without a
+        composite score ('INSUFFICIENT DATA') are skipped.
     """
-    with open(scores_path, 'r') as f:
-        data = json.load(f)
+    scores_path = Path(scores_path)
+    stat = scores_path.stat()
+    source_key = (SCORES_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+    if cache_path is not None:
+        cached = read_cache(cache_path, source_key)
+        if cached is not None:
+            return cached
+
+    from models.composite import CompositeScore, Recommendation
 
-    scores = []
-    for s in data['scores']:
-        scores.append(CompositeScore(
+    data = _load_json(scores_path)
+
+    # Map values to members once instead of calling Recommendation(...) per row
+    rec_map = {r.value: r for r in Recommendation}
+
+    scores = [
+        CompositeScore(
             ticker=s['ticker'],
             fundamental_score=s['fundamental_score'],
             technical_score=s['technical_score'],
             sentiment_score=s['sentiment_score'],
             composite_score=s['composite_score'],
             composite_percentile=s['composite_percentile'],
-            recommendation=Recommendation(s['recommendation']),
-        ))
+            recommendation=rec_map[s['recommendation']],
+        )
+        for s in data['scores']
+        if s['recommendation'] in rec_map
+    ]
+
+    if cache_path is not None:
+        write_cache(cache_path, source_key, scores)
     return scores
 
 
-def build_request_from_args(args) -> OverrideRequest:
+def index_by_ticker(scores: list) -> Tuple[list, Callable[[str], Optional['CompositeScore']]]:
+    """Sort scores by ticker once and return a bisect-based lookup.
+
+    Batch callers that resolve many tickers against one loaded universe
+    share a single sorted ticker list instead of building per-call indexes.
+
+    Args:
+        scores: List of CompositeScore objects (e.g. from load_latest_scores)
+
+    Returns:
+        (sorted_scores, find) where find(ticker) returns the matching
+        CompositeScore or None.
+    """
+    sorted_scores = sorted(scores, key=lambda s: s.ticker)
+    tickers = [s.ticker for s in sorted_scores]
+
+    def find(ticker: str) -> Optional['CompositeScore']:
+        i = bisect.bisect_left(tickers, ticker)
+        if i < len(tickers) and tickers[i] == ticker:
+            return sorted_scores[i]
+        return None
+
+    return sorted_scores, find
+
+
+def build_request_from_args(args) -> 'OverrideRequest':
     """Build an OverrideRequest from CLI arguments.
 
     Args:
@@ -86,13 +161,23 @@ def build_request_from_args(args) -> OverrideRequest:
     Returns:
         OverrideRequest object
     """
-    # Determine override type
-    has_weight = (
-        args.weight_fundamental is not None or
-        args.weight_technical is not None or
-        args.weight_sentiment is not None
+    from overrides import (
+        ConvictionLevel,
+        OverrideDocumentation,
+        OverrideRequest,
+        OverrideType,
+        SentimentOverride,
+        WeightOverride,
     )
-    has_sentiment = args.sentiment_adjustment is not None
+
+    fund_w = args.weight_fundamental
+    tech_w = args.weight_technical
+    sent_w = args.weight_sentiment
+    sentiment_adjustment = args.sentiment_adjustment
+
+    # Determine override type
+    has_weight = fund_w is not None or tech_w is not None or sent_w is not None
+    has_sentiment = sentiment_adjustment is not None
 
     if has_weight and has_sentiment:
         override_type = OverrideType.BOTH
@@ -107,27 +192,27 @@ def build_request_from_args(args) -> OverrideRequest:
     weight_override = None
     if has_weight:
         # Default to base weights for any not specified
-        fund_w = args.weight_fundamental if args.weight_fundamental is not None else 0.45
-        tech_w = args.weight_technical if args.weight_technical is not None else 0.35
-        sent_w = args.weight_sentiment if args.weight_sentiment is not None else 0.20
-        weight_override = WeightOverride(fund_w, tech_w, sent_w)
+        weight_override = WeightOverride(
+            fund_w if fund_w is not None else 0.45,
+            tech_w if tech_w is not None else 0.35,
+            sent_w if sent_w is not None else 0.20,
+        )
 
     # Build sentiment override
     sentiment_override = None
     if has_sentiment:
-        sentiment_override = SentimentOverride(adjustment=args.sentiment_adjustment)
+        sentiment_override = SentimentOverride(adjustment=sentiment_adjustment)
 
     # Build documentation
     documentation = None
     if override_type != OverrideType.NONE:
-        conviction = ConvictionLevel(args.conviction)
-        evidence = list(args.evidence) if args.evidence else None
+        # nargs="+" already yields a fresh list (or None), so no copy is needed
         documentation = OverrideDocumentation(
             what_model_misses=args.what_model_misses or "",
             why_view_more_accurate=args.why_accurate or "",
             what_proves_wrong=args.what_proves_wrong or "",
-            conviction=conviction,
-            evidence_pieces=evidence,
+            conviction=ConvictionLevel(args.conviction),
+            evidence_pieces=args.evidence,
         )
 
     return OverrideRequest(
@@ -139,7 +224,7 @@ def build_request_from_args(args) -> OverrideRequest:
     )
 
 
-def build_request_from_file(ticker: str, file_path: str) -> OverrideRequest:
+def build_request_from_file(ticker: str, file_path: str) -> 'OverrideRequest':
     """Build an OverrideRequest from a JSON file.
 
     Args:
@@ -149,8 +234,16 @@ def build_request_from_file(ticker: str, file_path: str) -> OverrideRequest:
     Returns:
         OverrideRequest object
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    from overrides import (
+        ConvictionLevel,
+        OverrideDocumentation,
+        OverrideRequest,
+        OverrideType,
+        SentimentOverride,
+        WeightOverride,
+    )
+
+    data = _load_json(file_path)
 
     override_type = OverrideType(data['override_type'])
 
@@ -184,57 +277,90 @@ def build_request_from_file(ticker: str, file_path: str) -> OverrideRequest:
     )
 
 
+# display_result templates, built once at import
+_RULE = "=" * 80
+_TABLE_HEADER = f"\n{'':4s}{'Metric':<25s} {'Before':>10s} {'After':>10s} {'Change':>10s}"
+_TABLE_DIVIDER = f"{'':4s}{'-'*55}"
+_NUMERIC_ROW_TMPL = "    {name:<25s} {before:>10.1f} {after:>10.1f} {change:>+10.1f}"
+_TEXT_ROW_TMPL = "    {name:<25s} {before:>10s} {after:>10s}"
+_WEIGHT_ROW_TMPL = "      {pillar}: {before:.0%} -> {after:.0%}"
+
+
 def display_result(result) -> None:
-    """Display override result with before/after comparison."""
-    print()
-    print("=" * 80)
-    print(f"OVERRIDE RESULT: {result.ticker}")
-    print("=" * 80)
+    """Display override result with before/after comparison.
 
-    print(f"\n{'':4s}{'Metric':<25s} {'Before':>10s} {'After':>10s} {'Change':>10s}")
-    print(f"{'':4s}{'-'*55}")
+    Lines are collected and written to stdout in a single call.
+    """
+    # OverrideResult stores recommendation values as plain strings; resolve
+    # them once (accepting Recommendation members too) for both uses below.
+    base_rec = getattr(result.base_recommendation, 'value', result.base_recommendation)
+    final_rec = getattr(result.final_recommendation, 'value', result.final_recommendation)
+
+    lines = [
+        "",
+        _RULE,
+        f"OVERRIDE RESULT: {result.ticker}",
+        _RULE,
+        _TABLE_HEADER,
+        _TABLE_DIVIDER,
+    ]
 
     # Composite score
-    comp_change = result.final_composite_score - result.base_composite_score
-    print(f"{'':4s}{'Composite Score':<25s} {result.base_composite_score:>10.1f} "
-          f"{result.final_composite_score:>10.1f} {comp_change:>+10.1f}")
+    lines.append(_NUMERIC_ROW_TMPL.format_map({
+        'name': 'Composite Score',
+        'before': result.base_composite_score,
+        'after': result.final_composite_score,
+        'change': result.final_composite_score - result.base_composite_score,
+    }))
 
     # Percentile
-    print(f"{'':4s}{'Composite Percentile':<25s} {result.base_composite_percentile:>10.1f} "
-          f"{result.final_composite_percentile:>10.1f} {result.percentile_impact:>+10.1f}")
+    lines.append(_NUMERIC_ROW_TMPL.format_map({
+        'name': 'Composite Percentile',
+        'before': result.base_composite_percentile,
+        'after': result.final_composite_percentile,
+        'change': result.percentile_impact,
+    }))
 
     # Recommendation
-    print(f"{'':4s}{'Recommendation':<25s} {result.base_recommendation:>10s} "
-          f"{result.final_recommendation:>10s}")
+    lines.append(_TEXT_ROW_TMPL.format_map({
+        'name': 'Recommendation',
+        'before': base_rec,
+        'after': final_rec,
+    }))
 
     if result.adjusted_weights:
-        print(f"\n    Adjusted Weights:")
+        lines.append(f"\n    Adjusted Weights:")
         for pillar, w in result.adjusted_weights.items():
-            base_w = result.base_weights[pillar]
-            print(f"{'':6s}{pillar.capitalize()}: {base_w:.0%} -> {w:.0%}")
+            lines.append(_WEIGHT_ROW_TMPL.format_map({
+                'pillar': pillar.capitalize(),
+                'before': result.base_weights[pillar],
+                'after': w,
+            }))
 
     if result.adjusted_sentiment is not None:
-        print(f"\n    Adjusted Sentiment: {result.base_sentiment_score:.1f} -> "
-              f"{result.adjusted_sentiment:.1f}")
+        lines.append(f"\n    Adjusted Sentiment: {result.base_sentiment_score:.1f} -> "
+                     f"{result.adjusted_sentiment:.1f}")
 
     # Warnings
     if result.guardrail_violations:
-        print(f"\n    GUARDRAIL VIOLATIONS:")
+        lines.append(f"\n    GUARDRAIL VIOLATIONS:")
         for v in result.guardrail_violations:
-            print(f"      [!] {v}")
+            lines.append(f"      [!] {v}")
 
     if result.extreme_override:
-        print(f"\n    [!] EXTREME OVERRIDE: >15 percentile point change")
+        lines.append(f"\n    [!] EXTREME OVERRIDE: >15 percentile point change")
 
     if result.recommendation_changed:
-        print(f"\n    [*] Recommendation changed: {result.base_recommendation} -> "
-              f"{result.final_recommendation}")
+        lines.append(f"\n    [*] Recommendation changed: {base_rec} -> {final_rec}")
 
-    print()
-    print("=" * 80)
+    lines.append("")
+    lines.append(_RULE)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full CLI parser (cached for repeated in-process calls)."""
     parser = argparse.ArgumentParser(
         description="Apply override to stock score (Framework Section 6)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -269,7 +395,50 @@ def main():
     parser.add_argument("--from-file", type=str,
                         help="Load override request from JSON file")
 
-    args = parser.parse_args()
+    parser.add_argument("--cache", type=Path, default=None, metavar="PATH",
+                        help="Pickle file caching the parsed latest scores "
+                             "(default: no cache)")
+
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments.
+
+    ``TICKER --from-file PATH [--cache PATH]`` is recognised by a pre-parser
+    so file mode never builds the full flag set. Anything else (help,
+    flag-based overrides, extra or invalid arguments) goes through the
+    full parser.
+
+    Args:
+        argv: Argument list. Defaults to sys.argv[1:].
+
+    Returns:
+        Parsed argparse namespace
+    """
+    pre = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+    pre.add_argument("ticker", nargs="?")
+    pre.add_argument("--from-file", type=str)
+    pre.add_argument("--cache", type=Path)
+    try:
+        known, extra = pre.parse_known_args(argv)
+    except argparse.ArgumentError:
+        # Let the full parser report the error with proper usage text
+        return _build_parser().parse_args(argv)
+    if known.ticker and known.from_file and not extra:
+        return known
+    return _build_parser().parse_args(argv)
+
+
+def main():
+    args = parse_args()
+
+    from overrides import (
+        OverrideLogger,
+        OverrideManager,
+        OverrideType,
+        OverrideValidationError,
+    )
 
     # Load latest scores
     scores_path = project_root / 'data' / 'processed' / 'latest_scores.json'
@@ -278,20 +447,17 @@ def main():
         print("Run 'python scripts/calculate_scores.py' first to generate base scores.")
         sys.exit(1)
 
-    universe = load_latest_scores(scores_path)
+    universe = load_latest_scores(scores_path, cache_path=args.cache)
     print(f"Loaded {len(universe)} stocks from latest scores")
 
     # Find target stock
+    sorted_universe, find_score = index_by_ticker(universe)
     ticker = args.ticker.upper()
-    target = None
-    for score in universe:
-        if score.ticker == ticker:
-            target = score
-            break
+    target = find_score(ticker)
 
     if target is None:
         print(f"ERROR: Ticker {ticker} not found in latest scores")
-        print(f"Available tickers: {', '.join(s.ticker for s in universe)}")
+        print(f"Available tickers: {', '.join(s.ticker for s in sorted_universe)}")
         sys.exit(1)
 
     # Display base score (Model-First principle)
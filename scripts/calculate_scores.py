@@ -3,30 +3,54 @@ Calculate Complete Composite Scores (thin wrapper around ScoringPipeline).
 
 Usage:
     python scripts/calculate_scores.py
+    python scripts/calculate_scores.py --workers 4
+    python scripts/calculate_scores.py --cache data/cache/scores.pkl
 
 Framework Reference: Section 1.3, Section 7
 """
 
+import argparse
 import sys
 from pathlib import Path
 
-# Add project root to path
+import numpy as np
+
+# Add project root to path (skipped when already importable, e.g. under pytest)
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+_src_path = str(project_root / "src")
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
 
 from database import get_db_session
 from models.composite import Recommendation
 from scoring import ScoringPipeline
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Calculate composite scores")
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Worker processes for per-stock technical scoring '
+             '(default: score in-process)',
+    )
+    parser.add_argument(
+        '--cache', type=Path, default=None, metavar='PATH',
+        help='Pickle file caching the last scores; a rerun on unchanged '
+             'data and weights skips the calculators (default: no cache)',
+    )
+    return parser.parse_args()
+
+
 def main():
     """Run the full scoring pipeline with detailed output."""
+    args = parse_args()
+
     print("=" * 100)
     print("COMPOSITE SCORE CALCULATION")
     print("=" * 100)
     print()
 
-    pipeline = ScoringPipeline(verbose=True)
+    pipeline = ScoringPipeline(verbose=True, workers=args.workers, cache_path=args.cache)
 
     with get_db_session() as session:
         # Run the pipeline
@@ -44,38 +68,57 @@ def main():
         print("\n" + "=" * 120)
         print("DETAILED SCORE BREAKDOWN")
         print("=" * 120)
-        for cr in result.composite_results:
-            pillars = result.pillar_scores[cr.ticker]
-            print(f"\n{cr.ticker} - {cr.recommendation.value}")
-            print(f"  Fundamental: {pillars['fundamental']:6.2f}")
-            print(f"  Technical:   {pillars['technical']:6.2f}")
-            print(f"  Sentiment:   {pillars['sentiment']:6.2f}")
-            print(f"  --------------------")
-            print(f"  Composite:   {cr.composite_score:6.2f} "
-                  f"(Percentile: {cr.composite_percentile:.1f})")
+        # Flatten each stock's row once, aligned with composite_results order
+        # (CompositeScore already carries the pillar scores it was built from)
+        score_rows = [
+            (cr.ticker, cr.recommendation.value, cr.fundamental_score,
+             cr.technical_score, cr.sentiment_score, cr.composite_score,
+             cr.composite_percentile)
+            for cr in result.composite_results
+        ]
+        lines = []
+        for ticker, rec, fund, tech, sent, composite, percentile in score_rows:
+            lines.append(
+                f"\n{ticker} - {rec}\n"
+                f"  Fundamental: {fund:6.2f}\n"
+                f"  Technical:   {tech:6.2f}\n"
+                f"  Sentiment:   {sent:6.2f}\n"
+                f"  --------------------\n"
+                f"  Composite:   {composite:6.2f} (Percentile: {percentile:.1f})"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Validation summary
-        print("\n" + "=" * 120)
-        print("VALIDATION SUMMARY")
-        print("=" * 120)
-
-        percentiles = [r.composite_percentile for r in result.composite_results]
-        print(f"\nComposite Percentile Distribution:")
-        print(f"  Min:    {min(percentiles):6.2f}")
-        print(f"  25th:   {sorted(percentiles)[len(percentiles)//4]:6.2f}")
-        print(f"  Median: {sorted(percentiles)[len(percentiles)//2]:6.2f}")
-        print(f"  75th:   {sorted(percentiles)[3*len(percentiles)//4]:6.2f}")
-        print(f"  Max:    {max(percentiles):6.2f}")
-
-        print(f"\nRecommendation Distribution:")
-        for rec in Recommendation:
-            count = sum(1 for r in result.composite_results if r.recommendation == rec)
-            pct = count / len(result.composite_results) * 100
-            print(f"  {rec.value:12s}: {count:2d} stocks ({pct:5.1f}%)")
-
-        print("\n" + "=" * 120)
-        print("[OK] SCORING COMPLETE")
-        print("=" * 120)
+        arrays = result.as_arrays()
+        p_min, p_25, p_50, p_75, p_max = np.percentile(
+            arrays['composite_percentile'], [0, 25, 50, 75, 100]
+        )
+        rec_counts = Recommendation.counts(
+            [cr.recommendation for cr in result.composite_results]
+        )
+        n_scored = len(result.composite_results)
+
+        lines = [
+            "\n" + "=" * 120,
+            "VALIDATION SUMMARY",
+            "=" * 120,
+            "\nComposite Percentile Distribution:",
+            f"  Min:    {p_min:6.2f}",
+            f"  25th:   {p_25:6.2f}",
+            f"  Median: {p_50:6.2f}",
+            f"  75th:   {p_75:6.2f}",
+            f"  Max:    {p_max:6.2f}",
+            "\nRecommendation Distribution:",
+        ]
+        for rec, count in rec_counts.items():
+            pct = count / n_scored * 100
+            lines.append(f"  {rec.value:12s}: {count:2d} stocks ({pct:5.1f}%)")
+        lines += [
+            "\n" + "=" * 120,
+            "[OK] SCORING COMPLETE",
+            "=" * 120,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Persist results
         pipeline.persist_to_db(session, result)
@@ -14,24 +14,28 @@ Technical indicators calculated:
 
 Usage:
     python scripts/calculate_technical_indicators.py
+    python scripts/calculate_technical_indicators.py --workers 4
 """
 
 import argparse
+import hashlib
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 from datetime import datetime, timedelta
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
-from sqlalchemy import select, text
+from sqlalchemy import func, select, text
 from sqlalchemy.dialects.postgresql import insert
 
 from database import get_db_session
 from database.models import Stock, PriceData, TechnicalIndicator
+from utils.cache import read_cache, write_cache
 
 # Configure logging
 logging.basicConfig(
@@ -39,6 +43,28 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# Keep SQLAlchemy's statement echo out of the run log
+logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+
+# Bump when the indicator math changes so cached records are recomputed
+INDICATOR_CACHE_VERSION = 1
+
+
+def _indicator_upsert():
+    """INSERT ... ON CONFLICT (ticker, calculation_date) DO UPDATE for indicators."""
+    stmt = insert(TechnicalIndicator)
+    return stmt.on_conflict_do_update(
+        index_elements=['ticker', 'calculation_date'],
+        set_={
+            column: stmt.excluded[column]
+            for column in (
+                'sma_20', 'sma_50', 'sma_200', 'mad',
+                'momentum_12_1', 'momentum_6m', 'momentum_3m', 'momentum_1m',
+                'rsi_14', 'avg_volume_20d', 'avg_volume_90d', 'relative_volume',
+                'price_vs_200ma', 'adx', 'sector_relative_6m',
+            )
+        },
+    )
 
 
 class TechnicalIndicatorCalculator:
@@ -49,7 +75,37 @@ class TechnicalIndicatorCalculator:
     momentum and trend analysis.
     """
 
-    def __init__(self):
+    # Below this many stocks, process start-up costs more than it saves
+    PARALLEL_MIN_STOCKS = 200
+
+    # Upsert on (ticker, calculation_date). A Core insert() rather than
+    # text(): executemany then goes through SQLAlchemy's insertmanyvalues,
+    # which sends pages of rows as multi-row VALUES statements (the
+    # equivalent of psycopg2's execute_values) instead of one row at a time.
+    _UPSERT_SQL = _indicator_upsert()
+
+    _SECTOR_RELATIVE_UPDATE_SQL = text("""
+        UPDATE technical_indicators
+        SET sector_relative_6m = :relative
+        WHERE ticker = :ticker
+    """)
+
+    # Most recent price rows loaded per ticker. The longest lookback is the
+    # 12-1 month momentum (252 trading days before the latest row, so 253
+    # rows); Wilder's RSI average has long converged within this window.
+    PRICE_HISTORY_ROWS = 260
+
+    def __init__(self, workers: Optional[int] = None, cache_path: Optional[Path] = None):
+        """
+        Args:
+            workers: Number of worker processes for indicator calculation.
+                     None or 1 calculates in-process.
+            cache_path: Optional pickle file memoizing each ticker's latest
+                        indicators by price-history fingerprint. None
+                        disables caching.
+        """
+        self.workers = workers
+        self.cache_path = Path(cache_path) if cache_path is not None else None
         self.stats = {
             'stocks_processed': 0,
             'indicators_calculated': 0,
@@ -63,153 +119,381 @@ class TechnicalIndicatorCalculator:
             stmt = select(Stock.ticker).where(Stock.is_active == True)
             result = session.execute(stmt)
             tickers = [row[0] for row in result]
-            logger.info(f"Found {len(tickers)} active stocks")
+            logger.info("Found %d active stocks", len(tickers))
             return tickers
 
-    def get_price_data(self, ticker: str) -> pd.DataFrame:
+    def get_price_data(self, tickers: List[str]) -> pd.DataFrame:
         """
-        Fetch price history for a ticker.
+        Fetch recent price history for all tickers in one query.
+
+        Only the latest PRICE_HISTORY_ROWS rows per ticker are loaded, which
+        covers every indicator's lookback regardless of how long the stored
+        history is.
 
         Args:
-            ticker: Stock ticker symbol
+            tickers: Stock ticker symbols
 
         Returns:
-            DataFrame with price history sorted by date
+            DataFrame with ticker, date and OHLCV columns, sorted by
+            ticker then date. Tickers without price data have no rows.
         """
         with get_db_session() as session:
-            stmt = select(PriceData).where(
-                PriceData.ticker == ticker
-            ).order_by(PriceData.date)
+            ranked = select(
+                PriceData.ticker, PriceData.date, PriceData.open, PriceData.high,
+                PriceData.low, PriceData.close, PriceData.volume,
+                func.row_number().over(
+                    partition_by=PriceData.ticker,
+                    order_by=PriceData.date.desc(),
+                ).label('rn'),
+            ).where(
+                PriceData.ticker.in_(tickers)
+            ).subquery()
+
+            stmt = select(
+                ranked.c.ticker, ranked.c.date, ranked.c.open, ranked.c.high,
+                ranked.c.low, ranked.c.close, ranked.c.volume,
+            ).where(
+                ranked.c.rn <= self.PRICE_HISTORY_ROWS
+            ).order_by(ranked.c.ticker, ranked.c.date)
+
+            rows = session.execute(stmt).all()
+
+        # Build one frame and cast each column once instead of per cell
+        prices = pd.DataFrame(
+            rows, columns=['ticker', 'date', 'open', 'high', 'low', 'close', 'volume']
+        ).astype({
+            'open': 'float64', 'high': 'float64', 'low': 'float64',
+            'close': 'float64', 'volume': 'float64',
+        })
+        prices['date'] = pd.to_datetime(prices['date'])
 
-            result = session.execute(stmt)
-            rows = result.scalars().all()
+        logger.info(
+            "Loaded %d price records for %d stocks",
+            len(prices), prices['ticker'].nunique(),
+        )
+        return prices
 
-            if not rows:
-                logger.warning(f"No price data found for {ticker}")
-                return pd.DataFrame()
-
-            # Convert to DataFrame
-            data = {
-                'date': [row.date for row in rows],
-                'open': [float(row.open) if row.open else None for row in rows],
-                'high': [float(row.high) if row.high else None for row in rows],
-                'low': [float(row.low) if row.low else None for row in rows],
-                'close': [float(row.close) if row.close else None for row in rows],
-                'volume': [int(row.volume) if row.volume else None for row in rows],
-            }
-
-            df = pd.DataFrame(data)
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
-            df = df.set_index('date')
-
-            logger.info(f"Loaded {len(df)} price records for {ticker}")
-            return df
-
-    def calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
+    @staticmethod
+    def _window_sums(
+        values: np.ndarray, window_ends: np.ndarray, windows: Tuple[int, ...]
+    ) -> np.ndarray:
         """
-        Calculate RSI (Relative Strength Index).
+        Sum of values[end - window:end] for every window and end offset.
+
+        All windows are summed in a single reduceat call over `values`
+        (1-D, or 2-D with one column per series).
+
+        Returns:
+            Array of shape (len(windows), len(window_ends), ...)
+        """
+        window_ends = np.tile(window_ends, len(windows))
+        bounds = np.empty(2 * len(window_ends), dtype=np.intp)
+        bounds[0::2] = np.maximum(
+            window_ends - np.repeat(windows, len(window_ends) // len(windows)), 0
+        )
+        bounds[1::2] = window_ends
+        # Pad so an end offset equal to len(values) is a valid reduceat index
+        padded = np.concatenate([values, np.zeros((1,) + values.shape[1:])])
+        sums = np.add.reduceat(padded, bounds, axis=0)[0::2]
+        return sums.reshape((len(windows), -1) + values.shape[1:])
+
+    @classmethod
+    def _latest_window_means(
+        cls, values: np.ndarray, ends: np.ndarray, lengths: np.ndarray,
+        windows: Tuple[int, ...],
+    ) -> List[np.ndarray]:
+        """
+        Mean of each ticker's last `window` values, for each window.
+
+        Equivalent to the final value of rolling(window, min_periods=window).mean()
+        (NaN when the history is shorter or the window holds a NaN), but only
+        the one window that gets stored is summed, and all windows over the
+        same column share one pass.
+
+        Args:
+            values: Column values, grouped contiguously by ticker
+            ends: Exclusive end offset of each ticker's rows
+            lengths: Number of rows per ticker
+            windows: Window lengths
+
+        Returns:
+            One array per window with one mean per ticker
+        """
+        sums = cls._window_sums(values, ends, windows)
+        means = []
+        for window, window_sums in zip(windows, sums):
+            window_means = window_sums / window
+            window_means[lengths < window] = np.nan
+            means.append(window_means)
+        return means
+
+    def _wilder_averages(
+        self, values: np.ndarray, ends: np.ndarray, lengths: np.ndarray, period: int,
+    ) -> np.ndarray:
+        """
+        Latest Wilder-smoothed average of each column of `values` per ticker.
+
+        Seeded with the simple mean of the first `period` values after each
+        ticker's first row, then avg = avg + (value - avg) / period, which is
+        an adjust=False EWM with alpha = 1 / period. All columns share the
+        position/seed bookkeeping and one grouped EWM pass.
+
+        Returns:
+            Array of shape (number of tickers, number of columns)
+        """
+        starts = ends - lengths
+        position = np.arange(len(values)) - np.repeat(starts, lengths)
+        seeded = values.copy()
+        seeded[position < period] = np.nan
+
+        has_seed = lengths > period
+        seed_rows = starts[has_seed] + period
+        seeded[seed_rows] = self._window_sums(values, seed_rows + 1, (period,))[0] / period
+
+        groups = np.repeat(np.arange(len(ends)), lengths)
+        smoothed = pd.DataFrame(seeded).groupby(groups, sort=False).ewm(
+            alpha=1 / period, adjust=False
+        ).mean().to_numpy()
+        return smoothed[ends - 1]
+
+    def calculate_rsi(
+        self, prices: np.ndarray, ends: np.ndarray, lengths: np.ndarray,
+        period: int = 14,
+    ) -> np.ndarray:
+        """
+        Calculate the latest RSI (Relative Strength Index) for every ticker.
+
+        Uses Wilder's smoothing of average gain and loss, as in Wilder's
+        original definition and common charting packages.
 
         Args:
-            prices: Series of closing prices
+            prices: Closing prices, grouped contiguously by ticker
+            ends: Exclusive end offset of each ticker's rows
+            lengths: Number of rows per ticker
             period: RSI period (default: 14)
 
         Returns:
-            Series of RSI values
+            Array with one RSI value per ticker (NaN if fewer than
+            period + 1 prices)
         """
-        # Calculate price changes
-        delta = prices.diff()
+        # Calculate price changes (never across ticker boundaries)
+        delta = np.empty_like(prices)
+        delta[0] = np.nan
+        np.subtract(prices[1:], prices[:-1], out=delta[1:])
+        delta[ends[:-1]] = np.nan
 
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        # Separate gains and losses (one column each)
+        changes = np.column_stack((np.maximum(delta, 0), np.maximum(-delta, 0)))
 
-        # Calculate average gain and loss
-        avg_gain = gain.rolling(window=period, min_periods=period).mean()
-        avg_loss = loss.rolling(window=period, min_periods=period).mean()
+        # Calculate average gain and loss together
+        avg_gain, avg_loss = self._wilder_averages(changes, ends, lengths, period).T
 
         # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = avg_gain / avg_loss
+            rsi = 100 - (100 / (1 + rs))
 
         return rsi
 
-    def calculate_returns(self, prices: pd.Series) -> Dict[str, pd.Series]:
+    @staticmethod
+    def _lagged(
+        values: np.ndarray, ends: np.ndarray, lengths: np.ndarray, lag: int
+    ) -> np.ndarray:
+        """Each ticker's value `lag` rows before its latest row (NaN if too short)."""
+        has_lag = lengths > lag
+        lagged = np.full(len(ends), np.nan)
+        lagged[has_lag] = values[ends[has_lag] - 1 - lag]
+        return lagged
+
+    def calculate_returns(
+        self, prices: np.ndarray, ends: np.ndarray, lengths: np.ndarray
+    ) -> Dict[str, np.ndarray]:
         """
-        Calculate various return periods.
+        Calculate the latest value of various return periods.
 
         Framework Section 4.2: Return calculations for momentum scoring
 
+        Only the latest return is stored, so each one is read directly from
+        the prices at the required lags rather than via full-length
+        pct_change/shift series.
+
         Args:
-            prices: Series of closing prices
+            prices: Closing prices, grouped contiguously by ticker
+            ends: Exclusive end offset of each ticker's rows
+            lengths: Number of rows per ticker
 
         Returns:
-            Dict with return series for different periods
+            Dict with one latest return per ticker for different periods
         """
         returns = {}
+        current = prices[ends - 1]
 
-        # 1-month return (21 trading days)
-        returns['return_1_month'] = prices.pct_change(periods=21)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 1-month return (21 trading days)
+            prices_1m_ago = self._lagged(prices, ends, lengths, 21)
+            returns['return_1_month'] = current / prices_1m_ago - 1
 
-        # 3-month return (63 trading days)
-        returns['return_3_month'] = prices.pct_change(periods=63)
+            # 3-month return (63 trading days)
+            returns['return_3_month'] = current / self._lagged(prices, ends, lengths, 63) - 1
 
-        # 6-month return (126 trading days)
-        returns['return_6_month'] = prices.pct_change(periods=126)
+            # 6-month return (126 trading days)
+            returns['return_6_month'] = current / self._lagged(prices, ends, lengths, 126) - 1
 
-        # 12-1 month momentum return
-        # Framework Section 4.2: 12 months ago to 1 month ago (excludes recent month)
-        # This is: return from 252 days ago to 21 days ago
-        prices_12m_ago = prices.shift(252)  # 12 months ago
-        prices_1m_ago = prices.shift(21)    # 1 month ago
-        returns['return_12_1_month'] = (prices_1m_ago - prices_12m_ago) / prices_12m_ago
+            # 12-1 month momentum return
+            # Framework Section 4.2: 12 months ago to 1 month ago (excludes recent month)
+            # This is: return from 252 days ago to 21 days ago
+            prices_12m_ago = self._lagged(prices, ends, lengths, 252)
+            returns['return_12_1_month'] = (prices_1m_ago - prices_12m_ago) / prices_12m_ago
 
         return returns
 
-    def calculate_indicators_for_stock(self, ticker: str) -> List[Dict]:
+    def calculate_indicators(self, prices: pd.DataFrame) -> List[Dict]:
         """
-        Calculate all technical indicators for a stock.
+        Calculate all technical indicators for every ticker in one pass.
+
+        The close and volume columns are taken once as contiguous float64
+        arrays (rows grouped by ticker) and every indicator reads those
+        arrays via per-ticker end offsets, instead of running once per ticker.
 
         Args:
-            ticker: Stock ticker symbol
+            prices: Price history from get_price_data()
 
         Returns:
-            List of dicts with indicator data for each date
+            List of dicts with the latest indicator data for each ticker
         """
-        logger.info(f"Calculating indicators for {ticker}")
-
-        # Get price data
-        df = self.get_price_data(ticker)
-        if df.empty:
-            logger.warning(f"No price data for {ticker}, skipping")
+        if prices.empty:
             return []
 
-        # Calculate moving averages
-        df['ma_20'] = df['close'].rolling(window=20, min_periods=20).mean()
-        df['ma_50'] = df['close'].rolling(window=50, min_periods=50).mean()
-        df['ma_200'] = df['close'].rolling(window=200, min_periods=200).mean()
+        df = prices
+        # Rows are contiguous per ticker; only the latest row of each is stored
+        lengths = df.groupby('ticker', sort=False).size().to_numpy()
+        ends = np.cumsum(lengths)
+
+        # Only the most recent record (latest date) per ticker is stored, so
+        # every indicator below is a single value per ticker, never a
+        # full-length column
+        latest = df[['ticker', 'date', 'close']].iloc[ends - 1].copy()
+
+        close_values = df['close'].to_numpy(dtype=np.float64)
+        volume_values = df['volume'].to_numpy(dtype=np.float64)
+
+        # Calculate RSI
+        latest['rsi'] = self.calculate_rsi(close_values, ends, lengths, period=14)
+
+        # Calculate returns
+        returns = self.calculate_returns(close_values, ends, lengths)
+        for return_name, return_values in returns.items():
+            latest[return_name] = return_values
+
+        # Calculate moving averages and volume averages (latest window only)
+        latest['ma_20'], latest['ma_50'], latest['ma_200'] = self._latest_window_means(
+            close_values, ends, lengths, (20, 50, 200)
+        )
+        latest['avg_volume_20d'], latest['avg_volume_90d'] = self._latest_window_means(
+            volume_values, ends, lengths, (20, 90)
+        )
 
         # Calculate MAD (Moving Average Distance)
         # Framework Section 4.2: MAD = (50-day MA - 200-day MA) / 200-day MA
-        df['mad'] = (df['ma_50'] - df['ma_200']) / df['ma_200']
+        latest['mad'] = (latest['ma_50'] - latest['ma_200']) / latest['ma_200']
+
+        # Plain dicts per ticker; no per-row Series construction
+        return [self._indicator_record(row) for row in latest.to_dict('records')]
+
+    @staticmethod
+    def _price_fingerprints(prices: pd.DataFrame) -> Dict[str, bytes]:
+        """Digest of each ticker's dates, closes and volumes."""
+        lengths = prices.groupby('ticker', sort=False).size()
+        ends = np.cumsum(lengths.to_numpy())
+        columns = [prices[col].to_numpy() for col in ('date', 'close', 'volume')]
+
+        fingerprints = {}
+        for ticker, end, length in zip(lengths.index, ends, lengths.to_numpy()):
+            digest = hashlib.blake2b(digest_size=16)
+            for values in columns:
+                digest.update(values[end - length:end].tobytes())
+            fingerprints[ticker] = digest.digest()
+        return fingerprints
+
+    def _calculate_cached(self, prices: pd.DataFrame) -> List[Dict]:
+        """
+        Calculate indicators, reusing cached records for unchanged tickers.
 
-        # Calculate RSI
-        df['rsi'] = self.calculate_rsi(df['close'], period=14)
+        A ticker whose price history fingerprint matches the cache is not
+        recalculated; only changed or new tickers go through _calculate_all.
+        """
+        if self.cache_path is None:
+            return self._calculate_all(prices)
+
+        fingerprints = self._price_fingerprints(prices)
+        cached = read_cache(self.cache_path, INDICATOR_CACHE_VERSION) or {}
+        hits = {
+            ticker: dict(cached[ticker][1])
+            for ticker, fingerprint in fingerprints.items()
+            if ticker in cached and cached[ticker][0] == fingerprint
+        }
+        if hits:
+            logger.info("Price history unchanged for %d stocks; using cached indicators", len(hits))
+            prices = prices[~prices['ticker'].isin(hits.keys())]
+
+        indicators = list(hits.values())
+        if not prices.empty:
+            indicators.extend(self._calculate_all(prices))
+
+        # Keep entries for tickers outside this run (e.g. --ticker subsets)
+        cached.update(
+            (record['ticker'], (fingerprints[record['ticker']], record))
+            for record in indicators
+        )
+        write_cache(self.cache_path, INDICATOR_CACHE_VERSION, cached)
+        return indicators
 
-        # Calculate volume averages
-        df['avg_volume_20d'] = df['volume'].rolling(window=20, min_periods=20).mean()
-        df['avg_volume_90d'] = df['volume'].rolling(window=90, min_periods=90).mean()
+    def _calculate_all(self, prices: pd.DataFrame) -> List[Dict]:
+        """
+        Calculate indicators, splitting tickers across worker processes.
 
-        # Calculate returns
-        returns = self.calculate_returns(df['close'])
-        for return_name, return_series in returns.items():
-            df[return_name] = return_series
+        Each ticker's indicators depend only on its own rows, so with
+        ``workers`` > 1 and a large enough universe the frame is cut at
+        ticker boundaries into one contiguous block per worker.
+        """
+        lengths = prices.groupby('ticker', sort=False).size().to_numpy()
+        if (self.workers or 1) <= 1 or len(lengths) < self.PARALLEL_MIN_STOCKS:
+            return self.calculate_indicators(prices)
+
+        ends = np.cumsum(lengths)
+        bounds = [0] + [
+            int(ends[part[-1]])
+            for part in np.array_split(np.arange(len(ends)), self.workers)
+        ]
+        chunks = [prices.iloc[start:end] for start, end in zip(bounds, bounds[1:])]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return [
+                record
+                for chunk_result in pool.map(_calculate_chunk, chunks)
+                for record in chunk_result
+            ]
+
+    def _calculate_per_ticker(self, prices: pd.DataFrame) -> List[Dict]:
+        """
+        Calculate indicators one ticker at a time.
+
+        Fallback for when the whole-universe pass raises: tickers that fail
+        on their own are recorded in ``stats['errors']`` and skipped, so the
+        rest are still stored.
+        """
+        indicators = []
+        for ticker, group in prices.groupby('ticker', sort=False):
+            try:
+                indicators.extend(self.calculate_indicators(group))
+            except Exception as e:
+                logger.error("Error calculating indicators for %s: %s", ticker, e)
+                self.stats['errors'].append(f"{ticker}: {e}")
+        return indicators
 
-        # Only keep the most recent record (latest date)
-        # We calculate on full history to get accurate indicators,
-        # but only store the latest values
-        latest_date = df.index.max()
-        latest_row = df.loc[latest_date]
+    def _indicator_record(self, latest_row: Dict) -> Dict:
+        """Build the technical_indicators row for a ticker's latest values."""
+        ticker = latest_row['ticker']
 
         # Calculate relative volume
         relative_vol = None
@@ -218,7 +502,7 @@ class TechnicalIndicatorCalculator:
                 relative_vol = float(latest_row['avg_volume_20d'] / latest_row['avg_volume_90d'])
 
         # Calculate price vs 200-MA boolean
-        current_price = float(df['close'].iloc[-1]) if pd.notna(df['close'].iloc[-1]) else None
+        current_price = float(latest_row['close']) if pd.notna(latest_row['close']) else None
         price_vs_200ma = None
         if current_price and pd.notna(latest_row['ma_200']):
             price_vs_200ma = current_price > float(latest_row['ma_200'])
@@ -226,7 +510,7 @@ class TechnicalIndicatorCalculator:
         # Prepare record for database (using correct column names from database_schema.md)
         indicator_data = {
             'ticker': ticker,
-            'calculation_date': latest_date.date(),
+            'calculation_date': latest_row['date'].date(),
             'sma_20': float(latest_row['ma_20']) if pd.notna(latest_row['ma_20']) else None,
             'sma_50': float(latest_row['ma_50']) if pd.notna(latest_row['ma_50']) else None,
             'sma_200': float(latest_row['ma_200']) if pd.notna(latest_row['ma_200']) else None,
@@ -244,16 +528,17 @@ class TechnicalIndicatorCalculator:
             'sector_relative_6m': None,  # Will be calculated separately with sector data
         }
 
-        ma200_str = f"{indicator_data['sma_200']:.2f}" if indicator_data['sma_200'] else 'N/A'
-        rsi_str = f"{indicator_data['rsi_14']:.1f}" if indicator_data['rsi_14'] else 'N/A'
-        return_12_1_str = f"{indicator_data['momentum_12_1']:.2%}" if indicator_data['momentum_12_1'] else 'N/A'
+        if logger.isEnabledFor(logging.DEBUG):
+            ma200_str = f"{indicator_data['sma_200']:.2f}" if indicator_data['sma_200'] else 'N/A'
+            rsi_str = f"{indicator_data['rsi_14']:.1f}" if indicator_data['rsi_14'] else 'N/A'
+            return_12_1_str = f"{indicator_data['momentum_12_1']:.2%}" if indicator_data['momentum_12_1'] else 'N/A'
 
-        logger.info(
-            f"{ticker}: MA200={ma200_str}, RSI={rsi_str}, 12-1M Return={return_12_1_str}"
-        )
+            logger.debug(
+                "%s: MA200=%s, RSI=%s, 12-1M Return=%s",
+                ticker, ma200_str, rsi_str, return_12_1_str,
+            )
 
-        self.stats['indicators_calculated'] += 1
-        return [indicator_data]
+        return indicator_data
 
     def store_indicators(self, indicators: List[Dict]) -> None:
         """
@@ -269,49 +554,17 @@ class TechnicalIndicatorCalculator:
 
         with get_db_session() as session:
             try:
-                # Use raw SQL to insert since ORM model doesn't match database schema
-                for indicator in indicators:
-                    sql = text("""
-                        INSERT INTO technical_indicators (
-                            ticker, calculation_date, sma_20, sma_50, sma_200,
-                            mad, momentum_12_1, momentum_6m, momentum_3m, momentum_1m,
-                            rsi_14, avg_volume_20d, avg_volume_90d, relative_volume,
-                            price_vs_200ma, adx, sector_relative_6m
-                        ) VALUES (
-                            :ticker, :calculation_date, :sma_20, :sma_50, :sma_200,
-                            :mad, :momentum_12_1, :momentum_6m, :momentum_3m, :momentum_1m,
-                            :rsi_14, :avg_volume_20d, :avg_volume_90d, :relative_volume,
-                            :price_vs_200ma, :adx, :sector_relative_6m
-                        )
-                        ON CONFLICT (ticker, calculation_date)
-                        DO UPDATE SET
-                            sma_20 = EXCLUDED.sma_20,
-                            sma_50 = EXCLUDED.sma_50,
-                            sma_200 = EXCLUDED.sma_200,
-                            mad = EXCLUDED.mad,
-                            momentum_12_1 = EXCLUDED.momentum_12_1,
-                            momentum_6m = EXCLUDED.momentum_6m,
-                            momentum_3m = EXCLUDED.momentum_3m,
-                            momentum_1m = EXCLUDED.momentum_1m,
-                            rsi_14 = EXCLUDED.rsi_14,
-                            avg_volume_20d = EXCLUDED.avg_volume_20d,
-                            avg_volume_90d = EXCLUDED.avg_volume_90d,
-                            relative_volume = EXCLUDED.relative_volume,
-                            price_vs_200ma = EXCLUDED.price_vs_200ma,
-                            adx = EXCLUDED.adx,
-                            sector_relative_6m = EXCLUDED.sector_relative_6m
-                    """)
-
-                    session.execute(sql, indicator)
+                # executemany: one prepared statement for every row
+                session.execute(self._UPSERT_SQL, indicators)
 
                 session.commit()
 
                 self.stats['records_inserted'] += len(indicators)
-                logger.info(f"Stored {len(indicators)} indicator records")
+                logger.info("Stored %d indicator records", len(indicators))
 
             except Exception as e:
                 session.rollback()
-                logger.error(f"Error storing indicators: {e}")
+                logger.error("Error storing indicators: %s", e)
                 self.stats['errors'].append(str(e))
                 raise
 
@@ -343,48 +596,39 @@ class TechnicalIndicatorCalculator:
                 logger.warning("No stocks with 6m momentum data found")
                 return
 
-            # Group by sector and calculate averages
-            sector_returns: Dict[str, List[float]] = {}
-            stock_data: List[Dict] = []
-            for ticker, sector, momentum_6m in rows:
-                m6m = float(momentum_6m)
-                stock_data.append({'ticker': ticker, 'sector': sector, 'momentum_6m': m6m})
-                sector_returns.setdefault(sector, []).append(m6m)
-
-            sector_averages = {
-                sector: sum(returns) / len(returns)
-                for sector, returns in sector_returns.items()
-            }
+            # Per-stock sector average in one grouped pass
+            stocks = pd.DataFrame(
+                rows, columns=['ticker', 'sector', 'momentum_6m']
+            ).astype({'momentum_6m': 'float64'})
+            by_sector = stocks.groupby('sector', dropna=False)['momentum_6m']
+            stocks['sector_avg'] = by_sector.transform('mean')
+            stocks['relative'] = stocks['momentum_6m'] - stocks['sector_avg']
 
             # Log sector averages
-            for sector, avg in sorted(sector_averages.items()):
-                count = len(sector_returns[sector])
-                logger.info(f"  {sector}: avg 6m return = {avg:.2%} ({count} stocks)")
-
-            # Calculate and update sector_relative_6m for each stock
-            updated = 0
-            for stock in stock_data:
-                sector_avg = sector_averages[stock['sector']]
-                relative = stock['momentum_6m'] - sector_avg
-
-                update_sql = text("""
-                    UPDATE technical_indicators
-                    SET sector_relative_6m = :relative
-                    WHERE ticker = :ticker
-                """)
-                session.execute(update_sql, {
-                    'relative': round(relative, 6),
-                    'ticker': stock['ticker']
-                })
-
-                logger.info(
-                    f"  {stock['ticker']}: 6m={stock['momentum_6m']:.2%}, "
-                    f"sector avg={sector_avg:.2%}, relative={relative:+.2%}"
+            for sector, avg, count in by_sector.agg(['mean', 'count']).itertuples():
+                logger.info("  %s: avg 6m return = %.2f%% (%d stocks)", sector, avg * 100, count)
+
+            # Per-stock detail is debug-only; the summary below is logged once
+            if logger.isEnabledFor(logging.DEBUG):
+                for stock in stocks.itertuples(index=False):
+                    logger.debug(
+                        "  %s: 6m=%.2f%%, sector avg=%.2f%%, relative=%+.2f%%",
+                        stock.ticker, stock.momentum_6m * 100,
+                        stock.sector_avg * 100, stock.relative * 100,
+                    )
+
+            updates = [
+                {'relative': relative, 'ticker': ticker}
+                for ticker, relative in zip(
+                    stocks['ticker'].tolist(), stocks['relative'].round(6).tolist()
                 )
-                updated += 1
+            ]
+
+            # One executemany round-trip for all stocks
+            session.execute(self._SECTOR_RELATIVE_UPDATE_SQL, updates)
 
             session.commit()
-            logger.info(f"Updated sector_relative_6m for {updated} stocks")
+            logger.info("Updated sector_relative_6m for %d stocks", len(updates))
 
     def process_all_stocks(self, tickers: Optional[List[str]] = None) -> None:
         """Calculate and store indicators for stocks.
@@ -399,17 +643,24 @@ class TechnicalIndicatorCalculator:
         if tickers is None:
             tickers = self.get_active_stocks()
 
+        prices = self.get_price_data(tickers)
+
+        loaded = set(prices['ticker'])
         for ticker in tickers:
-            try:
-                indicators = self.calculate_indicators_for_stock(ticker)
-                if indicators:
-                    self.store_indicators(indicators)
-                    self.stats['stocks_processed'] += 1
+            if ticker not in loaded:
+                logger.warning("No price data found for %s", ticker)
 
-            except Exception as e:
-                logger.error(f"Error processing {ticker}: {e}")
-                self.stats['errors'].append(f"{ticker}: {str(e)}")
-                continue
+        try:
+            all_indicators = self._calculate_cached(prices)
+        except Exception as e:
+            # One malformed ticker sinks the vectorized pass; isolate it
+            logger.error("Error calculating indicators: %s; retrying per ticker", e)
+            all_indicators = self._calculate_per_ticker(prices)
+        self.stats['indicators_calculated'] += len(all_indicators)
+        self.stats['stocks_processed'] += len(all_indicators)
+
+        # Store all tickers in one transaction
+        self.store_indicators(all_indicators)
 
         # Calculate sector-relative returns after all individual indicators
         # Framework Section 4.2: Requires cross-stock comparison within sectors
@@ -422,26 +673,40 @@ class TechnicalIndicatorCalculator:
         logger.info("=" * 60)
         logger.info("CALCULATION COMPLETE")
         logger.info("=" * 60)
-        logger.info(f"Stocks processed: {self.stats['stocks_processed']}")
-        logger.info(f"Indicators calculated: {self.stats['indicators_calculated']}")
-        logger.info(f"Records inserted: {self.stats['records_inserted']}")
+        logger.info("Stocks processed: %d", self.stats['stocks_processed'])
+        logger.info("Indicators calculated: %d", self.stats['indicators_calculated'])
+        logger.info("Records inserted: %d", self.stats['records_inserted'])
 
         if self.stats['errors']:
-            logger.warning(f"Errors encountered: {len(self.stats['errors'])}")
+            logger.warning("Errors encountered: %d", len(self.stats['errors']))
             for error in self.stats['errors'][:5]:  # Show first 5 errors
-                logger.warning(f"  - {error}")
+                logger.warning("  - %s", error)
         else:
             logger.info("✅ No errors!")
 
 
+def _calculate_chunk(prices: pd.DataFrame) -> List[Dict]:
+    """Process-pool task: indicators for one contiguous block of tickers."""
+    return TechnicalIndicatorCalculator().calculate_indicators(prices)
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(description="Calculate technical indicators")
     parser.add_argument('--ticker', nargs='+', help='Specific ticker(s) to process')
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Worker processes for indicator calculation (default: in-process)',
+    )
+    parser.add_argument(
+        '--cache', type=Path, default=None, metavar='PATH',
+        help='Pickle file caching indicators per ticker; tickers whose price '
+             'history is unchanged are not recalculated (default: no cache)',
+    )
     args = parser.parse_args()
 
     tickers = [t.upper() for t in args.ticker] if args.ticker else None
-    calculator = TechnicalIndicatorCalculator()
+    calculator = TechnicalIndicatorCalculator(workers=args.workers, cache_path=args.cache)
     calculator.process_all_stocks(tickers=tickers)
 
 
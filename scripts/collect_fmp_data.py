@@ -9,10 +9,15 @@ Must run AFTER collect_sentiment_data.py (which creates base sentiment records).
 
 Usage:
     python scripts/collect_fmp_data.py
+    python scripts/collect_fmp_data.py --workers 8
+    python scripts/collect_fmp_data.py --cache .cache/fmp
+    python scripts/collect_fmp_data.py --force
 """
 
 import argparse
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
@@ -20,8 +25,9 @@ sys.path.insert(0, str(project_root / "src"))
 from datetime import date
 import logging
 from typing import List, Dict, Any, Optional
-from sqlalchemy import select, update
+from sqlalchemy import Integer, String, and_, cast, column, func, select, update, values
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
 
 from database import get_db_session
 from database.models import Stock, SentimentData, FMPEstimateSnapshot
@@ -35,6 +41,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# SentimentData fields populated from FMP
+FMP_SENTIMENT_FIELDS = (
+    'upgrades_30d', 'downgrades_30d',
+    'estimate_revisions_up_90d', 'estimate_revisions_down_90d',
+)
+
+
+def _sentiment_update(rows: List[tuple]):
+    """
+    UPDATE ... FROM (VALUES ...) writing FMP fields to each ticker's latest sentiment record.
+
+    rows are (ticker, *FMP_SENTIMENT_FIELDS) tuples. A None field keeps the
+    stored value; RETURNING yields the tickers that had a record to update.
+    """
+    v = values(
+        column('ticker', String),
+        *(column(field, Integer) for field in FMP_SENTIMENT_FIELDS),
+        name='v',
+    ).data(rows)
+
+    latest = aliased(SentimentData)
+    latest_date = (
+        select(func.max(latest.data_date))
+        .where(latest.ticker == v.c.ticker)
+        .scalar_subquery()
+    )
+
+    return (
+        update(SentimentData)
+        .where(SentimentData.ticker == v.c.ticker)
+        .where(SentimentData.data_date == latest_date)
+        .values(
+            # CAST: an all-NULL VALUES column would otherwise be typed text
+            **{
+                field: func.coalesce(cast(v.c[field], Integer), getattr(SentimentData, field))
+                for field in FMP_SENTIMENT_FIELDS
+            },
+            data_source='yahoo_finance,fmp',
+        )
+        .returning(SentimentData.ticker)
+    )
+
+
+def _snapshot_rows(ticker: str, estimates: List[Dict]) -> List[Dict]:
+    """FMPEstimateSnapshot rows for today's estimates of one ticker."""
+    today = date.today()
+
+    # Keyed by fiscal date: a multi-row upsert may not touch the same
+    # row twice, so a repeated period keeps its last estimate
+    rows = {}
+    for est in estimates:
+        fiscal_date = est.get('date')
+        if not fiscal_date:
+            continue
+
+        rows[fiscal_date] = {
+            'ticker': ticker,
+            'snapshot_date': today,
+            'fiscal_date': fiscal_date,
+            'eps_avg': est.get('estimatedEpsAvg'),
+            'eps_high': est.get('estimatedEpsHigh'),
+            'eps_low': est.get('estimatedEpsLow'),
+            'revenue_avg': est.get('estimatedRevenueAvg'),
+            'revenue_high': est.get('estimatedRevenueHigh'),
+            'revenue_low': est.get('estimatedRevenueLow'),
+            'num_analysts_eps': int(est['numberAnalystEstimatedEps']) if est.get('numberAnalystEstimatedEps') is not None else None,
+            'num_analysts_revenue': int(est['numberAnalystEstimatedRevenue']) if est.get('numberAnalystEstimatedRevenue') is not None else None,
+        }
+
+    return list(rows.values())
+
+
+def _snapshot_upsert():
+    """INSERT ... ON CONFLICT (ticker, snapshot_date, fiscal_date) DO UPDATE for snapshots."""
+    stmt = insert(FMPEstimateSnapshot)
+    return stmt.on_conflict_do_update(
+        constraint='uq_fmp_snapshot_ticker_dates',
+        set_={
+            column: stmt.excluded[column]
+            for column in (
+                'eps_avg', 'eps_high', 'eps_low',
+                'revenue_avg', 'revenue_high', 'revenue_low',
+                'num_analysts_eps', 'num_analysts_revenue',
+            )
+        },
+    )
+
 
 class FMPDataCollector:
     """
@@ -45,8 +138,34 @@ class FMPDataCollector:
     - Analyst estimates: track revisions over time
     """
 
-    def __init__(self):
-        self.fmp = FMPCollector()
+    # Executed with a list of rows, so SQLAlchemy's insertmanyvalues sends
+    # each ticker's estimates as multi-row VALUES pages (the equivalent of
+    # psycopg2's execute_values) rather than one INSERT per estimate.
+    _SNAPSHOT_UPSERT_SQL = _snapshot_upsert()
+
+    # Tickers per write transaction; bounds the VALUES list size
+    UPDATE_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+        force: bool = False,
+    ):
+        """
+        Args:
+            workers: Number of threads collecting tickers concurrently.
+                     None or 1 processes tickers one at a time. FMP calls
+                     from all threads share the collector's rate limiter.
+            cache_dir: Optional directory caching FMP responses, so reruns
+                       within FMPCollector.CACHE_TTL skip the API. None
+                       disables caching.
+            force: Re-collect stocks already collected today.
+        """
+        self.workers = workers
+        self.force = force
+        self.fmp = FMPCollector(cache_dir=cache_dir)
+        self._stats_lock = threading.Lock()
         self.stats = {
             'stocks_processed': 0,
             'stocks_success': 0,
@@ -66,6 +185,27 @@ class FMPDataCollector:
             logger.info(f"Found {len(tickers)} active stocks")
             return tickers
 
+    def get_tickers_to_process(self) -> List[str]:
+        """
+        Fetch active stocks not yet collected today.
+
+        A stock counts as collected once it has an estimate snapshot dated
+        today, so a rerun after a partial failure only retries the rest.
+        """
+        collected_today = (
+            select(FMPEstimateSnapshot.ticker)
+            .where(FMPEstimateSnapshot.snapshot_date == date.today())
+        )
+        with get_db_session() as session:
+            stmt = (
+                select(Stock.ticker)
+                .where(Stock.is_active == True)
+                .where(Stock.ticker.not_in(collected_today))
+            )
+            tickers = list(session.execute(stmt).scalars())
+            logger.info(f"Found {len(tickers)} active stocks not yet collected today")
+            return tickers
+
     def load_previous_snapshots(self, ticker: str) -> Dict[str, Dict]:
         """
         Load the most recent estimate snapshots for a ticker.
@@ -74,37 +214,58 @@ class FMPDataCollector:
             Dict keyed by fiscal_date string, each value containing
             'eps_avg' and 'revenue_avg' from the most recent prior snapshot.
         """
-        with get_db_session() as session:
-            # Get the most recent snapshot_date for this ticker (before today)
-            from sqlalchemy import func
-            latest_date_stmt = (
-                select(func.max(FMPEstimateSnapshot.snapshot_date))
-                .where(FMPEstimateSnapshot.ticker == ticker)
-                .where(FMPEstimateSnapshot.snapshot_date < date.today())
-            )
-            result = session.execute(latest_date_stmt).scalar()
+        return self.load_all_previous_snapshots([ticker]).get(ticker, {})
+
+    def load_all_previous_snapshots(self, tickers: List[str]) -> Dict[str, Dict[str, Dict]]:
+        """
+        Load the most recent prior estimate snapshots for many tickers at once.
 
-            if result is None:
-                return {}
+        One query joins each ticker's latest snapshot_date before today
+        back onto the snapshot table, replacing two round-trips per ticker.
 
-            # Load all snapshots from that date
-            snapshots_stmt = (
-                select(FMPEstimateSnapshot)
-                .where(FMPEstimateSnapshot.ticker == ticker)
-                .where(FMPEstimateSnapshot.snapshot_date == result)
+        Returns:
+            Dict of {ticker: snapshots}, where snapshots has the same shape
+            as load_previous_snapshots(). Tickers with no prior snapshot
+            are absent.
+        """
+        if not tickers:
+            return {}
+
+        latest = (
+            select(
+                FMPEstimateSnapshot.ticker,
+                func.max(FMPEstimateSnapshot.snapshot_date).label('snapshot_date'),
             )
-            rows = session.execute(snapshots_stmt).scalars().all()
-
-            snapshots = {}
-            for row in rows:
-                fiscal_key = row.fiscal_date.isoformat()
-                snapshots[fiscal_key] = {
-                    'eps_avg': float(row.eps_avg) if row.eps_avg is not None else None,
-                    'revenue_avg': float(row.revenue_avg) if row.revenue_avg is not None else None,
-                }
+            .where(FMPEstimateSnapshot.ticker.in_(tickers))
+            .where(FMPEstimateSnapshot.snapshot_date < date.today())
+            .group_by(FMPEstimateSnapshot.ticker)
+            .subquery()
+        )
+        stmt = (
+            select(
+                FMPEstimateSnapshot.ticker,
+                FMPEstimateSnapshot.fiscal_date,
+                FMPEstimateSnapshot.eps_avg,
+                FMPEstimateSnapshot.revenue_avg,
+            )
+            .join(latest, and_(
+                FMPEstimateSnapshot.ticker == latest.c.ticker,
+                FMPEstimateSnapshot.snapshot_date == latest.c.snapshot_date,
+            ))
+        )
 
-            logger.info(f"{ticker}: Loaded {len(snapshots)} previous snapshots from {result}")
-            return snapshots
+        with get_db_session() as session:
+            rows = session.execute(stmt).all()
+
+        snapshots: Dict[str, Dict[str, Dict]] = {}
+        for row in rows:
+            snapshots.setdefault(row.ticker, {})[row.fiscal_date.isoformat()] = {
+                'eps_avg': float(row.eps_avg) if row.eps_avg is not None else None,
+                'revenue_avg': float(row.revenue_avg) if row.revenue_avg is not None else None,
+            }
+
+        logger.info(f"Loaded previous snapshots for {len(snapshots)}/{len(tickers)} tickers")
+        return snapshots
 
     def store_estimate_snapshots(self, ticker: str, estimates: List[Dict]) -> int:
         """
@@ -117,50 +278,16 @@ class FMPDataCollector:
         Returns:
             Number of snapshots stored
         """
-        today = date.today()
-        stored = 0
+        rows = _snapshot_rows(ticker, estimates)
+        if not rows:
+            return 0
 
         with get_db_session() as session:
-            for est in estimates:
-                fiscal_date = est.get('date')
-                if not fiscal_date:
-                    continue
-
-                values = {
-                    'ticker': ticker,
-                    'snapshot_date': today,
-                    'fiscal_date': fiscal_date,
-                    'eps_avg': est.get('estimatedEpsAvg'),
-                    'eps_high': est.get('estimatedEpsHigh'),
-                    'eps_low': est.get('estimatedEpsLow'),
-                    'revenue_avg': est.get('estimatedRevenueAvg'),
-                    'revenue_high': est.get('estimatedRevenueHigh'),
-                    'revenue_low': est.get('estimatedRevenueLow'),
-                    'num_analysts_eps': int(est['numberAnalystEstimatedEps']) if est.get('numberAnalystEstimatedEps') is not None else None,
-                    'num_analysts_revenue': int(est['numberAnalystEstimatedRevenue']) if est.get('numberAnalystEstimatedRevenue') is not None else None,
-                }
-
-                stmt = insert(FMPEstimateSnapshot).values(**values)
-                stmt = stmt.on_conflict_do_update(
-                    constraint='uq_fmp_snapshot_ticker_dates',
-                    set_={
-                        'eps_avg': stmt.excluded.eps_avg,
-                        'eps_high': stmt.excluded.eps_high,
-                        'eps_low': stmt.excluded.eps_low,
-                        'revenue_avg': stmt.excluded.revenue_avg,
-                        'revenue_high': stmt.excluded.revenue_high,
-                        'revenue_low': stmt.excluded.revenue_low,
-                        'num_analysts_eps': stmt.excluded.num_analysts_eps,
-                        'num_analysts_revenue': stmt.excluded.num_analysts_revenue,
-                    }
-                )
-                session.execute(stmt)
-                stored += 1
-
+            session.execute(self._SNAPSHOT_UPSERT_SQL, rows)
             session.commit()
 
-        logger.info(f"{ticker}: Stored {stored} estimate snapshots")
-        return stored
+        logger.info(f"{ticker}: Stored {len(rows)} estimate snapshots")
+        return len(rows)
 
     def update_sentiment_record(self, ticker: str, fmp_data: Dict) -> bool:
         """
@@ -176,65 +303,130 @@ class FMPDataCollector:
         """
         try:
             with get_db_session() as session:
-                # Build update values (only non-None FMP fields)
-                update_values = {}
-
-                if fmp_data.get('upgrades_30d') is not None:
-                    update_values['upgrades_30d'] = fmp_data['upgrades_30d']
-                if fmp_data.get('downgrades_30d') is not None:
-                    update_values['downgrades_30d'] = fmp_data['downgrades_30d']
-                if fmp_data.get('estimate_revisions_up_90d') is not None:
-                    update_values['estimate_revisions_up_90d'] = fmp_data['estimate_revisions_up_90d']
-                if fmp_data.get('estimate_revisions_down_90d') is not None:
-                    update_values['estimate_revisions_down_90d'] = fmp_data['estimate_revisions_down_90d']
-
-                if not update_values:
-                    logger.info(f"{ticker}: No FMP data to update")
-                    return True
-
-                # Update data_source to include FMP
-                update_values['data_source'] = 'yahoo_finance,fmp'
-
-                # Find the most recent sentiment record for this ticker
-                from sqlalchemy import func
-                latest_date_stmt = (
-                    select(func.max(SentimentData.data_date))
-                    .where(SentimentData.ticker == ticker)
-                )
-                latest_date = session.execute(latest_date_stmt).scalar()
-
-                if latest_date is None:
-                    logger.warning(
-                        f"{ticker}: No sentiment record found. "
-                        f"Run collect_sentiment_data.py first."
-                    )
-                    return False
-
-                stmt = (
-                    update(SentimentData)
-                    .where(SentimentData.ticker == ticker)
-                    .where(SentimentData.data_date == latest_date)
-                    .values(**update_values)
-                )
-                session.execute(stmt)
+                results = self._update_sentiment(session, {ticker: fmp_data})
                 session.commit()
-
-                logger.info(
-                    f"{ticker}: Updated sentiment record ({latest_date}) with FMP data"
-                )
-                return True
+                return results[ticker]
 
         except Exception as e:
             logger.error(f"Error updating sentiment for {ticker}: {e}")
             return False
 
-    def collect_for_ticker(self, ticker: str) -> Optional[Dict]:
+    def store_results(self, fmp_data: Dict[str, Dict]) -> Dict[str, bool]:
+        """
+        Store estimate snapshots and sentiment updates for many tickers.
+
+        Tickers are written UPDATE_BATCH_SIZE at a time. Each batch shares
+        one session and one commit: a single upsert of the batch's estimate
+        snapshots, then a single UPDATE ... FROM (VALUES ...) of their
+        sentiment records, so a failed batch leaves no partial writes.
+        A failed batch is retried one ticker at a time, so a single bad
+        row only fails its own ticker.
+
+        Args:
+            fmp_data: Dict of {ticker: fmp fields} from collect_for_ticker()
+
+        Returns:
+            Dict of {ticker: success}
+        """
+        results = {}
+        tickers = list(fmp_data)
+
+        for start in range(0, len(tickers), self.UPDATE_BATCH_SIZE):
+            batch = {ticker: fmp_data[ticker] for ticker in tickers[start:start + self.UPDATE_BATCH_SIZE]}
+            try:
+                results.update(self._store_batch(batch))
+                continue
+            except Exception as e:
+                logger.warning(
+                    f"Error storing FMP data for batch of {len(batch)} stocks, "
+                    f"retrying one at a time: {e}"
+                )
+
+            for ticker, data in batch.items():
+                try:
+                    results.update(self._store_batch({ticker: data}))
+                except Exception as e:
+                    logger.error(f"Error storing FMP data for {ticker}: {e}")
+                    results[ticker] = False
+
+        return results
+
+    def _store_batch(self, batch: Dict[str, Dict]) -> Dict[str, bool]:
+        """Write one batch's snapshots and sentiment updates in a single transaction."""
+        snapshot_rows = [
+            row
+            for ticker, data in batch.items()
+            for row in _snapshot_rows(ticker, data.get('current_estimates') or [])
+        ]
+        with get_db_session() as session:
+            if snapshot_rows:
+                session.execute(self._SNAPSHOT_UPSERT_SQL, snapshot_rows)
+            results = self._update_sentiment(session, batch)
+            session.commit()
+
+        self._count('snapshots_stored', len(snapshot_rows))
+        logger.info(
+            f"Stored {len(snapshot_rows)} estimate snapshots and "
+            f"{sum(results.values())} sentiment updates"
+        )
+        return results
+
+    @staticmethod
+    def _update_sentiment(session, fmp_data: Dict[str, Dict]) -> Dict[str, bool]:
+        """
+        Write FMP fields to each ticker's latest sentiment record in one statement.
+
+        Only non-None FMP fields are changed. Does not commit.
+
+        Returns:
+            Dict of {ticker: success}
+        """
+        results = {}
+        rows = []
+        for ticker, data in fmp_data.items():
+            row = tuple(data.get(field) for field in FMP_SENTIMENT_FIELDS)
+            if all(value is None for value in row):
+                logger.info(f"{ticker}: No FMP data to update")
+                results[ticker] = True
+            else:
+                rows.append((ticker, *row))
+
+        if not rows:
+            return results
+
+        updated = set(session.execute(_sentiment_update(rows)).scalars())
+        for row in rows:
+            ticker = row[0]
+            results[ticker] = ticker in updated
+            if ticker not in updated:
+                logger.warning(
+                    f"{ticker}: No sentiment record found. "
+                    f"Run collect_sentiment_data.py first."
+                )
+
+        return results
+
+    def collect_for_ticker(
+        self,
+        ticker: str,
+        previous: Optional[Dict[str, Dict]] = None,
+    ) -> Optional[Dict]:
         """
         Collect all FMP data for a single ticker.
 
+        Args:
+            ticker: Stock ticker
+            previous: Prior estimate snapshots for this ticker, as returned
+                      by load_previous_snapshots(). Loaded on demand if None.
+
+        Nothing is written here; pass the result to store_results().
+
         Returns:
-            Dict with FMP data fields, or None on failure
+            Dict with FMP data fields plus 'current_estimates' (the
+            estimates to snapshot for future revision comparison),
+            or None on failure
         """
+        logger.info(f"\nProcessing {ticker}...")
         fmp_data = {}
 
         try:
@@ -242,7 +434,7 @@ class FMPDataCollector:
             grades = self.fmp.calculate_upgrades_downgrades(ticker, lookback_days=30)
             fmp_data['upgrades_30d'] = grades['upgrades']
             fmp_data['downgrades_30d'] = grades['downgrades']
-            self.stats['upgrades_populated'] += 1
+            self._count('upgrades_populated')
 
         except DataValidationError as e:
             logger.warning(f"{ticker}: Failed to get grades: {e}")
@@ -251,21 +443,17 @@ class FMPDataCollector:
 
         try:
             # 2. Estimate revisions
-            previous = self.load_previous_snapshots(ticker)
+            if previous is None:
+                previous = self.load_previous_snapshots(ticker)
             revisions = self.fmp.calculate_estimate_revisions(ticker, previous)
 
-            # Store current snapshots for future comparison
-            if revisions['current_estimates']:
-                stored = self.store_estimate_snapshots(
-                    ticker, revisions['current_estimates']
-                )
-                self.stats['snapshots_stored'] += stored
-
+            # Snapshotted by store_results() for future comparison
+            fmp_data['current_estimates'] = revisions['current_estimates']
             fmp_data['estimate_revisions_up_90d'] = revisions['revisions_up']
             fmp_data['estimate_revisions_down_90d'] = revisions['revisions_down']
 
             if revisions['revisions_up'] is not None:
-                self.stats['revisions_populated'] += 1
+                self._count('revisions_populated')
 
         except DataValidationError as e:
             logger.warning(f"{ticker}: Failed to get estimates: {e}")
@@ -274,12 +462,27 @@ class FMPDataCollector:
 
         return fmp_data
 
+    def _flush(self, pending: Dict[str, Optional[Dict]]) -> None:
+        """Store collected tickers, tally success/failure, and clear pending."""
+        fmp_data = {ticker: data for ticker, data in pending.items() if data}
+        results = self.store_results(fmp_data)
+        succeeded = sum(results.values())
+        self.stats['stocks_success'] += succeeded
+        self.stats['stocks_failed'] += len(pending) - succeeded
+        pending.clear()
+
+    def _count(self, key: str, n: int = 1) -> None:
+        """Increment a stats counter; safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[key] += n
+
     def run(self, tickers: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Main execution: collect FMP data for stocks.
 
         Args:
-            tickers: Specific tickers to process. If None, processes all active stocks.
+            tickers: Specific tickers to process. If None, processes active
+                     stocks not yet collected today (all of them with force).
 
         Returns:
             Dict with execution statistics
@@ -289,22 +492,35 @@ class FMPDataCollector:
         logger.info("=" * 80)
 
         if tickers is None:
-            tickers = self.get_active_stocks()
+            tickers = self.get_active_stocks() if self.force else self.get_tickers_to_process()
         self.stats['stocks_processed'] = len(tickers)
-
-        for ticker in tickers:
-            logger.info(f"\nProcessing {ticker}...")
-
-            fmp_data = self.collect_for_ticker(ticker)
-
-            if fmp_data:
-                success = self.update_sentiment_record(ticker, fmp_data)
-                if success:
-                    self.stats['stocks_success'] += 1
-                else:
-                    self.stats['stocks_failed'] += 1
-            else:
-                self.stats['stocks_failed'] += 1
+        previous = self.load_all_previous_snapshots(tickers)
+
+        # Write snapshots and sentiment every UPDATE_BATCH_SIZE collected
+        # tickers, so an interrupted run keeps what it already fetched
+        pending = {}
+        if (self.workers or 1) <= 1:
+            for ticker in tickers:
+                pending[ticker] = self.collect_for_ticker(ticker, previous.get(ticker, {}))
+                if len(pending) >= self.UPDATE_BATCH_SIZE:
+                    self._flush(pending)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(self.collect_for_ticker, ticker, previous.get(ticker, {})): ticker
+                    for ticker in tickers
+                }
+                for future in as_completed(futures):
+                    ticker = futures[future]
+                    try:
+                        pending[ticker] = future.result()
+                    except Exception as e:
+                        logger.error(f"{ticker}: Collection failed: {e}")
+                        self.stats['errors'].append(f"{ticker}: {e}")
+                        pending[ticker] = None
+                    if len(pending) >= self.UPDATE_BATCH_SIZE:
+                        self._flush(pending)
+        self._flush(pending)
 
         # Print summary
         logger.info("\n" + "=" * 80)
@@ -329,10 +545,23 @@ def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Collect FMP analyst data")
     parser.add_argument('--ticker', nargs='+', help='Specific ticker(s) to process')
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='Threads collecting tickers concurrently (default: sequential)',
+    )
+    parser.add_argument(
+        '--cache', type=Path, default=None, metavar='DIR',
+        help='Directory caching FMP responses; reruns within a few hours '
+             'reuse them instead of calling the API (default: no cache)',
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help='Re-collect stocks that already have estimate snapshots from today',
+    )
     args = parser.parse_args()
 
     tickers = [t.upper() for t in args.ticker] if args.ticker else None
-    collector = FMPDataCollector()
+    collector = FMPDataCollector(workers=args.workers, cache_dir=args.cache, force=args.force)
     stats = collector.run(tickers=tickers)
 
     if stats['stocks_failed'] == 0:
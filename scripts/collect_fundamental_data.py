@@ -7,10 +7,12 @@ Required for: Fundamental score calculations (value, quality, growth components)
 
 Usage:
     python scripts/collect_fundamental_data.py
+    python scripts/collect_fundamental_data.py --force
 """
 
 import argparse
 import sys
+from collections import Counter
 from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
@@ -32,6 +34,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Metric columns filled by collect_fundamental_data()
+METRIC_KEYS = (
+    'pe_ratio', 'forward_pe', 'pb_ratio', 'ps_ratio',
+    'ev_to_ebitda', 'peg_ratio', 'dividend_yield',
+    'roe', 'roa', 'net_margin', 'operating_margin', 'gross_margin',
+    'revenue_growth_yoy', 'eps_growth_yoy',
+    'current_ratio', 'quick_ratio', 'debt_to_equity',
+    'beta',
+)
+
+
+def _fundamental_upsert():
+    """INSERT ... ON CONFLICT (ticker, report_date, period_type) DO UPDATE for fundamentals."""
+    stmt = insert(FundamentalData)
+    return stmt.on_conflict_do_update(
+        index_elements=['ticker', 'report_date', 'period_type'],
+        set_={
+            column: stmt.excluded[column]
+            for column in (*METRIC_KEYS, 'data_source')
+        },
+    )
+
 
 class FundamentalDataCollector:
     """
@@ -44,13 +68,25 @@ class FundamentalDataCollector:
     - Financial Health: Current/Quick Ratios, Debt/Equity
     """
 
-    def __init__(self):
+    # Rows per upsert transaction; a failed batch only loses its own rows
+    STORE_BATCH_SIZE = 500
+
+    # Executed with a list of rows, so SQLAlchemy's insertmanyvalues sends
+    # them as multi-row VALUES pages instead of one INSERT per ticker
+    _UPSERT_SQL = _fundamental_upsert()
+
+    def __init__(self, force: bool = False):
+        """
+        Args:
+            force: Re-collect stocks that already have today's fundamentals.
+        """
+        self.force = force
         self.yf_collector = YahooFinanceCollector()
         self.stats = {
             'stocks_processed': 0,
             'stocks_success': 0,
             'stocks_failed': 0,
-            'metrics_collected': {},
+            'metrics_collected': Counter(),
             'errors': []
         }
 
@@ -68,6 +104,28 @@ class FundamentalDataCollector:
             logger.info(f"Found {len(tickers)} active stocks")
             return tickers
 
+    def get_tickers_to_process(self) -> List[str]:
+        """
+        Fetch active stocks without fundamental data for today.
+
+        Returns:
+            List of ticker symbols
+        """
+        collected_today = (
+            select(FundamentalData.ticker)
+            .where(FundamentalData.report_date == date.today())
+            .where(FundamentalData.period_type == 'current')
+        )
+        with get_db_session() as session:
+            stmt = (
+                select(Stock.ticker)
+                .where(Stock.is_active == True)
+                .where(Stock.ticker.not_in(collected_today))
+            )
+            tickers = list(session.execute(stmt).scalars())
+            logger.info(f"Found {len(tickers)} active stocks without today's fundamentals")
+            return tickers
+
     def collect_fundamental_data(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
         Collect fundamental metrics for a ticker.
@@ -143,59 +201,76 @@ class FundamentalDataCollector:
             })
             return None
 
-    def store_fundamental_data(self, data: Dict[str, Any]) -> bool:
+    def store_fundamental_data(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Store fundamental data in database.
 
         Uses INSERT ... ON CONFLICT UPDATE to handle duplicates
-        (same ticker + report_date).
+        (same ticker + report_date + period_type). Rows are written in
+        batches of STORE_BATCH_SIZE, one transaction per batch. A failed
+        batch is retried one row at a time, so a bad value only loses
+        its own ticker.
 
         Args:
-            data: Fundamental data dict
+            rows: Fundamental data dicts from collect_fundamental_data()
 
         Returns:
-            True if successful, False otherwise
+            The rows that were stored successfully
         """
-        try:
-            with get_db_session() as session:
-                # Use upsert to handle existing data
-                # If ticker + report_date + period_type exists, update the metrics
-                stmt = insert(FundamentalData).values(**data)
-
-                # Create update dict excluding the conflict keys
-                update_data = {
-                    key: value
-                    for key, value in data.items()
-                    if key not in ['ticker', 'report_date', 'period_type']
-                }
-
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['ticker', 'report_date', 'period_type'],
-                    set_=update_data
+        stored = []
+
+        for start in range(0, len(rows), self.STORE_BATCH_SIZE):
+            batch = rows[start:start + self.STORE_BATCH_SIZE]
+            try:
+                self._upsert(batch)
+                stored.extend(batch)
+                logger.info(f"Stored fundamental data for {len(batch)} stocks")
+                continue
+            except Exception as e:
+                logger.warning(
+                    f"Error storing fundamental batch of {len(batch)} stocks, "
+                    f"retrying one at a time: {e}"
                 )
 
-                session.execute(stmt)
-                session.commit()
+            for data in batch:
+                try:
+                    self._upsert([data])
+                    stored.append(data)
+                except Exception as e:
+                    logger.error(f"Error storing data for {data['ticker']}: {e}")
+                    import traceback
+                    logger.error(f"Traceback: {traceback.format_exc()}")
+                    self.stats['errors'].append({
+                        'ticker': data['ticker'],
+                        'error': f"Storage error: {str(e)}"
+                    })
+
+        return stored
+
+    def _upsert(self, rows: List[Dict[str, Any]]) -> None:
+        """Upsert rows in a single transaction."""
+        with get_db_session() as session:
+            session.execute(self._UPSERT_SQL, rows)
+            session.commit()
 
-                logger.info(f"Stored fundamental data for {data['ticker']}")
-                return True
+    def _store_and_track(self, rows: List[Dict[str, Any]]) -> None:
+        """Store collected rows, then tally success and metric availability."""
+        stored = self.store_fundamental_data(rows)
+        self.stats['stocks_success'] += len(stored)
+        self.stats['stocks_failed'] += len(rows) - len(stored)
 
-        except Exception as e:
-            logger.error(f"Error storing data for {data['ticker']}: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            self.stats['errors'].append({
-                'ticker': data['ticker'],
-                'error': f"Storage error: {str(e)}"
-            })
-            return False
+        # Track metrics availability
+        self.stats['metrics_collected'].update(
+            key for data in stored for key in METRIC_KEYS if data[key] is not None
+        )
 
     def run(self, tickers: Optional[List[str]] = None):
         """
         Main execution: Collect and store fundamental data for stocks.
 
         Args:
-            tickers: Specific tickers to process. If None, processes all active stocks.
+            tickers: Specific tickers to process. If None, processes active
+                     stocks without today's data (all of them with force).
         """
         logger.info("=" * 80)
         logger.info("FUNDAMENTAL DATA COLLECTION - START")
@@ -203,38 +278,32 @@ class FundamentalDataCollector:
 
         # Get active stocks
         if tickers is None:
-            tickers = self.get_active_stocks()
+            tickers = self.get_active_stocks() if self.force else self.get_tickers_to_process()
 
         if not tickers:
-            logger.warning("No active stocks found in database")
+            logger.warning("No stocks to process")
             return
 
         logger.info(f"Processing {len(tickers)} stocks...")
 
-        # Process each stock
+        # Collect each stock, storing every STORE_BATCH_SIZE collected rows
+        # so an interrupted run keeps what it already fetched
+        rows = []
         for ticker in tickers:
             self.stats['stocks_processed'] += 1
 
-            # Collect data
             data = self.collect_fundamental_data(ticker)
 
             if data is None:
                 self.stats['stocks_failed'] += 1
                 continue
 
-            # Store data
-            if self.store_fundamental_data(data):
-                self.stats['stocks_success'] += 1
-
-                # Track metrics availability
-                for key, value in data.items():
-                    if key not in ['ticker', 'report_date', 'period_type', 'data_source', 'created_at']:
-                        if key not in self.stats['metrics_collected']:
-                            self.stats['metrics_collected'][key] = 0
-                        if value is not None:
-                            self.stats['metrics_collected'][key] += 1
-            else:
-                self.stats['stocks_failed'] += 1
+            rows.append(data)
+            if len(rows) >= self.STORE_BATCH_SIZE:
+                self._store_and_track(rows)
+                rows = []
+
+        self._store_and_track(rows)
 
         # Print summary
         self._print_summary(tickers)
@@ -249,7 +318,7 @@ class FundamentalDataCollector:
         logger.info(f"  ✓ Success: {self.stats['stocks_success']}")
         logger.info(f"  ✗ Failed: {self.stats['stocks_failed']}")
 
-        if self.stats['metrics_collected']:
+        if self.stats['stocks_success']:
             logger.info("\nMetrics Availability (across all stocks):")
             total_stocks = self.stats['stocks_success']
 
@@ -302,10 +371,14 @@ def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Collect fundamental data for stocks")
     parser.add_argument('--ticker', nargs='+', help='Specific ticker(s) to process')
+    parser.add_argument(
+        '--force', action='store_true',
+        help="Re-collect stocks that already have today's fundamental data",
+    )
     args = parser.parse_args()
 
     tickers = [t.upper() for t in args.ticker] if args.ticker else None
-    collector = FundamentalDataCollector()
+    collector = FundamentalDataCollector(force=args.force)
     collector.run(tickers=tickers)
 
 
@@ -17,13 +17,15 @@ Framework Reference: Section 10 (Backtesting & Paper Trading)
 """
 
 import argparse
+import functools
 import sys
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
+from sqlalchemy import select
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -91,45 +93,98 @@ def generate_month_end_dates(months_back: int) -> List[date]:
 def load_price_dataframes(session, tickers: List[str]) -> Dict[str, pd.DataFrame]:
     """Load all price data into DataFrames indexed by date.
 
+    Selects only the ticker/date/close/volume columns for every ticker in
+    one query (plain rows, no PriceData objects) and splits the result per
+    ticker.
+
     Returns:
         {ticker: DataFrame with DatetimeIndex and close/volume columns}
     """
+    if not tickers:
+        return {}
+
+    rows = session.execute(
+        select(PriceData.ticker, PriceData.date, PriceData.close, PriceData.volume)
+        .where(PriceData.ticker.in_(tickers))
+        .order_by(PriceData.ticker, PriceData.date)
+    ).all()
+    if not rows:
+        return {}
+
+    frame = pd.DataFrame(rows, columns=['ticker', 'date', 'close', 'volume'])
+    frame['close'] = frame['close'].astype(np.float64)
+    frame['volume'] = frame['volume'].fillna(0).astype(np.int64)
+    groups = {
+        ticker: group for ticker, group in frame.groupby('ticker', sort=False)
+    }
+
     price_dfs = {}
     for ticker in tickers:
-        rows = (
-            session.query(PriceData)
-            .filter(PriceData.ticker == ticker)
-            .order_by(PriceData.date)
-            .all()
-        )
-        if not rows:
+        group = groups.get(ticker)
+        if group is None:
             continue
-
-        data = {
-            'close': [float(r.close) for r in rows],
-            'volume': [int(r.volume) if r.volume else 0 for r in rows],
-        }
-        index = pd.DatetimeIndex([r.date for r in rows])
-        price_dfs[ticker] = pd.DataFrame(data, index=index)
+        price_dfs[ticker] = pd.DataFrame(
+            {'close': group['close'].to_numpy(), 'volume': group['volume'].to_numpy()},
+            index=pd.DatetimeIndex(group['date'].to_numpy()),
+        )
 
     return price_dfs
 
 
+@functools.lru_cache(maxsize=1)
+def _calculators() -> Tuple[FundamentalCalculator, TechnicalCalculator, SentimentCalculator]:
+    """Pillar calculators, built once and shared by every checkpoint."""
+    return FundamentalCalculator(), TechnicalCalculator(), SentimentCalculator()
+
+
+def prepare_constant_pillars(
+    fundamental_data: Dict,
+    sentiment_data: Dict,
+    market_caps: Dict[str, float],
+) -> Dict:
+    """Prepare the pillars held constant across checkpoints, once per run.
+
+    Fundamental and sentiment use current data at every checkpoint, so their
+    calculator inputs are prepared once here. Fundamental scores depend only
+    on the fundamental universe and are scored once as well.
+
+    Returns:
+        {'fund_results': {ticker: fundamental result},
+         'sent_stock': {ticker: sentiment calculator input}}
+    """
+    # Enrich sentiment data with market caps
+    enriched_sentiment = {}
+    for ticker, sdata in sentiment_data.items():
+        enriched = dict(sdata)
+        if ticker in market_caps:
+            enriched['market_cap'] = market_caps[ticker]
+        enriched_sentiment[ticker] = enriched
+
+    fund_stock, fund_universe = ScoringPipeline._prepare_fundamental(fundamental_data)
+    sent_stock, _ = ScoringPipeline._prepare_sentiment(
+        enriched_sentiment, with_universe=False
+    )
+    fund_calc, _, _ = _calculators()
+    return {
+        'fund_results': fund_calc.calculate_fundamental_scores_bulk(fund_stock, fund_universe),
+        'sent_stock': sent_stock,
+    }
+
+
 def score_checkpoint(
     checkpoint_date: date,
     price_dfs: Dict[str, pd.DataFrame],
     indicator_cache: Dict[str, pd.DataFrame],
     stock_sectors: Dict[str, str],
-    fundamental_data: Dict,
-    sentiment_data: Dict,
+    constant_pillars: Dict,
     market_sentiment: Optional[Dict],
-    market_caps: Dict[str, float],
     weights: Dict[str, float],
 ) -> Optional[PipelineResult]:
     """Score all stocks at a single historical checkpoint.
 
     Technical indicators are recalculated from historical price data.
-    Fundamental and sentiment use current data (held constant).
+    Fundamental and sentiment use current data (held constant), prepared
+    once per run by prepare_constant_pillars().
 
     Returns PipelineResult or None if insufficient data.
     """
@@ -165,31 +220,18 @@ def score_checkpoint(
     # Compute sector-relative metrics
     indicator_builder.compute_sector_relative(tech_snapshots, stock_sectors)
 
-    # Initialize calculators
-    fund_calc = FundamentalCalculator()
-    tech_calc = TechnicalCalculator()
-    sent_calc = SentimentCalculator()
+    _, tech_calc, sent_calc = _calculators()
     composite_calc = CompositeScoreCalculator(
         fundamental_weight=weights['fundamental'],
         technical_weight=weights['technical'],
         sentiment_weight=weights['sentiment'],
     )
 
-    # Prepare fundamental data (same as pipeline._prepare_fundamental)
-    fund_stock, fund_universe = ScoringPipeline._prepare_fundamental(fundamental_data)
-
-    # Prepare technical data from historical snapshots
+    # Only the technical pillar changes between checkpoints
+    fund_results = constant_pillars['fund_results']
+    sent_stock = constant_pillars['sent_stock']
     tech_stock, tech_universe = ScoringPipeline._prepare_technical(tech_snapshots)
 
-    # Prepare sentiment data (enrich with market caps)
-    enriched_sentiment = {}
-    for ticker, sdata in sentiment_data.items():
-        enriched = dict(sdata)
-        if ticker in market_caps:
-            enriched['market_cap'] = market_caps[ticker]
-        enriched_sentiment[ticker] = enriched
-    sent_stock, sent_universe = ScoringPipeline._prepare_sentiment(enriched_sentiment)
-
     # Calculate per-stock pillar scores
     all_tickers = set(tech_snapshots.keys())
     pillar_scores: Dict[str, Dict] = {}
@@ -201,10 +243,8 @@ def score_checkpoint(
         data_status = {}
 
         # Fundamental (current data - held constant)
-        if ticker in fund_stock:
-            fund_result = fund_calc.calculate_fundamental_score(
-                fund_stock[ticker], fund_universe
-            )
+        if ticker in fund_results:
+            fund_result = fund_results[ticker]
             fund_score = fund_result.get('fundamental_score')
             fund_detail = {
                 'value_score': fund_result.get('value_score'),
@@ -320,7 +360,7 @@ def main():
         tickers = [s.ticker for s in stocks]
         stock_sectors = {s.ticker: s.sector for s in stocks}
         market_caps = {
-            s.ticker: float(s.market_cap) if s.market_cap else None
+            s.ticker: float(s.market_cap) if s.market_cap is not None else None
             for s in stocks
         }
         print(f"Active stocks: {len(tickers)} ({', '.join(tickers)})")
@@ -370,6 +410,9 @@ def main():
             return
 
         # Score each checkpoint
+        constant_pillars = prepare_constant_pillars(
+            fundamental_data, sentiment_data, market_caps
+        )
         snapshot_mgr = SnapshotManager()
         scored_count = 0
         skipped_count = 0
@@ -388,10 +431,8 @@ def main():
                 price_dfs=price_dfs,
                 indicator_cache=indicator_cache,
                 stock_sectors=stock_sectors,
-                fundamental_data=fundamental_data,
-                sentiment_data=sentiment_data,
+                constant_pillars=constant_pillars,
                 market_sentiment=market_sentiment,
-                market_caps=market_caps,
                 weights=weights,
             )
 
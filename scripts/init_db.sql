@@ -41,7 +41,10 @@ CREATE TABLE IF NOT EXISTS price_data (
     UNIQUE(ticker, date)
 );
 
-CREATE INDEX IF NOT EXISTS idx_price_ticker_date ON price_data(ticker, date DESC);
+-- Covering index for latest-close-per-ticker lookups (index-only scan);
+-- supersedes the earlier key-only idx_price_ticker_date
+DROP INDEX IF EXISTS idx_price_ticker_date;
+CREATE INDEX IF NOT EXISTS idx_price_ticker_date_close ON price_data(ticker, date DESC) INCLUDE (close);
 CREATE INDEX IF NOT EXISTS idx_price_date ON price_data(date DESC);
 
 -- ============================================================
@@ -16,6 +16,7 @@ Framework Reference: Section 10 (Backtesting & Paper Trading)
 import argparse
 import sys
 from datetime import date, timedelta
+from itertools import groupby
 from pathlib import Path
 
 import pandas as pd
@@ -29,6 +30,9 @@ from database import get_db_session
 from database.models import Stock, PriceData
 from backtesting.technical_backtest import TechnicalBacktester
 
+# Rows fetched per round trip when streaming price history
+PRICE_BATCH_SIZE = 1000
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Run technical scoring backtest")
@@ -43,6 +47,15 @@ def parse_args():
     return parser.parse_args()
 
 
+def _price_frame(rows: list) -> pd.DataFrame:
+    """Build a date-indexed OHLCV frame from (date, o, h, l, c, volume) rows."""
+    df = pd.DataFrame(rows, columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+    df[['open', 'high', 'low', 'close']] = df[['open', 'high', 'low', 'close']].astype(float)
+    df['volume'] = df['volume'].fillna(0).astype('int64')
+    df['date'] = pd.to_datetime(df['date'])
+    return df.set_index('date')
+
+
 def load_price_data(session) -> dict:
     """Load price data for all active stocks from the database.
 
@@ -56,31 +69,27 @@ def load_price_data(session) -> dict:
 
     print(f"Loading price data for {len(tickers)} stocks...")
 
+    # One streamed query ordered by ticker/date; each ticker's rows are
+    # turned into a frame as soon as the next ticker starts, so only one
+    # ticker's history is held as raw rows at a time.
+    rows = session.execute(
+        select(PriceData.ticker, PriceData.date, PriceData.open, PriceData.high,
+               PriceData.low, PriceData.close, PriceData.volume)
+        .where(PriceData.ticker.in_(tickers))
+        .order_by(PriceData.ticker, PriceData.date)
+        .execution_options(yield_per=PRICE_BATCH_SIZE)
+    )
+    frames = {
+        ticker: _price_frame([row[1:] for row in ticker_rows])
+        for ticker, ticker_rows in groupby(rows, key=lambda row: row[0])
+    }
+
     price_data = {}
     for ticker in tickers:
-        rows = (
-            session.query(PriceData)
-            .filter(PriceData.ticker == ticker)
-            .order_by(PriceData.date)
-            .all()
-        )
-
-        if not rows:
+        df = frames.get(ticker)
+        if df is None:
             print(f"  WARNING: No price data for {ticker}, skipping")
             continue
-
-        data = {
-            'date': [r.date for r in rows],
-            'open': [float(r.open) if r.open else None for r in rows],
-            'high': [float(r.high) if r.high else None for r in rows],
-            'low': [float(r.low) if r.low else None for r in rows],
-            'close': [float(r.close) if r.close else None for r in rows],
-            'volume': [int(r.volume) if r.volume else 0 for r in rows],
-        }
-
-        df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date').set_index('date')
         price_data[ticker] = df
 
         print(f"  {ticker}: {len(df)} days ({df.index.min().date()} to {df.index.max().date()})")
@@ -41,22 +41,22 @@ def load_fundamental_data() -> Dict[str, Dict]:
         for record in results:
             data[record.ticker] = {
                 # Valuation metrics
-                'pe_ratio': float(record.pe_ratio) if record.pe_ratio else None,
-                'pb_ratio': float(record.pb_ratio) if record.pb_ratio else None,
-                'ps_ratio': float(record.ps_ratio) if record.ps_ratio else None,
-                'ev_ebitda': float(record.ev_to_ebitda) if record.ev_to_ebitda else None,
-                'dividend_yield': float(record.dividend_yield) if record.dividend_yield else None,
+                'pe_ratio': float(record.pe_ratio) if record.pe_ratio is not None else None,
+                'pb_ratio': float(record.pb_ratio) if record.pb_ratio is not None else None,
+                'ps_ratio': float(record.ps_ratio) if record.ps_ratio is not None else None,
+                'ev_ebitda': float(record.ev_to_ebitda) if record.ev_to_ebitda is not None else None,
+                'dividend_yield': float(record.dividend_yield) if record.dividend_yield is not None else None,
 
                 # Quality metrics
-                'roe': float(record.roe) if record.roe else None,
-                'roa': float(record.roa) if record.roa else None,
-                'net_margin': float(record.net_margin) if record.net_margin else None,
-                'operating_margin': float(record.operating_margin) if record.operating_margin else None,
-                'gross_margin': float(record.gross_margin) if record.gross_margin else None,
+                'roe': float(record.roe) if record.roe is not None else None,
+                'roa': float(record.roa) if record.roa is not None else None,
+                'net_margin': float(record.net_margin) if record.net_margin is not None else None,
+                'operating_margin': float(record.operating_margin) if record.operating_margin is not None else None,
+                'gross_margin': float(record.gross_margin) if record.gross_margin is not None else None,
 
                 # Growth metrics
-                'revenue_growth': float(record.revenue_growth_yoy) if record.revenue_growth_yoy else None,
-                'earnings_growth': float(record.eps_growth_yoy) if record.eps_growth_yoy else None,
+                'revenue_growth': float(record.revenue_growth_yoy) if record.revenue_growth_yoy is not None else None,
+                'earnings_growth': float(record.eps_growth_yoy) if record.eps_growth_yoy is not None else None,
             }
 
     logger.info(f"Loaded fundamental data for {len(data)} stocks")
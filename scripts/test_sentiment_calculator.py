@@ -95,11 +95,11 @@ def transform_sentiment_data(db_data: SentimentData, current_price: float, marke
         Dict with fields expected by sentiment calculator
     """
     return {
-        'days_to_cover': float(db_data.days_to_cover) if db_data.days_to_cover else None,
-        'analyst_target': float(db_data.consensus_price_target) if db_data.consensus_price_target else None,
-        'analyst_count': int(db_data.num_analyst_opinions) if db_data.num_analyst_opinions else None,
+        'days_to_cover': float(db_data.days_to_cover) if db_data.days_to_cover is not None else None,
+        'analyst_target': float(db_data.consensus_price_target) if db_data.consensus_price_target is not None else None,
+        'analyst_count': int(db_data.num_analyst_opinions) if db_data.num_analyst_opinions is not None else None,
         'market_cap': market_cap,  # Already in millions
-        'insider_net_shares': int(db_data.insider_net_shares_6m) if db_data.insider_net_shares_6m else None,
+        'insider_net_shares': int(db_data.insider_net_shares_6m) if db_data.insider_net_shares_6m is not None else None,
         # Note: recommendation_mean not in DB, calculator will use neutral score
         'recommendation_mean': None,
     }
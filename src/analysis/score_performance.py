@@ -15,9 +15,13 @@ import bisect
 import logging
 
 import numpy as np
+from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming price history
+PRICE_BATCH_SIZE = 1000
+
 
 @dataclass
 class ScoreReturnPair:
@@ -307,28 +311,25 @@ class ScorePerformanceAnalyzer:
     def _build_price_cache(session) -> Dict[str, Tuple[List[date], List[float]]]:
         """Load all price data into {ticker: (sorted_dates, prices)}.
 
-        Uses sorted lists for efficient bisect-based lookups.
+        Uses sorted lists for efficient bisect-based lookups. Rows are
+        streamed in batches, already ordered by ticker and date (unique per
+        ticker/date), so the lists are appended directly without holding the
+        full result set or re-sorting.
         """
         from database.models import PriceData
 
-        raw: Dict[str, Dict[date, float]] = {}
-        all_prices = (
-            session.query(PriceData.ticker, PriceData.date, PriceData.close)
+        cache: Dict[str, Tuple[List[date], List[float]]] = {}
+        rows = session.execute(
+            select(PriceData.ticker, PriceData.date, PriceData.close)
             .order_by(PriceData.ticker, PriceData.date)
-            .all()
+            .execution_options(yield_per=PRICE_BATCH_SIZE)
         )
-
-        for row in all_prices:
-            if row.ticker not in raw:
-                raw[row.ticker] = {}
-            raw[row.ticker][row.date] = float(row.close)
-
-        # Convert to sorted parallel lists for bisect lookups
-        cache = {}
-        for ticker, date_price_map in raw.items():
-            sorted_dates = sorted(date_price_map.keys())
-            prices = [date_price_map[d] for d in sorted_dates]
-            cache[ticker] = (sorted_dates, prices)
+        for ticker, row_date, close in rows:
+            entry = cache.get(ticker)
+            if entry is None:
+                entry = cache[ticker] = ([], [])
+            entry[0].append(row_date)
+            entry[1].append(float(close))
 
         return cache
 
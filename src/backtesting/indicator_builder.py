@@ -108,14 +108,16 @@ class IndicatorBuilder:
     def _calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate RSI (Relative Strength Index).
 
-        Uses the simple moving average method (same as existing calculator).
+        Uses Wilder's smoothing (same as existing calculator): average
+        gain/loss are seeded with the simple mean of the first `period`
+        changes, then updated as avg + (value - avg) / period.
         """
         delta = prices.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        gain = delta.clip(lower=0)
+        loss = (-delta).clip(lower=0)
 
-        avg_gain = gain.rolling(window=period, min_periods=period).mean()
-        avg_loss = loss.rolling(window=period, min_periods=period).mean()
+        avg_gain = _wilder_average(gain, period)
+        avg_loss = _wilder_average(loss, period)
 
         rs = avg_gain / avg_loss
         return 100 - (100 / (1 + rs))
@@ -239,6 +241,15 @@ class IndicatorBuilder:
                 snapshot['sector_relative_6m'] = mom_6m - sector_avgs[sector]
 
 
+def _wilder_average(values: pd.Series, period: int) -> pd.Series:
+    """Wilder-smoothed average of per-day changes (first row is the NaN diff)."""
+    seeded = values.copy()
+    seeded.iloc[:period] = np.nan
+    if len(values) > period:
+        seeded.iloc[period] = values.iloc[1:period + 1].mean()
+    return seeded.ewm(alpha=1 / period, adjust=False).mean()
+
+
 def _safe_float(val) -> Optional[float]:
     """Convert a value to float, returning None for NaN/None."""
     if val is None:
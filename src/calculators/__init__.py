@@ -13,8 +13,10 @@ All calculators use percentile ranking (Section 1.2)
 from .percentile import (
     percentile_rank,
     percentile_rank_inverted,
+    percentile_rank_array,
     rank_universe,
     average_percentile_ranks,
+    average_percentile_ranks_array,
     validate_percentile_score,
     handle_missing_data
 )
@@ -22,8 +24,10 @@ from .percentile import (
 __all__ = [
     'percentile_rank',
     'percentile_rank_inverted',
+    'percentile_rank_array',
     'rank_universe',
     'average_percentile_ranks',
+    'average_percentile_ranks_array',
     'validate_percentile_score',
     'handle_missing_data'
 ]
@@ -18,7 +18,9 @@ import logging
 from .percentile import (
     percentile_rank,
     percentile_rank_inverted,
-    average_percentile_ranks
+    percentile_rank_array,
+    average_percentile_ranks,
+    average_percentile_ranks_array
 )
 
 logger = logging.getLogger(__name__)
@@ -40,6 +42,20 @@ class FundamentalCalculator:
         self.QUALITY_WEIGHT = 0.33
         self.GROWTH_WEIGHT = 0.34
 
+    # (metric, inverted) pairs per sub-component, in the order the
+    # per-stock methods below rank them
+    VALUE_METRICS = (
+        ('pe_ratio', True), ('pb_ratio', True), ('ps_ratio', True),
+        ('ev_ebitda', True), ('dividend_yield', False),
+    )
+    QUALITY_METRICS = (
+        ('roe', False), ('roa', False), ('net_margin', False),
+        ('operating_margin', False), ('gross_margin', False),
+    )
+    GROWTH_METRICS = (
+        ('revenue_growth', False), ('earnings_growth', False), ('fcf_growth', False),
+    )
+
     def calculate_value_score(
         self,
         stock_metrics: Dict[str, float],
@@ -341,6 +357,81 @@ class FundamentalCalculator:
             'fundamental_score': fundamental_score
         }
 
+    def calculate_fundamental_scores_bulk(
+        self,
+        stocks: Dict[str, Dict[str, float]],
+        universe_metrics: Dict[str, List[float]]
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Calculate fundamental scores for many stocks at once.
+
+        Produces the same result as calling calculate_fundamental_score for
+        each stock, but ranks every metric column against its universe in a
+        single vectorized pass instead of once per stock.
+
+        Args:
+            stocks: {ticker: stock_metrics} for all stocks to score
+            universe_metrics: Dict with lists of all universe values for each metric
+
+        Returns:
+            {ticker: result} where result has the same keys as
+            calculate_fundamental_score
+        """
+        tickers = list(stocks)
+        if not tickers:
+            return {}
+
+        # Struct-of-arrays view of the stocks: one contiguous float column
+        # per metric, aligned with tickers, built in a single conversion.
+        # Zero/None stock values are skipped (NaN), as in the per-stock path.
+        metrics = [
+            metric
+            for specs in (self.VALUE_METRICS, self.QUALITY_METRICS, self.GROWTH_METRICS)
+            for metric, _ in specs
+        ]
+        matrix = np.array(
+            [[stocks[t].get(metric) for metric in metrics] for t in tickers],
+            dtype=np.float64,
+        )
+        matrix[matrix == 0] = np.nan
+        columns_by_metric = dict(zip(metrics, np.ascontiguousarray(matrix.T)))
+
+        def component_scores(metric_specs) -> np.ndarray:
+            columns = []
+            for metric, inverted in metric_specs:
+                values = columns_by_metric[metric]
+                if universe_metrics.get(metric):
+                    columns.append(percentile_rank_array(
+                        values, universe_metrics[metric], inverted=inverted
+                    ))
+                else:
+                    columns.append(np.full(len(tickers), np.nan))
+            return average_percentile_ranks_array(np.column_stack(columns))
+
+        sub_scores = np.column_stack([
+            component_scores(self.VALUE_METRICS),
+            component_scores(self.QUALITY_METRICS),
+            component_scores(self.GROWTH_METRICS),
+        ])
+        fundamental = average_percentile_ranks_array(
+            sub_scores, [self.VALUE_WEIGHT, self.QUALITY_WEIGHT, self.GROWTH_WEIGHT]
+        )
+
+        def to_optional(x: float) -> Optional[float]:
+            return None if np.isnan(x) else x
+
+        return {
+            ticker: {
+                'value_score': to_optional(value),
+                'quality_score': to_optional(quality),
+                'growth_score': to_optional(growth),
+                'fundamental_score': to_optional(fund),
+            }
+            for ticker, (value, quality, growth), fund in zip(
+                tickers, sub_scores.tolist(), fundamental.tolist()
+            )
+        }
+
 
 def extract_fundamental_metrics_from_db(fundamental_data_row) -> Dict[str, float]:
     """
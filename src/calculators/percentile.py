@@ -18,6 +18,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _clean_universe(universe: List[Optional[float]]) -> np.ndarray:
+    """
+    Convert a universe list to a float array with None/NaN removed.
+
+    The float conversion maps None to NaN in C, so a single mask drops both
+    without a Python-level loop over the universe on every ranking call.
+    """
+    universe_array = np.asarray(universe, dtype=np.float64)
+    return universe_array[~np.isnan(universe_array)]
+
+
 def percentile_rank(
     value: float,
     universe: List[float],
@@ -55,7 +66,7 @@ def percentile_rank(
         return None
 
     # Convert to numpy array and filter out None/NaN values
-    universe_array = np.array([v for v in universe if v is not None and not np.isnan(v)])
+    universe_array = _clean_universe(universe)
 
     if len(universe_array) == 0:
         logger.warning("Universe contains only None/NaN values")
@@ -115,7 +126,7 @@ def percentile_rank_inverted(
         return None
 
     # Convert to numpy array and filter out None/NaN values
-    universe_array = np.array([v for v in universe if v is not None and not np.isnan(v)])
+    universe_array = _clean_universe(universe)
 
     if len(universe_array) == 0:
         logger.warning("Universe contains only None/NaN values")
@@ -139,6 +150,84 @@ def percentile_rank_inverted(
     return round(rank, 2)
 
 
+def percentile_rank_array(
+    values: np.ndarray,
+    universe: List[float],
+    inverted: bool = False
+) -> np.ndarray:
+    """
+    Vectorized percentile rank of many values against one universe.
+
+    Same ranking rule as percentile_rank / percentile_rank_inverted, applied
+    to a whole column of stock values in one pass instead of one call per
+    stock.
+
+    Args:
+        values: Array of values to rank (NaN for missing)
+        universe: List of all values in the universe (None/NaN are ignored)
+        inverted: If True, lower is better (count values ABOVE instead)
+
+    Returns:
+        Array of percentile ranks (0-100) aligned with values, NaN where the
+        value is missing or the universe has no valid values
+
+    Example:
+        >>> percentile_rank_array(np.array([35.0, np.nan]), [10, 20, 30, 40, 50])
+        array([60., nan])
+    """
+    values = np.asarray(values, dtype=np.float64)
+    universe_array = _clean_universe(universe)
+
+    if universe_array.size == 0:
+        return np.full(values.shape, np.nan)
+
+    # Sort once, then binary-search every value: O((N + U) log U) instead
+    # of comparing each value against the whole universe
+    sorted_universe = np.sort(universe_array)
+    if inverted:
+        counts = sorted_universe.size - np.searchsorted(sorted_universe, values, side='right')
+    else:
+        counts = np.searchsorted(sorted_universe, values, side='left')
+
+    ranks = np.round(counts / universe_array.size * 100, 2)
+    return np.where(np.isnan(values), np.nan, ranks)
+
+
+def average_percentile_ranks_array(
+    ranks: np.ndarray,
+    weights: Optional[List[float]] = None
+) -> np.ndarray:
+    """
+    Row-wise weighted average of percentile ranks.
+
+    Vectorized counterpart of average_percentile_ranks: each row of an
+    (N, M) rank matrix is averaged over its non-NaN entries, with weights
+    re-normalized per row.
+
+    Args:
+        ranks: (N, M) array of percentile ranks, NaN for missing
+        weights: Optional weights for the M columns (equal if None)
+
+    Returns:
+        (N,) array of averaged ranks, NaN for rows with no valid ranks
+    """
+    ranks = np.asarray(ranks, dtype=np.float64)
+    if weights is None:
+        weights = [1.0] * ranks.shape[1]
+
+    valid = ~np.isnan(ranks)
+    row_weights = np.where(valid, np.asarray(weights, dtype=np.float64), 0.0)
+    totals = row_weights.sum(axis=1)
+    has_data = totals > 0
+
+    normalized = np.divide(
+        row_weights, totals[:, np.newaxis],
+        out=np.zeros_like(row_weights), where=has_data[:, np.newaxis]
+    )
+    avg = np.round((np.where(valid, ranks, 0.0) * normalized).sum(axis=1), 2)
+    return np.where(has_data, avg, np.nan)
+
+
 def rank_universe(
     values: List[Optional[float]],
     inverted: bool = False
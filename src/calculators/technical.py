@@ -482,17 +482,17 @@ def extract_technical_metrics_from_db(
         Dict with metric names and values for calculator
     """
     # Get values from database row (using actual column names)
-    sma_20 = float(technical_indicator_row.sma_20) if technical_indicator_row.sma_20 else None
-    sma_50 = float(technical_indicator_row.sma_50) if technical_indicator_row.sma_50 else None
-    sma_200 = float(technical_indicator_row.sma_200) if technical_indicator_row.sma_200 else None
-    mad = float(technical_indicator_row.mad) if technical_indicator_row.mad else None
+    sma_20 = float(technical_indicator_row.sma_20) if technical_indicator_row.sma_20 is not None else None
+    sma_50 = float(technical_indicator_row.sma_50) if technical_indicator_row.sma_50 is not None else None
+    sma_200 = float(technical_indicator_row.sma_200) if technical_indicator_row.sma_200 is not None else None
+    mad = float(technical_indicator_row.mad) if technical_indicator_row.mad is not None else None
 
-    momentum_12_1 = float(technical_indicator_row.momentum_12_1) if technical_indicator_row.momentum_12_1 else None
-    momentum_6m = float(technical_indicator_row.momentum_6m) if technical_indicator_row.momentum_6m else None
+    momentum_12_1 = float(technical_indicator_row.momentum_12_1) if technical_indicator_row.momentum_12_1 is not None else None
+    momentum_6m = float(technical_indicator_row.momentum_6m) if technical_indicator_row.momentum_6m is not None else None
 
-    rsi_14 = float(technical_indicator_row.rsi_14) if technical_indicator_row.rsi_14 else None
+    rsi_14 = float(technical_indicator_row.rsi_14) if technical_indicator_row.rsi_14 is not None else None
 
-    relative_volume = float(technical_indicator_row.relative_volume) if technical_indicator_row.relative_volume else None
+    relative_volume = float(technical_indicator_row.relative_volume) if technical_indicator_row.relative_volume is not None else None
     price_vs_200ma_binary = technical_indicator_row.price_vs_200ma
 
     # Calculate multi-speed trend signals
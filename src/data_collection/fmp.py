@@ -11,11 +11,17 @@ Insider trading endpoints require premium (402).
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
 import os
+import time
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, date
 import logging
 
+from utils.cache import read_cache, write_cache
 from utils.rate_limiter import RateLimiter
 from utils.validators import (
     validate_numeric,
@@ -26,6 +32,10 @@ from utils.validators import (
 logger = logging.getLogger(__name__)
 
 
+# Bump when the cached response format changes
+FMP_CACHE_VERSION = 1
+
+
 class FMPCollector:
     """
     Collects analyst data from Financial Modeling Prep API.
@@ -38,12 +48,25 @@ class FMPCollector:
 
     BASE_URL = "https://financialmodelingprep.com/stable"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Grades and estimates change at most a few times a day
+    CACHE_TTL = timedelta(hours=6)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: timedelta = CACHE_TTL,
+    ):
         """
         Initialize FMP collector.
 
         Args:
             api_key: FMP API key (defaults to FMP_API_KEY env var)
+            cache_dir: Optional directory caching successful responses by
+                       endpoint and parameters. Cached responses are
+                       served without an API call until cache_ttl expires.
+                       None disables caching.
+            cache_ttl: How long a cached response stays fresh.
         """
         self.api_key = api_key or os.getenv('FMP_API_KEY')
         if not self.api_key:
@@ -56,10 +79,40 @@ class FMPCollector:
         self.rate_limiter = RateLimiter(calls=10, period=60)
         self.logger = logger
 
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+
+        # One keep-alive session for all calls; pool sized for threaded
+        # callers. Only failed connects are retried: those never reach FMP,
+        # whereas a retried read or status would spend extra calls from the
+        # rate limiter's budget inside a single counted slot.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(connect=3, read=0, status=0, other=0, backoff_factor=0.3),
+        )
+        self._session.mount('https://', adapter)
+        self._session.headers.update({'Accept': 'application/json'})
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Dict) -> tuple:
+        """Cache key for a request: format version, endpoint and params (API key excluded)."""
+        return FMP_CACHE_VERSION, endpoint, tuple(sorted(
+            (k, str(v)) for k, v in params.items() if k != 'apikey'
+        ))
+
+    def _cache_file(self, key: tuple) -> Path:
+        """Cache file holding the response for a request key."""
+        return self.cache_dir / f"{hashlib.sha256(repr(key).encode()).hexdigest()}.pkl"
+
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
         """
         Make rate-limited API request to FMP.
 
+        With a cache_dir, a fresh cached response is returned without
+        calling the API (or waiting on the rate limiter).
+
         Args:
             endpoint: API endpoint path (e.g., 'analyst-estimates')
             params: Query parameters
@@ -72,13 +125,24 @@ class FMPCollector:
         """
         if params is None:
             params = {}
+
+        cache_key = cache_file = None
+        if self.cache_dir is not None:
+            cache_key = self._cache_key(endpoint, params)
+            cache_file = self._cache_file(cache_key)
+            cached = read_cache(cache_file, cache_key)
+            if cached is not None:
+                fetched_at, data = cached
+                if time.time() - fetched_at < self.cache_ttl.total_seconds():
+                    return data
+
         params['apikey'] = self.api_key
 
         url = f"{self.BASE_URL}/{endpoint}"
 
         with self.rate_limiter:
             try:
-                response = requests.get(url, params=params, timeout=30)
+                response = self._session.get(url, params=params, timeout=30)
 
                 if response.status_code == 402:
                     raise DataValidationError(
@@ -97,6 +161,8 @@ class FMPCollector:
                         f"FMP API error: {data['Error Message']}"
                     )
 
+                if cache_file is not None:
+                    write_cache(cache_file, cache_key, (time.time(), data))
                 return data
 
             except requests.exceptions.RequestException as e:
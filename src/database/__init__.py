@@ -4,6 +4,7 @@ Provides database connection and session management
 """
 
 import os
+import sys
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
@@ -35,19 +36,33 @@ def get_engine(echo=False):
     """
     Create and return SQLAlchemy engine with connection pooling
 
+    Pool size can be raised for threaded collectors via DB_POOL_SIZE and
+    DB_MAX_OVERFLOW. Connections are pinged on checkout, so a connection
+    dropped by the server is replaced instead of failing the first query.
+
     Args:
         echo (bool): If True, log all SQL statements
 
     Returns:
         Engine: SQLAlchemy engine instance
     """
+    connect_args = {}
+    if DATABASE_URL.startswith('postgresql'):
+        # Name connections after the running script in pg_stat_activity
+        connect_args['application_name'] = os.getenv(
+            'DB_APPLICATION_NAME',
+            os.path.basename(sys.argv[0]) or 'stock_analysis',
+        )
+
     return create_engine(
         DATABASE_URL,
         poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=int(os.getenv('DB_POOL_SIZE', '5')),
+        max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '10')),
         pool_timeout=30,
-        pool_recycle=3600,  # Recycle connections after 1 hour
+        pool_recycle=1800,  # Recycle connections after 30 minutes
+        pool_pre_ping=True,
+        connect_args=connect_args,
         echo=echo
     )
 
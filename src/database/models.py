@@ -6,7 +6,7 @@ Framework Reference: docs/database_schema.md
 
 from sqlalchemy import (
     Column, String, Numeric, Boolean, DateTime, Date, Text,
-    Integer, BigInteger, ForeignKey, UniqueConstraint
+    Integer, BigInteger, ForeignKey, Index, UniqueConstraint
 )
 from sqlalchemy.sql import func
 from . import Base
@@ -54,6 +54,12 @@ class PriceData(Base):
     data_source = Column(String(50))
     created_at = Column(DateTime, server_default=func.now())
 
+    # Mirrors init_db.sql; serves the latest-close-per-ticker window query
+    __table_args__ = (
+        Index('idx_price_ticker_date_close', ticker, date.desc(),
+              postgresql_include=['close']),
+    )
+
     def __repr__(self):
         return f"<PriceData(ticker='{self.ticker}', date='{self.date}', close={self.close})>"
 
@@ -109,6 +115,11 @@ class FundamentalData(Base):
     data_source = Column(String(50))
     created_at = Column(DateTime, server_default=func.now())
 
+    # Mirrors init_db.sql; serves the latest-row-per-ticker window query
+    __table_args__ = (
+        Index('idx_fundamental_ticker_date', ticker, report_date.desc()),
+    )
+
     def __repr__(self):
         return f"<FundamentalData(ticker='{self.ticker}', date='{self.report_date}')>"
 
@@ -150,6 +161,11 @@ class TechnicalIndicator(Base):
 
     created_at = Column(DateTime, server_default=func.now())
 
+    # Mirrors init_db.sql; serves the latest-row-per-ticker window query
+    __table_args__ = (
+        Index('idx_technical_ticker_date', ticker, calculation_date.desc()),
+    )
+
     def __repr__(self):
         return f"<TechnicalIndicator(ticker='{self.ticker}', date='{self.calculation_date}')>"
 
@@ -189,6 +205,11 @@ class SentimentData(Base):
     data_source = Column(String(50))
     created_at = Column(DateTime, server_default=func.now())
 
+    # Mirrors init_db.sql; serves the latest-row-per-ticker window query
+    __table_args__ = (
+        Index('idx_sentiment_ticker_date', ticker, data_date.desc()),
+    )
+
     def __repr__(self):
         return f"<SentimentData(ticker='{self.ticker}', date='{self.data_date}')>"
 
@@ -21,6 +21,8 @@ from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 
 class Recommendation(Enum):
     """Stock recommendation levels based on percentile thresholds.
@@ -61,11 +63,41 @@ class Recommendation(Enum):
         else:
             return cls.STRONG_SELL
 
+    @classmethod
+    def counts(cls, recommendations: List['Recommendation']) -> Dict['Recommendation', int]:
+        """Count recommendations by level in one pass.
+
+        Maps each member to its integer code and tallies the codes with
+        np.bincount, instead of comparing every element against every level.
+
+        Args:
+            recommendations: Recommendation members (any iterable sized by len)
 
-@dataclass
+        Returns:
+            {Recommendation: count} for every level, in declaration order
+        """
+        members = list(cls)
+        codes = np.fromiter(
+            (_RECOMMENDATION_CODES[r] for r in recommendations),
+            dtype=np.int8, count=len(recommendations),
+        )
+        tallies = np.bincount(codes, minlength=len(members))
+        return dict(zip(members, tallies.tolist()))
+
+
+# Stable integer code per recommendation level (declaration order).
+_RECOMMENDATION_CODES: Dict[Recommendation, int] = {
+    rec: code for code, rec in enumerate(Recommendation)
+}
+
+
+@dataclass(slots=True)
 class CompositeScore:
     """Container for composite scoring results.
 
+    Slotted: one instance is built per stock in the universe, so dropping
+    the per-instance __dict__ keeps large universes compact.
+
     Attributes:
         ticker: Stock ticker symbol
         fundamental_score: Fundamental pillar score (0-100)
@@ -277,45 +309,67 @@ class CompositeScoreCalculator:
         Returns:
             List of CompositeScore objects, sorted by composite_percentile (descending)
         """
-        # Step 1: Calculate raw composite scores for all stocks
-        composites = {}
-        for ticker, scores in stock_scores.items():
-            composite_score = self.calculate_composite_score(
-                fundamental_score=scores['fundamental'],
-                technical_score=scores['technical'],
-                sentiment_score=scores['sentiment']
-            )
-            composites[ticker] = {
-                'fundamental': scores['fundamental'],
-                'technical': scores['technical'],
-                'sentiment': scores['sentiment'],
-                'composite': composite_score
-            }
+        tickers = list(stock_scores)
+        scores = np.array(
+            [[s['fundamental'], s['technical'], s['sentiment']]
+             for s in stock_scores.values()],
+            dtype=np.float64,
+        ).reshape(len(tickers), 3)
+        return self.calculate_scores_for_universe_array(tickers, scores)
+
+    def calculate_scores_for_universe_array(
+        self,
+        tickers: List[str],
+        scores: np.ndarray
+    ) -> List[CompositeScore]:
+        """Calculate composite scores from an (N, 3) pillar score matrix.
 
-        # Step 2: Calculate percentile ranks for composite scores within universe
-        all_composite_scores = [data['composite'] for data in composites.values()]
+        Array form of calculate_scores_for_universe for callers that already
+        hold pillar scores column-wise.
 
-        # Step 3: Create CompositeScore objects with percentiles and recommendations
-        results = []
-        for ticker, scores in composites.items():
-            percentile = self.calculate_percentile_rank(
-                scores['composite'],
-                all_composite_scores
-            )
+        Args:
+            tickers: Ticker for each row of scores
+            scores: Array of shape (N, 3) with fundamental, technical and
+                sentiment columns, aligned with tickers
+
+        Returns:
+            List of CompositeScore objects, sorted by composite_percentile (descending)
+        """
+        n = len(tickers)
+        if n == 0:
+            return []
+
+        # Step 1: Calculate raw composite scores for all stocks. Spelled out
+        # per column (not scores @ weights) so the rounding matches
+        # calculate_composite_score exactly; BLAS may fuse or reorder.
+        fundamental, technical, sentiment = scores[:, 0], scores[:, 1], scores[:, 2]
+        composite = (
+            fundamental * self.fundamental_weight +
+            technical * self.technical_weight +
+            sentiment * self.sentiment_weight
+        )
 
-            recommendation = Recommendation.from_percentile(percentile)
+        # Step 2: Calculate percentile ranks for composite scores within universe.
+        # Sorting once and binary-searching gives the same "count strictly
+        # below / universe size" rank as calculate_percentile_rank in O(N log N).
+        count_below = np.searchsorted(np.sort(composite), composite, side='left')
+        percentiles = count_below / n * 100
 
-            result = CompositeScore(
+        # Step 3: Create CompositeScore objects with percentiles and recommendations
+        results = [
+            CompositeScore(
                 ticker=ticker,
-                fundamental_score=scores['fundamental'],
-                technical_score=scores['technical'],
-                sentiment_score=scores['sentiment'],
-                composite_score=scores['composite'],
+                fundamental_score=fund,
+                technical_score=tech,
+                sentiment_score=sent,
+                composite_score=composite_score,
                 composite_percentile=percentile,
-                recommendation=recommendation
+                recommendation=Recommendation.from_percentile(percentile)
             )
-
-            results.append(result)
+            for ticker, (fund, tech, sent), composite_score, percentile in zip(
+                tickers, scores.tolist(), composite.tolist(), percentiles.tolist()
+            )
+        ]
 
         # Step 4: Sort by percentile (descending - best stocks first)
         results.sort(key=lambda x: x.composite_percentile, reverse=True)
@@ -358,11 +412,12 @@ class CompositeScoreCalculator:
         report_lines.append("=" * 100)
 
         # Summary statistics
-        strong_buys = sum(1 for r in results if r.recommendation == Recommendation.STRONG_BUY)
-        buys = sum(1 for r in results if r.recommendation == Recommendation.BUY)
-        holds = sum(1 for r in results if r.recommendation == Recommendation.HOLD)
-        sells = sum(1 for r in results if r.recommendation == Recommendation.SELL)
-        strong_sells = sum(1 for r in results if r.recommendation == Recommendation.STRONG_SELL)
+        rec_counts = Recommendation.counts([r.recommendation for r in results])
+        strong_buys = rec_counts[Recommendation.STRONG_BUY]
+        buys = rec_counts[Recommendation.BUY]
+        holds = rec_counts[Recommendation.HOLD]
+        sells = rec_counts[Recommendation.SELL]
+        strong_sells = rec_counts[Recommendation.STRONG_SELL]
 
         report_lines.extend([
             "",
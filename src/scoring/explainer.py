@@ -107,22 +107,27 @@ class ScoreExplainer:
 
     @staticmethod
     def _load_fundamental(ticker: str, session: Session) -> Optional[Dict]:
-        row = session.query(FundamentalData).filter_by(ticker=ticker).first()
+        row = (
+            session.query(FundamentalData)
+            .filter_by(ticker=ticker)
+            .order_by(FundamentalData.report_date.desc(), FundamentalData.id.desc())
+            .first()
+        )
         if not row:
             return None
         return {
-            'pe_ratio': float(row.pe_ratio) if row.pe_ratio else None,
-            'pb_ratio': float(row.pb_ratio) if row.pb_ratio else None,
-            'ps_ratio': float(row.ps_ratio) if row.ps_ratio else None,
-            'ev_to_ebitda': float(row.ev_to_ebitda) if row.ev_to_ebitda else None,
-            'dividend_yield': float(row.dividend_yield) if row.dividend_yield else None,
-            'roe': float(row.roe) if row.roe else None,
-            'roa': float(row.roa) if row.roa else None,
-            'net_margin': float(row.net_margin) if row.net_margin else None,
-            'operating_margin': float(row.operating_margin) if row.operating_margin else None,
-            'gross_margin': float(row.gross_margin) if row.gross_margin else None,
-            'revenue_growth_yoy': float(row.revenue_growth_yoy) if row.revenue_growth_yoy else None,
-            'eps_growth_yoy': float(row.eps_growth_yoy) if row.eps_growth_yoy else None,
+            'pe_ratio': float(row.pe_ratio) if row.pe_ratio is not None else None,
+            'pb_ratio': float(row.pb_ratio) if row.pb_ratio is not None else None,
+            'ps_ratio': float(row.ps_ratio) if row.ps_ratio is not None else None,
+            'ev_to_ebitda': float(row.ev_to_ebitda) if row.ev_to_ebitda is not None else None,
+            'dividend_yield': float(row.dividend_yield) if row.dividend_yield is not None else None,
+            'roe': float(row.roe) if row.roe is not None else None,
+            'roa': float(row.roa) if row.roa is not None else None,
+            'net_margin': float(row.net_margin) if row.net_margin is not None else None,
+            'operating_margin': float(row.operating_margin) if row.operating_margin is not None else None,
+            'gross_margin': float(row.gross_margin) if row.gross_margin is not None else None,
+            'revenue_growth_yoy': float(row.revenue_growth_yoy) if row.revenue_growth_yoy is not None else None,
+            'eps_growth_yoy': float(row.eps_growth_yoy) if row.eps_growth_yoy is not None else None,
         }
 
     @staticmethod
@@ -153,24 +158,29 @@ class ScoreExplainer:
 
     @staticmethod
     def _load_sentiment(ticker: str, session: Session) -> Optional[Dict]:
-        row = session.query(SentimentData).filter_by(ticker=ticker).first()
+        row = (
+            session.query(SentimentData)
+            .filter_by(ticker=ticker)
+            .order_by(SentimentData.data_date.desc())
+            .first()
+        )
         if not row:
             return None
         return {
-            'days_to_cover': float(row.days_to_cover) if row.days_to_cover else None,
-            'consensus_price_target': float(row.consensus_price_target) if row.consensus_price_target else None,
-            'num_buy_ratings': int(row.num_buy_ratings) if row.num_buy_ratings else None,
-            'num_hold_ratings': int(row.num_hold_ratings) if row.num_hold_ratings else None,
-            'num_sell_ratings': int(row.num_sell_ratings) if row.num_sell_ratings else None,
-            'num_analyst_opinions': int(row.num_analyst_opinions) if row.num_analyst_opinions else None,
-            'upgrades_30d': int(row.upgrades_30d) if row.upgrades_30d else None,
-            'downgrades_30d': int(row.downgrades_30d) if row.downgrades_30d else None,
-            'estimate_revisions_up_90d': int(row.estimate_revisions_up_90d) if row.estimate_revisions_up_90d else None,
-            'estimate_revisions_down_90d': int(row.estimate_revisions_down_90d) if row.estimate_revisions_down_90d else None,
-            'insider_buys_6m': int(row.insider_buys_6m) if row.insider_buys_6m else None,
-            'insider_sells_6m': int(row.insider_sells_6m) if row.insider_sells_6m else None,
-            'insider_net_shares_6m': int(row.insider_net_shares_6m) if row.insider_net_shares_6m else None,
-            'short_interest_pct': float(row.short_interest_pct) if row.short_interest_pct else None,
+            'days_to_cover': float(row.days_to_cover) if row.days_to_cover is not None else None,
+            'consensus_price_target': float(row.consensus_price_target) if row.consensus_price_target is not None else None,
+            'num_buy_ratings': int(row.num_buy_ratings) if row.num_buy_ratings is not None else None,
+            'num_hold_ratings': int(row.num_hold_ratings) if row.num_hold_ratings is not None else None,
+            'num_sell_ratings': int(row.num_sell_ratings) if row.num_sell_ratings is not None else None,
+            'num_analyst_opinions': int(row.num_analyst_opinions) if row.num_analyst_opinions is not None else None,
+            'upgrades_30d': int(row.upgrades_30d) if row.upgrades_30d is not None else None,
+            'downgrades_30d': int(row.downgrades_30d) if row.downgrades_30d is not None else None,
+            'estimate_revisions_up_90d': int(row.estimate_revisions_up_90d) if row.estimate_revisions_up_90d is not None else None,
+            'estimate_revisions_down_90d': int(row.estimate_revisions_down_90d) if row.estimate_revisions_down_90d is not None else None,
+            'insider_buys_6m': int(row.insider_buys_6m) if row.insider_buys_6m is not None else None,
+            'insider_sells_6m': int(row.insider_sells_6m) if row.insider_sells_6m is not None else None,
+            'insider_net_shares_6m': int(row.insider_net_shares_6m) if row.insider_net_shares_6m is not None else None,
+            'short_interest_pct': float(row.short_interest_pct) if row.short_interest_pct is not None else None,
         }
 
     @staticmethod
@@ -185,12 +195,12 @@ class ScoreExplainer:
         return {
             'market_sentiment_score': float(row.market_sentiment_score),
             'num_indicators_available': int(row.num_indicators_available),
-            'vix_score': float(row.vix_score) if row.vix_score else None,
-            'putcall_score': float(row.putcall_score) if row.putcall_score else None,
-            'fund_flows_score': float(row.fund_flows_score) if row.fund_flows_score else None,
-            'aaii_score': float(row.aaii_score) if row.aaii_score else None,
-            'vix_value': float(row.vix_value) if row.vix_value else None,
-            'putcall_ratio': float(row.putcall_ratio) if row.putcall_ratio else None,
+            'vix_score': float(row.vix_score) if row.vix_score is not None else None,
+            'putcall_score': float(row.putcall_score) if row.putcall_score is not None else None,
+            'fund_flows_score': float(row.fund_flows_score) if row.fund_flows_score is not None else None,
+            'aaii_score': float(row.aaii_score) if row.aaii_score is not None else None,
+            'vix_value': float(row.vix_value) if row.vix_value is not None else None,
+            'putcall_ratio': float(row.putcall_ratio) if row.putcall_ratio is not None else None,
         }
 
     @staticmethod
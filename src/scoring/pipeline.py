@@ -17,11 +17,16 @@ Author: Stock Analysis Framework v2.0
 Date: 2026-02-14
 """
 
-import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+import orjson
+import pandas as pd
+from sqlalchemy import Float, and_, func, select, type_coerce
 from sqlalchemy.orm import Session
 
 from calculators.fundamental import FundamentalCalculator
@@ -32,6 +37,144 @@ from database.models import (
     PriceData, MarketSentiment, StockScore
 )
 from models.composite import CompositeScoreCalculator, CompositeScore, Recommendation
+from utils.cache import read_cache, write_cache
+
+
+# Columns loaded per pillar table, with the Python type each value is
+# converted to (Numeric columns arrive as Decimal). NULL stays None; zero
+# is a real value and is kept.
+_FUNDAMENTAL_FIELDS: Tuple[Tuple[str, Callable], ...] = (
+    ('pe_ratio', float), ('pb_ratio', float), ('ps_ratio', float),
+    ('ev_to_ebitda', float), ('dividend_yield', float), ('roe', float),
+    ('roa', float), ('net_margin', float), ('operating_margin', float),
+    ('gross_margin', float), ('revenue_growth_yoy', float),
+    ('eps_growth_yoy', float),
+)
+_TECHNICAL_FIELDS: Tuple[Tuple[str, Callable], ...] = (
+    ('sma_20', float), ('sma_50', float), ('sma_200', float), ('mad', float),
+    ('price_vs_200ma', bool), ('momentum_12_1', float), ('momentum_6m', float),
+    ('momentum_3m', float), ('momentum_1m', float), ('avg_volume_20d', float),
+    ('relative_volume', float), ('rsi_14', float), ('adx', float),
+    ('sector_relative_6m', float),
+)
+_SENTIMENT_FIELDS: Tuple[Tuple[str, Callable], ...] = (
+    ('consensus_price_target', float), ('num_buy_ratings', int),
+    ('num_hold_ratings', int), ('num_sell_ratings', int),
+    ('num_analyst_opinions', int), ('upgrades_30d', int),
+    ('downgrades_30d', int), ('estimate_revisions_up_90d', int),
+    ('estimate_revisions_down_90d', int), ('short_interest_pct', float),
+    ('days_to_cover', float), ('insider_buys_6m', int),
+    ('insider_sells_6m', int), ('insider_net_shares_6m', int),
+)
+
+
+# (calculator key, loaded field) pairs mapping pillar records to the
+# calculator input format. Records may omit fields (read with .get()).
+_FUNDAMENTAL_KEY_MAP: Tuple[Tuple[str, str], ...] = (
+    ('pe_ratio', 'pe_ratio'), ('pb_ratio', 'pb_ratio'), ('ps_ratio', 'ps_ratio'),
+    ('ev_ebitda', 'ev_to_ebitda'), ('dividend_yield', 'dividend_yield'),
+    ('roe', 'roe'), ('roa', 'roa'), ('net_margin', 'net_margin'),
+    ('operating_margin', 'operating_margin'), ('gross_margin', 'gross_margin'),
+    ('revenue_growth', 'revenue_growth_yoy'), ('earnings_growth', 'eps_growth_yoy'),
+)
+_SENTIMENT_KEY_MAP: Tuple[Tuple[str, str], ...] = (
+    ('days_to_cover', 'days_to_cover'), ('analyst_target', 'consensus_price_target'),
+    ('analyst_count', 'num_analyst_opinions'), ('market_cap', 'market_cap'),
+    ('insider_net_shares', 'insider_net_shares_6m'), ('upgrades_30d', 'upgrades_30d'),
+    ('downgrades_30d', 'downgrades_30d'),
+    ('estimate_revisions_up_90d', 'estimate_revisions_up_90d'),
+    ('estimate_revisions_down_90d', 'estimate_revisions_down_90d'),
+)
+
+# Metrics whose cross-sectional universe each calculator ranks against.
+_FUNDAMENTAL_UNIVERSE_METRICS: Tuple[str, ...] = (
+    'pe_ratio', 'pb_ratio', 'ps_ratio', 'ev_ebitda', 'dividend_yield',
+    'roe', 'roa', 'net_margin', 'operating_margin', 'gross_margin',
+    'revenue_growth', 'earnings_growth',
+)
+_TECHNICAL_UNIVERSE_METRICS: Tuple[str, ...] = (
+    'sma_50', 'sma_200', 'mad', 'momentum_12_1', 'momentum_6m',
+    'momentum_3m', 'momentum_1m', 'avg_volume_20d', 'relative_volume',
+    'rsi_14', 'adx', 'sector_relative_6m',
+)
+_SENTIMENT_UNIVERSE_METRICS: Tuple[str, ...] = (
+    'recommendation_mean', 'analyst_count', 'analyst_target',
+    'days_to_cover', 'market_cap', 'insider_net_shares',
+)
+
+
+def _columns(model, fields: Tuple[Tuple[str, Callable], ...]) -> List:
+    """Mapped columns of model for each field name, in order.
+
+    Float fields are coerced to Float so the driver/result processor hands
+    back floats for Numeric columns in bulk, instead of Decimals that are
+    converted one value at a time in Python.
+    """
+    return [
+        type_coerce(getattr(model, name), Float).label(name)
+        if cast is float else getattr(model, name)
+        for name, cast in fields
+    ]
+
+
+def _latest_per_ticker(
+    model, fields: Tuple[Tuple[str, Callable], ...], order_by: Tuple,
+    tickers: Optional[List[str]] = None,
+):
+    """Select (ticker, *fields) from the newest row of model per ticker.
+
+    Rows are ranked with ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY
+    order_by) and only rank 1 is returned, so older history never leaves
+    the database.
+    """
+    ranked = select(
+        model.ticker,
+        *_columns(model, fields),
+        func.row_number().over(
+            partition_by=model.ticker, order_by=order_by
+        ).label('rn'),
+    )
+    if tickers:
+        ranked = ranked.where(model.ticker.in_(tickers))
+    ranked = ranked.subquery()
+    return select(
+        ranked.c.ticker, *(ranked.c[name] for name, _ in fields)
+    ).where(ranked.c.rn == 1)
+
+
+def _row_to_dict(row, fields: Tuple[Tuple[str, Callable], ...]) -> Dict:
+    """Convert a (ticker, *fields) result row to {field: value}."""
+    return {
+        name: None if value is None else cast(value)
+        for (name, cast), value in zip(fields, row[1:])
+    }
+
+
+# Per-process state for parallel technical scoring (set by the initializer so
+# the universe is pickled once per worker rather than once per task)
+_worker_technical_calc: Optional[TechnicalCalculator] = None
+_worker_technical_universe: Dict[str, List[float]] = {}
+
+
+def _init_technical_worker(universe: Dict[str, List[float]]) -> None:
+    """Process-pool initializer: build the calculator and keep the universe."""
+    global _worker_technical_calc, _worker_technical_universe
+    _worker_technical_calc = TechnicalCalculator()
+    _worker_technical_universe = universe
+
+
+def _score_technical_chunk(chunk: List[Tuple[str, Dict]]) -> Dict[str, Dict]:
+    """Score a chunk of (ticker, metrics) pairs inside a worker process."""
+    return {
+        ticker: _worker_technical_calc.calculate_technical_score(
+            metrics, _worker_technical_universe
+        )
+        for ticker, metrics in chunk
+    }
+
+
+# Bump when calculator or ranking logic changes so cached scores are recomputed
+SCORE_CACHE_VERSION = 1
 
 
 class ScoringPipeline:
@@ -57,16 +200,40 @@ class ScoringPipeline:
         'sentiment': 0.20,
     }
 
-    def __init__(self, weights: Optional[Dict[str, float]] = None, verbose: bool = True):
+    # Rows fetched per round trip when streaming pillar tables in load_data
+    LOAD_BATCH_SIZE = 1000
+
+    # Below this many stocks, process start-up costs more than it saves
+    PARALLEL_MIN_STOCKS = 200
+
+    # load_data() fields that calculate_scores reads (the score cache key)
+    _SCORED_INPUTS = (
+        'tickers', 'fundamental_data', 'technical_data', 'sentiment_data',
+        'latest_prices', 'market_sentiment',
+    )
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        verbose: bool = True,
+        workers: Optional[int] = None,
+        cache_path: Optional[Path] = None,
+    ):
         """Initialize the scoring pipeline.
 
         Args:
             weights: Optional weight overrides. Keys: fundamental, technical, sentiment.
                      Must sum to 1.0. Defaults to 45/35/20.
             verbose: If True, print progress messages during execution.
+            workers: Number of worker processes for per-stock technical
+                     scoring. None or 1 scores in-process.
+            cache_path: Optional pickle file memoizing the last scores by
+                        input digest. None disables caching.
         """
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
         self.verbose = verbose
+        self.workers = workers
+        self.cache_path = Path(cache_path) if cache_path is not None else None
 
         # Initialize calculators
         self._fundamental_calc = FundamentalCalculator()
@@ -100,103 +267,79 @@ class ScoringPipeline:
         """
         self._log("Loading data from database...")
 
-        # Get stocks
-        query = session.query(Stock).filter_by(is_active=True)
+        # Get stocks joined with their latest close in a single query. The
+        # latest close is picked with ROW_NUMBER() over each ticker's prices
+        # (one pass over price_data) rather than a max-date aggregate joined
+        # back to the table.
+        ranked_prices = select(
+            PriceData.ticker,
+            PriceData.close,
+            func.row_number().over(
+                partition_by=PriceData.ticker,
+                order_by=PriceData.date.desc(),
+            ).label('rn'),
+        )
+        if tickers:
+            ranked_prices = ranked_prices.where(PriceData.ticker.in_(tickers))
+        ranked_prices = ranked_prices.subquery()
+        stock_stmt = (
+            select(Stock.ticker, Stock.market_cap, ranked_prices.c.close)
+            .outerjoin(ranked_prices, and_(
+                ranked_prices.c.ticker == Stock.ticker,
+                ranked_prices.c.rn == 1,
+            ))
+            .where(Stock.is_active == True)
+        )
         if tickers:
-            query = query.filter(Stock.ticker.in_(tickers))
-        stocks = query.all()
-        stock_tickers = [s.ticker for s in stocks]
+            stock_stmt = stock_stmt.where(Stock.ticker.in_(tickers))
+        stocks = session.execute(stock_stmt).all()
+        stock_tickers = [ticker for ticker, _, _ in stocks]
         market_caps = {
-            s.ticker: float(s.market_cap) if s.market_cap else None
-            for s in stocks
+            ticker: float(market_cap) if market_cap is not None else None
+            for ticker, market_cap, _ in stocks
+        }
+        latest_prices = {
+            ticker: float(close)
+            for ticker, _, close in stocks
+            if close is not None
         }
         self._log(f"  Loaded {len(stock_tickers)} active stocks")
+        self._log(f"  Loaded {len(latest_prices)} latest prices")
 
-        # Fundamental data
-        fund_query = session.query(FundamentalData)
-        if tickers:
-            fund_query = fund_query.filter(FundamentalData.ticker.in_(tickers))
-        fundamental_data = {}
-        for fd in fund_query.all():
-            fundamental_data[fd.ticker] = {
-                'pe_ratio': float(fd.pe_ratio) if fd.pe_ratio else None,
-                'pb_ratio': float(fd.pb_ratio) if fd.pb_ratio else None,
-                'ps_ratio': float(fd.ps_ratio) if fd.ps_ratio else None,
-                'ev_to_ebitda': float(fd.ev_to_ebitda) if fd.ev_to_ebitda else None,
-                'dividend_yield': float(fd.dividend_yield) if fd.dividend_yield else None,
-                'roe': float(fd.roe) if fd.roe else None,
-                'roa': float(fd.roa) if fd.roa else None,
-                'net_margin': float(fd.net_margin) if fd.net_margin else None,
-                'operating_margin': float(fd.operating_margin) if fd.operating_margin else None,
-                'gross_margin': float(fd.gross_margin) if fd.gross_margin else None,
-                'revenue_growth_yoy': float(fd.revenue_growth_yoy) if fd.revenue_growth_yoy else None,
-                'eps_growth_yoy': float(fd.eps_growth_yoy) if fd.eps_growth_yoy else None,
-            }
+        # Pillar tables keep a history per ticker; each load selects only the
+        # latest row per ticker in SQL (column-level select: plain rows, no
+        # ORM identity map; streamed in LOAD_BATCH_SIZE chunks)
+        fund_stmt = _latest_per_ticker(
+            FundamentalData, _FUNDAMENTAL_FIELDS,
+            (FundamentalData.report_date.desc(), FundamentalData.id.desc()),
+            tickers,
+        ).execution_options(yield_per=self.LOAD_BATCH_SIZE)
+        fundamental_data = {
+            row[0]: _row_to_dict(row, _FUNDAMENTAL_FIELDS)
+            for row in session.execute(fund_stmt)
+        }
         self._log(f"  Loaded {len(fundamental_data)} fundamental records")
 
-        # Technical indicators - latest record per ticker
-        tech_query = session.query(TechnicalIndicator).order_by(
-            TechnicalIndicator.ticker, TechnicalIndicator.calculation_date.desc()
-        )
-        if tickers:
-            tech_query = tech_query.filter(TechnicalIndicator.ticker.in_(tickers))
-        technical_data = {}
-        for ti in tech_query.all():
-            if ti.ticker in technical_data:
-                continue  # Keep only latest
-            technical_data[ti.ticker] = {
-                'sma_20': float(ti.sma_20) if ti.sma_20 is not None else None,
-                'sma_50': float(ti.sma_50) if ti.sma_50 is not None else None,
-                'sma_200': float(ti.sma_200) if ti.sma_200 is not None else None,
-                'mad': float(ti.mad) if ti.mad is not None else None,
-                'price_vs_200ma': ti.price_vs_200ma if ti.price_vs_200ma is not None else None,
-                'momentum_12_1': float(ti.momentum_12_1) if ti.momentum_12_1 is not None else None,
-                'momentum_6m': float(ti.momentum_6m) if ti.momentum_6m is not None else None,
-                'momentum_3m': float(ti.momentum_3m) if ti.momentum_3m is not None else None,
-                'momentum_1m': float(ti.momentum_1m) if ti.momentum_1m is not None else None,
-                'avg_volume_20d': float(ti.avg_volume_20d) if ti.avg_volume_20d is not None else None,
-                'relative_volume': float(ti.relative_volume) if ti.relative_volume is not None else None,
-                'rsi_14': float(ti.rsi_14) if ti.rsi_14 is not None else None,
-                'adx': float(ti.adx) if ti.adx is not None else None,
-                'sector_relative_6m': float(ti.sector_relative_6m) if ti.sector_relative_6m is not None else None,
-            }
+        tech_stmt = _latest_per_ticker(
+            TechnicalIndicator, _TECHNICAL_FIELDS,
+            (TechnicalIndicator.calculation_date.desc(),),
+            tickers,
+        ).execution_options(yield_per=self.LOAD_BATCH_SIZE)
+        technical_data = {
+            row[0]: _row_to_dict(row, _TECHNICAL_FIELDS)
+            for row in session.execute(tech_stmt)
+        }
         self._log(f"  Loaded {len(technical_data)} technical records")
 
-        # Latest prices
-        latest_prices = {}
-        for ticker in stock_tickers:
-            latest = (
-                session.query(PriceData)
-                .filter(PriceData.ticker == ticker)
-                .order_by(PriceData.date.desc())
-                .first()
-            )
-            if latest:
-                latest_prices[ticker] = float(latest.close)
-        self._log(f"  Loaded {len(latest_prices)} latest prices")
-
-        # Sentiment data
-        sent_query = session.query(SentimentData)
-        if tickers:
-            sent_query = sent_query.filter(SentimentData.ticker.in_(tickers))
-        sentiment_data = {}
-        for sd in sent_query.all():
-            sentiment_data[sd.ticker] = {
-                'consensus_price_target': float(sd.consensus_price_target) if sd.consensus_price_target else None,
-                'num_buy_ratings': int(sd.num_buy_ratings) if sd.num_buy_ratings else None,
-                'num_hold_ratings': int(sd.num_hold_ratings) if sd.num_hold_ratings else None,
-                'num_sell_ratings': int(sd.num_sell_ratings) if sd.num_sell_ratings else None,
-                'num_analyst_opinions': int(sd.num_analyst_opinions) if sd.num_analyst_opinions else None,
-                'upgrades_30d': int(sd.upgrades_30d) if sd.upgrades_30d else None,
-                'downgrades_30d': int(sd.downgrades_30d) if sd.downgrades_30d else None,
-                'estimate_revisions_up_90d': int(sd.estimate_revisions_up_90d) if sd.estimate_revisions_up_90d else None,
-                'estimate_revisions_down_90d': int(sd.estimate_revisions_down_90d) if sd.estimate_revisions_down_90d else None,
-                'short_interest_pct': float(sd.short_interest_pct) if sd.short_interest_pct else None,
-                'days_to_cover': float(sd.days_to_cover) if sd.days_to_cover else None,
-                'insider_buys_6m': int(sd.insider_buys_6m) if sd.insider_buys_6m else None,
-                'insider_sells_6m': int(sd.insider_sells_6m) if sd.insider_sells_6m else None,
-                'insider_net_shares_6m': int(sd.insider_net_shares_6m) if sd.insider_net_shares_6m else None,
-            }
+        sent_stmt = _latest_per_ticker(
+            SentimentData, _SENTIMENT_FIELDS,
+            (SentimentData.data_date.desc(),),
+            tickers,
+        ).execution_options(yield_per=self.LOAD_BATCH_SIZE)
+        sentiment_data = {
+            row[0]: _row_to_dict(row, _SENTIMENT_FIELDS)
+            for row in session.execute(sent_stmt)
+        }
         self._log(f"  Loaded {len(sentiment_data)} sentiment records")
 
         # Enrich: add current_price to technical data
@@ -221,10 +364,10 @@ class ScoringPipeline:
                 'date': ms_record.date,
                 'market_sentiment_score': float(ms_record.market_sentiment_score),
                 'num_indicators_available': int(ms_record.num_indicators_available),
-                'vix_score': float(ms_record.vix_score) if ms_record.vix_score else None,
-                'aaii_score': float(ms_record.aaii_score) if ms_record.aaii_score else None,
-                'putcall_score': float(ms_record.putcall_score) if ms_record.putcall_score else None,
-                'fund_flows_score': float(ms_record.fund_flows_score) if ms_record.fund_flows_score else None,
+                'vix_score': float(ms_record.vix_score) if ms_record.vix_score is not None else None,
+                'aaii_score': float(ms_record.aaii_score) if ms_record.aaii_score is not None else None,
+                'putcall_score': float(ms_record.putcall_score) if ms_record.putcall_score is not None else None,
+                'fund_flows_score': float(ms_record.fund_flows_score) if ms_record.fund_flows_score is not None else None,
             }
             self._log(
                 f"  Loaded market sentiment for {ms_record.date} "
@@ -249,127 +392,184 @@ class ScoringPipeline:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _prepare_fundamental(records: Dict) -> Tuple[Dict, Dict]:
+    def _prepare_fundamental(
+        records: Dict, with_universe: bool = True
+    ) -> Tuple[Dict, Optional[Dict]]:
         """Convert fundamental data to calculator format.
 
         Returns:
-            (stock_data, universe_metrics) tuple.
+            (stock_data, universe_metrics) tuple. universe_metrics is None
+            when with_universe is False.
         """
-        stock_data = {}
-        for ticker, metrics in records.items():
-            stock_data[ticker] = {
-                'pe_ratio': metrics.get('pe_ratio'),
-                'pb_ratio': metrics.get('pb_ratio'),
-                'ps_ratio': metrics.get('ps_ratio'),
-                'ev_ebitda': metrics.get('ev_to_ebitda'),
-                'dividend_yield': metrics.get('dividend_yield'),
-                'roe': metrics.get('roe'),
-                'roa': metrics.get('roa'),
-                'net_margin': metrics.get('net_margin'),
-                'operating_margin': metrics.get('operating_margin'),
-                'gross_margin': metrics.get('gross_margin'),
-                'revenue_growth': metrics.get('revenue_growth_yoy'),
-                'earnings_growth': metrics.get('eps_growth_yoy'),
-            }
-
-        universe = {}
-        metric_names = [
-            'pe_ratio', 'pb_ratio', 'ps_ratio', 'ev_ebitda', 'dividend_yield',
-            'roe', 'roa', 'net_margin', 'operating_margin', 'gross_margin',
-            'revenue_growth', 'earnings_growth',
-        ]
-        for metric in metric_names:
-            values = [s[metric] for s in stock_data.values() if s.get(metric) is not None]
-            if values:
-                universe[metric] = values
+        stock_data = {
+            ticker: {key: metrics.get(source) for key, source in _FUNDAMENTAL_KEY_MAP}
+            for ticker, metrics in records.items()
+        }
 
-        return stock_data, universe
+        if not with_universe:
+            return stock_data, None
+        return stock_data, ScoringPipeline._build_universe(
+            stock_data, _FUNDAMENTAL_UNIVERSE_METRICS
+        )
 
     @staticmethod
-    def _prepare_technical(records: Dict) -> Tuple[Dict, Dict]:
+    def _prepare_technical(
+        records: Dict, with_universe: bool = True
+    ) -> Tuple[Dict, Optional[Dict]]:
         """Prepare technical data, computing derived uptrend indicators.
 
         Returns:
-            (stock_data, universe_metrics) tuple.
+            (stock_data, universe_metrics) tuple. universe_metrics is None
+            when with_universe is False.
         """
-        stock_data = records  # Already in dict form
+        # Evaluate both uptrend flags for all stocks at once on aligned
+        # price/SMA columns (missing inputs become NaN), then write them back
+        # as plain bools, or None where any input was missing.
+        stocks = list(records.values())
+        if stocks:
+            price, sma_20, sma_50, sma_200 = np.array(
+                [
+                    (data.get('current_price'), data.get('sma_20'),
+                     data.get('sma_50'), data.get('sma_200'))
+                    for data in stocks
+                ],
+                dtype=np.float64,
+            ).T
+            short_known = ~(np.isnan(price) | np.isnan(sma_20) | np.isnan(sma_50))
+            long_known = ~(np.isnan(price) | np.isnan(sma_50) | np.isnan(sma_200))
+            short = (price > sma_20) & (sma_20 > sma_50)
+            long = (price > sma_50) & (sma_50 > sma_200)
+            for data, s_known, s_up, l_known, l_up in zip(
+                stocks, short_known.tolist(), short.tolist(),
+                long_known.tolist(), long.tolist(),
+            ):
+                data['short_term_uptrend'] = s_up if s_known else None
+                data['long_term_uptrend'] = l_up if l_known else None
+
+        if not with_universe:
+            return records, None
+        return records, ScoringPipeline._build_universe(
+            records, _TECHNICAL_UNIVERSE_METRICS
+        )
 
-        for _ticker, data in stock_data.items():
-            price = data.get('current_price')
-            sma_20 = data.get('sma_20')
-            sma_50 = data.get('sma_50')
-            sma_200 = data.get('sma_200')
+    @staticmethod
+    def _prepare_sentiment(
+        records: Dict, with_universe: bool = True
+    ) -> Tuple[Dict, Optional[Dict]]:
+        """Prepare sentiment data, computing recommendation_mean.
 
-            if price is not None and sma_20 is not None and sma_50 is not None:
-                data['short_term_uptrend'] = (price > sma_20) and (sma_20 > sma_50)
-            else:
-                data['short_term_uptrend'] = None
+        Returns:
+            (stock_data, universe_metrics) tuple. universe_metrics is None
+            when with_universe is False.
+        """
+        # recommendation_mean from buy/hold/sell ratings for all stocks at
+        # once (missing counts as 0 ratings; no ratings -> None)
+        # Scale: 1.0 = Strong Buy, 3.0 = Hold, 5.0 = Strong Sell
+        recommendation_means: List[Optional[float]] = []
+        if records:
+            buy, hold, sell = np.nan_to_num(np.array(
+                [
+                    (data.get('num_buy_ratings'), data.get('num_hold_ratings'),
+                     data.get('num_sell_ratings'))
+                    for data in records.values()
+                ],
+                dtype=np.float64,
+            ).T)
+            total = buy + hold + sell
+            rated = total > 0
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = (buy * 1.0 + hold * 3.0 + sell * 5.0) / total
+            recommendation_means = [
+                mean if has_ratings else None
+                for mean, has_ratings in zip(means.tolist(), rated.tolist())
+            ]
 
-            if price is not None and sma_50 is not None and sma_200 is not None:
-                data['long_term_uptrend'] = (price > sma_50) and (sma_50 > sma_200)
-            else:
-                data['long_term_uptrend'] = None
+        stock_data = {}
+        for (ticker, data), recommendation_mean in zip(records.items(), recommendation_means):
+            mapped = {key: data.get(source) for key, source in _SENTIMENT_KEY_MAP}
+            mapped['recommendation_mean'] = recommendation_mean
+            stock_data[ticker] = mapped
 
-        universe = {}
-        metrics = [
-            'sma_50', 'sma_200', 'mad', 'momentum_12_1', 'momentum_6m',
-            'momentum_3m', 'momentum_1m', 'avg_volume_20d', 'relative_volume',
-            'rsi_14', 'adx', 'sector_relative_6m',
-        ]
-        for metric in metrics:
-            values = [s.get(metric) for s in stock_data.values() if s.get(metric) is not None]
-            if values:
-                universe[metric] = values
+        if not with_universe:
+            return stock_data, None
+        return stock_data, ScoringPipeline._build_universe(
+            stock_data, _SENTIMENT_UNIVERSE_METRICS
+        )
+
+    @staticmethod
+    def _prepare_pillars(
+        fundamental: Dict, technical: Dict, sentiment: Dict
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """Prepare all three pillars, building every universe in one pass.
+
+        Each pillar's records are mapped to calculator format as in the
+        individual _prepare_* methods; the universes are then taken from a
+        single wide ticker-indexed frame instead of one frame per pillar.
 
-        return stock_data, universe
+        Returns:
+            {'fundamental' | 'technical' | 'sentiment':
+             (stock_data, universe_metrics)}
+        """
+        fund_stock, _ = ScoringPipeline._prepare_fundamental(fundamental, with_universe=False)
+        tech_stock, _ = ScoringPipeline._prepare_technical(technical, with_universe=False)
+        sent_stock, _ = ScoringPipeline._prepare_sentiment(sentiment, with_universe=False)
+
+        universes = ScoringPipeline._build_universes({
+            'fundamental': (fund_stock, _FUNDAMENTAL_UNIVERSE_METRICS),
+            'technical': (tech_stock, _TECHNICAL_UNIVERSE_METRICS),
+            'sentiment': (sent_stock, _SENTIMENT_UNIVERSE_METRICS),
+        })
+        return {
+            'fundamental': (fund_stock, universes['fundamental']),
+            'technical': (tech_stock, universes['technical']),
+            'sentiment': (sent_stock, universes['sentiment']),
+        }
 
     @staticmethod
-    def _prepare_sentiment(records: Dict) -> Tuple[Dict, Dict]:
-        """Prepare sentiment data, computing recommendation_mean.
+    def _build_universe(stock_data: Dict, metrics: Tuple[str, ...]) -> Dict[str, List[float]]:
+        """Collect the non-missing values of each metric across all stocks.
 
         Returns:
-            (stock_data, universe_metrics) tuple.
+            {metric: [values]} for metrics with at least one value.
         """
-        stock_data = {}
-        for ticker, data in records.items():
-            mapped = {
-                'days_to_cover': data.get('days_to_cover'),
-                'analyst_target': data.get('consensus_price_target'),
-                'analyst_count': data.get('num_analyst_opinions'),
-                'market_cap': data.get('market_cap'),
-                'insider_net_shares': data.get('insider_net_shares_6m'),
-                'upgrades_30d': data.get('upgrades_30d'),
-                'downgrades_30d': data.get('downgrades_30d'),
-                'estimate_revisions_up_90d': data.get('estimate_revisions_up_90d'),
-                'estimate_revisions_down_90d': data.get('estimate_revisions_down_90d'),
-            }
+        return ScoringPipeline._build_universes({'': (stock_data, metrics)})['']
 
-            # Calculate recommendation_mean from buy/hold/sell ratings
-            # Scale: 1.0 = Strong Buy, 3.0 = Hold, 5.0 = Strong Sell
-            num_buy = data.get('num_buy_ratings') or 0
-            num_hold = data.get('num_hold_ratings') or 0
-            num_sell = data.get('num_sell_ratings') or 0
-            total = num_buy + num_hold + num_sell
-            if total > 0:
-                mapped['recommendation_mean'] = (
-                    num_buy * 1.0 + num_hold * 3.0 + num_sell * 5.0
-                ) / total
-            else:
-                mapped['recommendation_mean'] = None
+    @staticmethod
+    def _build_universes(
+        pillars: Dict[str, Tuple[Dict, Tuple[str, ...]]]
+    ) -> Dict[str, Dict[str, List[float]]]:
+        """Collect metric universes for several pillars in one pass.
 
-            stock_data[ticker] = mapped
+        Loads every pillar's per-stock dicts into one wide float DataFrame
+        keyed by (pillar, metric) columns and ticker rows (missing keys and
+        None become NaN), converts it once, then takes each metric's
+        universe with a column dropna. Values stay float64 so the ranks
+        match the per-stock calculators exactly.
 
-        universe = {}
-        metrics = [
-            'recommendation_mean', 'analyst_count', 'analyst_target',
-            'days_to_cover', 'market_cap', 'insider_net_shares',
-        ]
-        for metric in metrics:
-            values = [s.get(metric) for s in stock_data.values() if s.get(metric) is not None]
-            if values:
-                universe[metric] = values
+        Args:
+            pillars: {pillar: (stock_data, metrics)}.
+
+        Returns:
+            {pillar: {metric: [values]}} for metrics with at least one value.
+        """
+        frames = {
+            pillar: pd.DataFrame.from_records(
+                list(stock_data.values()), index=list(stock_data.keys()),
+                columns=list(metrics),
+            )
+            for pillar, (stock_data, metrics) in pillars.items()
+            if stock_data
+        }
+        universes: Dict[str, Dict[str, List[float]]] = {pillar: {} for pillar in pillars}
+        if not frames:
+            return universes
 
-        return stock_data, universe
+        wide = pd.concat(frames, axis=1).astype(np.float64)
+        for (pillar, metric), column in wide.items():
+            values = column.dropna()
+            if len(values):
+                universes[pillar][metric] = values.tolist()
+        return universes
 
     # ------------------------------------------------------------------
     # Score Calculation
@@ -380,6 +580,11 @@ class ScoringPipeline:
     ) -> Tuple[Dict[str, Dict[str, float]], List[CompositeScore]]:
         """Calculate pillar scores and composite scores for the universe.
 
+        When the pipeline has a cache_path, results are memoized on disk
+        keyed by SCORE_CACHE_VERSION and a digest of every scoring input
+        (loaded data and weights), so re-scoring unchanged data -- e.g. a report run right after
+        calculate_scores.py -- skips the calculators entirely.
+
         Args:
             data: Dict from load_data().
 
@@ -388,17 +593,62 @@ class ScoringPipeline:
                 - pillar_scores: {ticker: {fundamental, technical, sentiment}}
                 - composite_results: List[CompositeScore] sorted by percentile desc.
         """
+        if self.cache_path is None:
+            return self._compute_scores(data)
+
+        # Digest before scoring: preparation adds derived fields to data
+        key = self._inputs_digest(data)
+        cached = read_cache(self.cache_path, key)
+        if cached is not None:
+            self._log("\nInputs unchanged since last run; using cached scores")
+            return cached
+
+        scores = self._compute_scores(data)
+        write_cache(self.cache_path, key, scores)
+        return scores
+
+    def _inputs_digest(self, data: Dict) -> Tuple[int, bytes]:
+        """Cache key: SCORE_CACHE_VERSION plus a content hash of every input."""
+        payload = orjson.dumps(
+            {
+                'weights': self.weights,
+                **{field: data[field] for field in self._SCORED_INPUTS},
+            },
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        return SCORE_CACHE_VERSION, hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _compute_scores(
+        self, data: Dict
+    ) -> Tuple[Dict[str, Dict[str, float]], List[CompositeScore]]:
+        """Score the universe (uncached body of calculate_scores)."""
         self._log("\nCalculating pillar scores...")
         tickers = data['tickers']
 
         # Prepare data
-        fund_stock, fund_universe = self._prepare_fundamental(data['fundamental_data'])
-        tech_stock, tech_universe = self._prepare_technical(data['technical_data'])
-        sent_stock, sent_universe = self._prepare_sentiment(data['sentiment_data'])
+        prepared = self._prepare_pillars(
+            data['fundamental_data'], data['technical_data'], data['sentiment_data']
+        )
+        fund_stock, fund_universe = prepared['fundamental']
+        tech_stock, tech_universe = prepared['technical']
+        sent_stock, sent_universe = prepared['sentiment']
 
         self._log(f"  Prepared: {len(fund_stock)} fundamental, "
                   f"{len(tech_stock)} technical, {len(sent_stock)} sentiment")
 
+        # Fundamental ranks are purely percentile-based, so score them in bulk
+        fund_results = self._fundamental_calc.calculate_fundamental_scores_bulk(
+            fund_stock, fund_universe
+        )
+
+        tech_results = self._score_technical(tech_stock, tech_universe)
+
+        # Sentiment scores depend only on a stock's own inputs and price (plus
+        # the run-wide market data), so stocks with identical inputs --
+        # typically zero- or null-filled provider rows -- share one
+        # calculator call. The memo lives for this run only.
+        sent_memo: Dict[Tuple, Dict] = {}
+
         # Calculate per-stock pillar scores (with sub-component detail)
         pillar_scores: Dict[str, Dict] = {}
         for ticker in tickers:
@@ -408,10 +658,8 @@ class ScoringPipeline:
             data_status = {}
 
             # Fundamental
-            if ticker in fund_stock:
-                fund_result = self._fundamental_calc.calculate_fundamental_score(
-                    fund_stock[ticker], fund_universe
-                )
+            if ticker in fund_results:
+                fund_result = fund_results[ticker]
                 fund_score = fund_result.get('fundamental_score')
                 fund_detail = {
                     'value_score': fund_result.get('value_score'),
@@ -424,10 +672,8 @@ class ScoringPipeline:
                 data_status['fundamental'] = 'no_data'
 
             # Technical
-            if ticker in tech_stock:
-                tech_result = self._technical_calc.calculate_technical_score(
-                    tech_stock[ticker], tech_universe
-                )
+            if ticker in tech_results:
+                tech_result = tech_results[ticker]
                 tech_score = tech_result.get('technical_score')
                 tech_detail = {
                     'momentum_score': tech_result.get('momentum_score'),
@@ -444,11 +690,16 @@ class ScoringPipeline:
 
             # Sentiment (returns dict with sub-components)
             if ticker in sent_stock and ticker in data['latest_prices']:
-                sent_result = self._sentiment_calc.calculate_sentiment_score(
-                    sent_stock[ticker],
-                    data['latest_prices'][ticker],
-                    market_data=data['market_sentiment'],
-                )
+                sent_key = (self._inputs_key(sent_stock[ticker]),
+                            data['latest_prices'][ticker])
+                sent_result = sent_memo.get(sent_key)
+                if sent_result is None:
+                    sent_result = self._sentiment_calc.calculate_sentiment_score(
+                        sent_stock[ticker],
+                        data['latest_prices'][ticker],
+                        market_data=data['market_sentiment'],
+                    )
+                    sent_memo[sent_key] = sent_result
                 sent_score = sent_result.get('sentiment_score')
                 sent_detail = {
                     'market_sentiment': sent_result.get('market_sentiment'),
@@ -491,11 +742,71 @@ class ScoringPipeline:
 
         # Composite scores (only for fully-scored stocks)
         self._log("\nCalculating composite scores...")
-        composite_results = self._composite_calc.calculate_scores_for_universe(scorable)
+        scorable_tickers = list(scorable)
+        pillar_matrix = np.array(
+            [[scorable[t][pillar] for pillar in self._PILLAR_KEYS] for t in scorable_tickers],
+            dtype=np.float64,
+        ).reshape(len(scorable_tickers), len(self._PILLAR_KEYS))
+        composite_results = self._composite_calc.calculate_scores_for_universe_array(
+            scorable_tickers, pillar_matrix
+        )
         self._log(f"  Calculated composite scores for {len(composite_results)} stocks")
 
         return pillar_scores, composite_results
 
+    def _score_technical(
+        self, tech_stock: Dict[str, Dict], tech_universe: Dict[str, List[float]]
+    ) -> Dict[str, Dict]:
+        """Run the technical calculator for every stock.
+
+        Each stock's score depends only on its own metrics and the shared,
+        read-only universe. Stocks with identical inputs share one calculator
+        call. With ``workers`` > 1 and a large enough universe, the distinct
+        inputs are scored in a process pool that receives the universe once
+        per worker.
+
+        Returns:
+            {ticker: calculate_technical_score result}
+        """
+        # Group tickers by identical inputs
+        by_key: Dict[Tuple, List[str]] = {}
+        for ticker, metrics in tech_stock.items():
+            by_key.setdefault(self._inputs_key(metrics), []).append(ticker)
+        distinct = [(keys[0], tech_stock[keys[0]]) for keys in by_key.values()]
+
+        if (self.workers or 1) > 1 and len(distinct) >= self.PARALLEL_MIN_STOCKS:
+            chunk_size = -(-len(distinct) // self.workers)
+            chunks = [
+                distinct[i:i + chunk_size]
+                for i in range(0, len(distinct), chunk_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_technical_worker,
+                initargs=(tech_universe,),
+            ) as pool:
+                scored: Dict[str, Dict] = {}
+                for chunk_result in pool.map(_score_technical_chunk, chunks):
+                    scored.update(chunk_result)
+        else:
+            scored = {
+                ticker: self._technical_calc.calculate_technical_score(
+                    metrics, tech_universe
+                )
+                for ticker, metrics in distinct
+            }
+
+        return {
+            ticker: scored[keys[0]]
+            for keys in by_key.values()
+            for ticker in keys
+        }
+
+    @staticmethod
+    def _inputs_key(metrics: Dict) -> Tuple:
+        """Hashable, order-independent key for a stock's calculator inputs."""
+        return tuple(sorted(metrics.items()))
+
     _PILLAR_KEYS = ('fundamental', 'technical', 'sentiment')
 
     def _validate_scores(self, pillar_scores: Dict[str, Dict]) -> None:
@@ -507,9 +818,7 @@ class ScoringPipeline:
                 if score is not None and not (0 <= score <= 100):
                     errors.append(f"  {ticker} {pillar}: {score:.2f}")
         if errors:
-            self._log("  VALIDATION ERRORS:")
-            for e in errors:
-                self._log(e)
+            self._log("\n".join(["  VALIDATION ERRORS:", *errors]))
             raise ValueError(f"{len(errors)} scores out of valid range [0, 100]")
         self._log("  [OK] All scores in valid range [0, 100]")
 
@@ -689,8 +998,12 @@ class ScoringPipeline:
             'weights': result.weights,
             'scores': scores_list,
         }
-        with open(output_path, 'w') as f:
-            json.dump(scores_data, f, indent=2)
+        # orjson serializes NumPy scalars from the calculators natively
+        # (OPT_SERIALIZE_NUMPY) and writes NaN as null rather than invalid JSON.
+        output_path.write_bytes(orjson.dumps(
+            scores_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ))
 
         self._log(f"  Saved scores to {output_path}")
         return output_path
@@ -727,10 +1040,10 @@ class ScoringPipeline:
         for r in records:
             result[r.ticker] = {
                 'calculation_date': r.calculation_date,
-                'fundamental_score': float(r.fundamental_score) if r.fundamental_score else None,
-                'technical_score': float(r.technical_score) if r.technical_score else None,
-                'sentiment_score': float(r.sentiment_score) if r.sentiment_score else None,
-                'composite_score': float(r.final_composite_score) if r.final_composite_score else None,
+                'fundamental_score': float(r.fundamental_score) if r.fundamental_score is not None else None,
+                'technical_score': float(r.technical_score) if r.technical_score is not None else None,
+                'sentiment_score': float(r.sentiment_score) if r.sentiment_score is not None else None,
+                'composite_score': float(r.final_composite_score) if r.final_composite_score is not None else None,
                 'recommendation': r.recommendation,
             }
 
@@ -757,6 +1070,43 @@ class PipelineResult:
     def tickers(self) -> List[str]:
         return [r.ticker for r in self.composite_results]
 
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Return composite results as column arrays (structure of arrays).
+
+        Each array is aligned with composite_results order. Summary
+        statistics only touch one or two columns, so reductions over these
+        arrays avoid walking every CompositeScore object.
+
+        Scores and percentiles are bounded 0-100 with two decimals, so they
+        are held as float32 (half the footprint of float64, still exact at
+        the displayed precision). Tickers use a fixed-width dtype matching
+        the 10-character database column instead of boxed objects.
+
+        Returns:
+            Dict with keys: ticker, fundamental, technical, sentiment,
+            composite_score, composite_percentile (float32) and
+            recommendation (recommendation value strings).
+        """
+        results = self.composite_results
+        n = len(results)
+
+        def _column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(r, attr) for r in results), dtype=np.float32, count=n
+            )
+
+        return {
+            'ticker': np.array([r.ticker for r in results], dtype='U10'),
+            'fundamental': _column('fundamental_score'),
+            'technical': _column('technical_score'),
+            'sentiment': _column('sentiment_score'),
+            'composite_score': _column('composite_score'),
+            'composite_percentile': _column('composite_percentile'),
+            'recommendation': np.array(
+                [r.recommendation.value for r in results], dtype=str
+            ),
+        }
+
     def get_score(self, ticker: str) -> Optional[CompositeScore]:
         """Get composite score for a specific ticker."""
         for r in self.composite_results:
@@ -2,10 +2,12 @@
 Utility modules for stock analysis framework.
 
 Includes:
+- cache: Best-effort keyed pickle caches
 - rate_limiter: API rate limiting
 - validators: Data validation helpers
 """
 
+from .cache import read_cache, write_cache
 from .rate_limiter import RateLimiter
 from .validators import (
     validate_numeric,
@@ -18,6 +20,8 @@ from .validators import (
 )
 
 __all__ = [
+    'read_cache',
+    'write_cache',
     'RateLimiter',
     'validate_numeric',
     'validate_percentage',
@@ -0,0 +1,52 @@
+"""
+Best-effort pickle caches keyed by a caller-supplied key.
+
+Each cache file holds a single (key, value) pair. A read returns the value
+only when the stored key equals the expected one, so callers put everything
+the value depends on in the key -- including a format/logic version they
+bump when the cached objects or the code producing them change.
+
+A missing, truncated, or incompatible file is a cache miss and a failed
+write is ignored: the cache can never make a run fail.
+"""
+
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+
+def read_cache(path: Path, key: Any) -> Optional[Any]:
+    """
+    Return the value cached at path if it was stored under key.
+
+    Args:
+        path: Pickle cache file
+        key: Expected key (compared with ==)
+
+    Returns:
+        The cached value, or None on a miss, a stale key, or a corrupt file
+    """
+    try:
+        with open(path, 'rb') as f:
+            cached_key, value = pickle.load(f)
+    except Exception:
+        return None
+    return value if cached_key == key else None
+
+
+def write_cache(path: Path, key: Any, value: Any) -> None:
+    """
+    Store value under key at path, creating parent directories.
+
+    Args:
+        path: Pickle cache file
+        key: Key that read_cache() must be given to return value
+        value: Object to cache
+    """
+    try:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PicklingError):
+        pass
@@ -24,6 +24,7 @@ Usage:
 
 import time
 import functools
+import threading
 from collections import deque
 from typing import Callable, Any
 from datetime import datetime, timedelta
@@ -34,6 +35,7 @@ class RateLimiter:
     Rate limiter using sliding window algorithm.
 
     Tracks timestamps of recent calls and enforces maximum calls per period.
+    Thread-safe: concurrent callers share one window and queue behind a lock.
     """
 
     def __init__(self, calls: int, period: float):
@@ -47,6 +49,7 @@ class RateLimiter:
         self.max_calls = calls
         self.period = period
         self.call_times = deque(maxlen=calls)
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
         """
@@ -54,25 +57,26 @@ class RateLimiter:
 
         Calculates time since oldest call and sleeps if needed.
         """
-        now = time.time()
+        with self._lock:
+            now = time.time()
 
-        # If we haven't hit the limit yet, no need to wait
-        if len(self.call_times) < self.max_calls:
-            self.call_times.append(now)
-            return
+            # If we haven't hit the limit yet, no need to wait
+            if len(self.call_times) < self.max_calls:
+                self.call_times.append(now)
+                return
 
-        # Calculate time since oldest call
-        oldest_call = self.call_times[0]
-        time_since_oldest = now - oldest_call
+            # Calculate time since oldest call
+            oldest_call = self.call_times[0]
+            time_since_oldest = now - oldest_call
 
-        # If oldest call was within the period, we need to wait
-        if time_since_oldest < self.period:
-            sleep_time = self.period - time_since_oldest
-            time.sleep(sleep_time)
-            now = time.time()
+            # If oldest call was within the period, we need to wait
+            if time_since_oldest < self.period:
+                sleep_time = self.period - time_since_oldest
+                time.sleep(sleep_time)
+                now = time.time()
 
-        # Record this call
-        self.call_times.append(now)
+            # Record this call
+            self.call_times.append(now)
 
     def __enter__(self):
         """Context manager entry."""
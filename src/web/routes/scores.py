@@ -160,7 +160,7 @@ def score_detail(ticker):
                     'company_name': stock_row.company_name,
                     'sector': stock_row.sector,
                     'industry': stock_row.industry,
-                    'market_cap': float(stock_row.market_cap) if stock_row.market_cap else None,
+                    'market_cap': float(stock_row.market_cap) if stock_row.market_cap is not None else None,
                 }
             score_row = (
                 session.query(StockScore)
@@ -34,7 +34,7 @@ def universe_list():
                 sectors.setdefault(sector, []).append({
                     'ticker': s.ticker,
                     'name': s.company_name or '',
-                    'market_cap': float(s.market_cap) if s.market_cap else None,
+                    'market_cap': float(s.market_cap) if s.market_cap is not None else None,
                     'industry': s.industry or '',
                 })
 
@@ -0,0 +1,324 @@
+"""
+Tests for apply_override.py helper functions.
+
+Tests score loading and override-request parsing. Does not test the
+main() function or override logging.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.composite import CompositeScore, Recommendation
+from overrides import ConvictionLevel, OverrideResult, OverrideType
+
+# Import from scripts
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts.apply_override import (
+    _load_json,
+    build_request_from_args,
+    build_request_from_file,
+    display_result,
+    index_by_ticker,
+    load_latest_scores,
+    parse_args,
+)
+
+
+def _write_scores(path, scores):
+    """Write a minimal latest_scores.json file."""
+    path.write_text(json.dumps({'scores': scores}))
+    return path
+
+
+def _score_entry(ticker, percentile, recommendation):
+    return {
+        'ticker': ticker,
+        'fundamental_score': 60.0,
+        'technical_score': 55.0,
+        'sentiment_score': 50.0,
+        'composite_score': 57.25,
+        'composite_percentile': percentile,
+        'recommendation': recommendation,
+    }
+
+
+class TestLoadLatestScores:
+    def test_builds_composite_scores(self, tmp_path):
+        path = _write_scores(tmp_path / 'latest_scores.json', [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+            _score_entry('MSFT', 50.0, 'HOLD'),
+        ])
+        scores = load_latest_scores(path)
+        assert len(scores) == 2
+        assert all(isinstance(s, CompositeScore) for s in scores)
+        assert scores[0].ticker == 'AAPL'
+        assert scores[0].recommendation == Recommendation.STRONG_BUY
+        assert scores[1].recommendation == Recommendation.HOLD
+        assert scores[1].composite_percentile == 50.0
+
+    def test_skips_unscored_stocks(self, tmp_path):
+        unscored = _score_entry('XYZ', None, 'INSUFFICIENT DATA')
+        unscored['composite_score'] = None
+        path = _write_scores(tmp_path / 'latest_scores.json', [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+            unscored,
+        ])
+        scores = load_latest_scores(path)
+        assert [s.ticker for s in scores] == ['AAPL']
+
+    def test_empty_scores(self, tmp_path):
+        path = _write_scores(tmp_path / 'latest_scores.json', [])
+        assert load_latest_scores(path) == []
+
+    def test_second_load_uses_pickle_cache(self, tmp_path, monkeypatch):
+        path = _write_scores(tmp_path / 'latest_scores.json', [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+        ])
+        cache = tmp_path / 'latest_scores.pkl'
+        first = load_latest_scores(path, cache_path=cache)
+        assert cache.exists()
+
+        def _fail(_path):
+            raise AssertionError("JSON should not be re-parsed")
+        monkeypatch.setattr('scripts.apply_override._load_json', _fail)
+        second = load_latest_scores(path, cache_path=cache)
+        assert second == first
+
+    def test_cache_invalidated_when_scores_change(self, tmp_path):
+        path = _write_scores(tmp_path / 'latest_scores.json', [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+        ])
+        cache = tmp_path / 'latest_scores.pkl'
+        load_latest_scores(path, cache_path=cache)
+        _write_scores(path, [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+            _score_entry('MSFT', 50.0, 'HOLD'),
+        ])
+        scores = load_latest_scores(path, cache_path=cache)
+        assert [s.ticker for s in scores] == ['AAPL', 'MSFT']
+
+    def test_cache_invalidated_on_version_bump(self, tmp_path, monkeypatch):
+        path = _write_scores(tmp_path / 'latest_scores.json', [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+        ])
+        cache = tmp_path / 'latest_scores.pkl'
+        load_latest_scores(path, cache_path=cache)
+
+        monkeypatch.setattr('scripts.apply_override.SCORES_CACHE_VERSION', -1)
+        parsed = []
+        monkeypatch.setattr(
+            'scripts.apply_override._load_json',
+            lambda p: parsed.append(p) or _load_json(p),
+        )
+        load_latest_scores(path, cache_path=cache)
+        assert parsed == [path]
+
+    def test_corrupt_cache_falls_back_to_json(self, tmp_path):
+        path = _write_scores(tmp_path / 'latest_scores.json', [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+        ])
+        cache = tmp_path / 'latest_scores.pkl'
+        cache.write_bytes(b'not a pickle')
+        assert [s.ticker for s in load_latest_scores(path, cache_path=cache)] == ['AAPL']
+
+    def test_no_cache_by_default(self, tmp_path):
+        path = _write_scores(tmp_path / 'latest_scores.json', [
+            _score_entry('AAPL', 90.0, 'STRONG BUY'),
+        ])
+        load_latest_scores(path)
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestIndexByTicker:
+    def _scores(self, tickers):
+        return [
+            CompositeScore(t, 50.0, 50.0, 50.0, 50.0, 50.0, Recommendation.HOLD)
+            for t in tickers
+        ]
+
+    def test_sorted_and_found(self):
+        sorted_scores, find = index_by_ticker(self._scores(['MSFT', 'AAPL', 'PG', 'GOOGL']))
+        assert [s.ticker for s in sorted_scores] == ['AAPL', 'GOOGL', 'MSFT', 'PG']
+        for ticker in ('AAPL', 'GOOGL', 'MSFT', 'PG'):
+            assert find(ticker).ticker == ticker
+
+    def test_missing_ticker(self):
+        _, find = index_by_ticker(self._scores(['AAPL', 'MSFT']))
+        assert find('AAA') is None
+        assert find('GOOGL') is None
+        assert find('ZZZ') is None
+
+    def test_empty_universe(self):
+        sorted_scores, find = index_by_ticker([])
+        assert sorted_scores == []
+        assert find('AAPL') is None
+
+
+class TestBuildRequestFromArgs:
+    def test_partial_weights_default_to_base(self):
+        args = parse_args(['aapl', '--weight-fundamental', '0.50',
+                           '--weight-technical', '0.30',
+                           '--what-model-misses', 'x', '--why-accurate', 'y',
+                           '--what-proves-wrong', 'z'])
+        request = build_request_from_args(args)
+        assert request.ticker == 'AAPL'
+        assert request.override_type == OverrideType.WEIGHT_ADJUSTMENT
+        assert request.weight_override.fundamental_weight == 0.50
+        assert request.weight_override.technical_weight == 0.30
+        assert request.weight_override.sentiment_weight == 0.20
+        assert request.sentiment_override is None
+        assert request.documentation.conviction == ConvictionLevel.MEDIUM
+
+    def test_both_override_types(self):
+        args = parse_args(['AAPL', '--weight-sentiment', '0.25',
+                           '--sentiment-adjustment', '-5'])
+        request = build_request_from_args(args)
+        assert request.override_type == OverrideType.BOTH
+        assert request.weight_override.fundamental_weight == 0.45
+        assert request.sentiment_override.adjustment == -5.0
+
+    def test_evidence_passed_through(self):
+        args = parse_args(['AAPL', '--sentiment-adjustment', '10',
+                           '--evidence', 'CEO bought', 'CFO bought'])
+        request = build_request_from_args(args)
+        assert request.documentation.evidence_pieces == ['CEO bought', 'CFO bought']
+
+    def test_no_evidence_is_none(self):
+        request = build_request_from_args(parse_args(['AAPL', '--sentiment-adjustment', '10']))
+        assert request.documentation.evidence_pieces is None
+
+    def test_no_override(self):
+        request = build_request_from_args(parse_args(['AAPL']))
+        assert request.override_type == OverrideType.NONE
+        assert request.weight_override is None
+        assert request.documentation is None
+
+
+class TestBuildRequestFromFile:
+    def test_sentiment_override(self, tmp_path):
+        path = tmp_path / 'request.json'
+        path.write_text(json.dumps({
+            'override_type': 'sentiment_adjustment',
+            'sentiment_override': {'adjustment': 10},
+            'documentation': {
+                'what_model_misses': 'Insider buying',
+                'why_view_more_accurate': 'Cluster of buys',
+                'what_proves_wrong': 'Insider selling',
+                'conviction': 'High',
+                'evidence_pieces': ['a', 'b', 'c'],
+            },
+        }))
+        request = build_request_from_file('aapl', str(path))
+        assert request.ticker == 'AAPL'
+        assert request.override_type == OverrideType.SENTIMENT_ADJUSTMENT
+        assert request.sentiment_override.adjustment == 10
+        assert request.weight_override is None
+        assert request.documentation.conviction == ConvictionLevel.HIGH
+        assert request.documentation.evidence_pieces == ['a', 'b', 'c']
+
+    def test_weight_override_without_documentation(self, tmp_path):
+        path = tmp_path / 'request.json'
+        path.write_text(json.dumps({
+            'override_type': 'weight_adjustment',
+            'weight_override': {'fundamental': 0.5, 'technical': 0.3, 'sentiment': 0.2},
+        }))
+        request = build_request_from_file('MSFT', str(path))
+        assert request.override_type == OverrideType.WEIGHT_ADJUSTMENT
+        assert request.weight_override.fundamental_weight == 0.5
+        assert request.documentation is None
+
+
+class TestParseArgs:
+    def test_from_file_fast_path(self):
+        args = parse_args(['AAPL', '--from-file', 'req.json'])
+        assert args.ticker == 'AAPL'
+        assert args.from_file == 'req.json'
+        assert args.cache is None
+
+    def test_from_file_fast_path_accepts_cache(self):
+        args = parse_args(['AAPL', '--from-file', 'req.json', '--cache', 'scores.pkl'])
+        assert args.from_file == 'req.json'
+        assert args.cache == Path('scores.pkl')
+
+    def test_flag_mode_uses_full_parser(self):
+        args = parse_args(['AAPL', '--sentiment-adjustment', '10', '--conviction', 'High'])
+        assert args.ticker == 'AAPL'
+        assert args.sentiment_adjustment == 10.0
+        assert args.conviction == 'High'
+        assert args.from_file is None
+
+    def test_from_file_with_other_flags_uses_full_parser(self):
+        args = parse_args(['AAPL', '--from-file', 'req.json', '--conviction', 'Low'])
+        assert args.from_file == 'req.json'
+        assert args.conviction == 'Low'
+
+    def test_invalid_arguments_exit(self):
+        with pytest.raises(SystemExit):
+            parse_args(['AAPL', '--from-file'])
+        with pytest.raises(SystemExit):
+            parse_args(['AAPL', '--conviction', 'Extreme'])
+
+
+class TestDisplayResult:
+    def _make_result(self, **overrides):
+        fields = dict(
+            ticker='AAPL',
+            timestamp=datetime(2026, 2, 14),
+            override_type=OverrideType.SENTIMENT_ADJUSTMENT,
+            base_fundamental_score=60.0,
+            base_technical_score=55.0,
+            base_sentiment_score=50.0,
+            base_weights={'fundamental': 0.45, 'technical': 0.35, 'sentiment': 0.20},
+            base_composite_score=57.0,
+            base_composite_percentile=60.0,
+            base_recommendation='HOLD',
+            adjusted_sentiment=60.0,
+            final_composite_score=60.0,
+            final_composite_percentile=72.0,
+            final_recommendation='BUY',
+            percentile_impact=12.0,
+            recommendation_changed=True,
+        )
+        fields.update(overrides)
+        return OverrideResult(**fields)
+
+    def test_before_after_table(self, capsys):
+        display_result(self._make_result())
+        out = capsys.readouterr().out
+        assert "OVERRIDE RESULT: AAPL" in out
+        assert "    Composite Score                 57.0       60.0       +3.0" in out
+        assert "    Composite Percentile            60.0       72.0      +12.0" in out
+        assert "    Recommendation                  HOLD        BUY" in out
+        assert "Adjusted Sentiment: 50.0 -> 60.0" in out
+        assert "[*] Recommendation changed: HOLD -> BUY" in out
+        assert out.endswith("=" * 80 + "\n")
+
+    def test_weights_and_violations(self, capsys):
+        display_result(self._make_result(
+            adjusted_sentiment=None,
+            adjusted_weights={'fundamental': 0.50, 'technical': 0.30, 'sentiment': 0.20},
+            guardrail_violations=['Combined impact exceeds limit'],
+            extreme_override=True,
+            recommendation_changed=False,
+        ))
+        out = capsys.readouterr().out
+        assert "      Fundamental: 45% -> 50%" in out
+        assert "      [!] Combined impact exceeds limit" in out
+        assert "EXTREME OVERRIDE" in out
+        assert "Adjusted Sentiment" not in out
+        assert "Recommendation changed" not in out
+
+    def test_accepts_recommendation_members(self, capsys):
+        display_result(self._make_result(
+            base_recommendation=Recommendation.HOLD,
+            final_recommendation=Recommendation.STRONG_BUY,
+        ))
+        out = capsys.readouterr().out
+        assert "    Recommendation                  HOLD STRONG BUY" in out
+        assert "[*] Recommendation changed: HOLD -> STRONG BUY" in out
@@ -0,0 +1,35 @@
+"""
+Unit tests for the best-effort pickle cache helpers.
+"""
+
+from utils.cache import read_cache, write_cache
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'sub' / 'cache.pkl'
+    write_cache(path, ('v1', 42), {'a': [1, 2]})
+    assert read_cache(path, ('v1', 42)) == {'a': [1, 2]}
+
+
+def test_stale_key_is_a_miss(tmp_path):
+    path = tmp_path / 'cache.pkl'
+    write_cache(path, (1, 'digest'), 'value')
+    assert read_cache(path, (2, 'digest')) is None
+
+
+def test_missing_file_is_a_miss(tmp_path):
+    assert read_cache(tmp_path / 'missing.pkl', 'key') is None
+
+
+def test_corrupt_file_is_a_miss(tmp_path):
+    path = tmp_path / 'cache.pkl'
+    path.write_bytes(b'not a pickle')
+    assert read_cache(path, 'key') is None
+
+
+def test_unwritable_path_is_ignored(tmp_path):
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    # Parent "directory" is a file, so the write fails silently
+    write_cache(blocker / 'cache.pkl', 'key', 'value')
+    assert read_cache(blocker / 'cache.pkl', 'key') is None
@@ -15,6 +15,7 @@ Author: Stock Analysis Framework v2.0
 Date: 2026-02-12
 """
 
+import numpy as np
 import pytest
 from models.composite import (
     Recommendation,
@@ -105,6 +106,23 @@ class TestRecommendation:
         """Test boundary edge case at 15.9 (should be STRONG SELL, <16)."""
         assert Recommendation.from_percentile(15.9) == Recommendation.STRONG_SELL
 
+    def test_counts_every_level(self):
+        """Test counts tallies each level and reports zeros for absent ones."""
+        counts = Recommendation.counts([
+            Recommendation.BUY, Recommendation.HOLD, Recommendation.BUY,
+            Recommendation.STRONG_SELL,
+        ])
+        assert list(counts) == list(Recommendation)
+        assert counts[Recommendation.BUY] == 2
+        assert counts[Recommendation.HOLD] == 1
+        assert counts[Recommendation.STRONG_SELL] == 1
+        assert counts[Recommendation.STRONG_BUY] == 0
+        assert counts[Recommendation.SELL] == 0
+
+    def test_counts_empty(self):
+        """Test counts of an empty sequence are all zero."""
+        assert set(Recommendation.counts([]).values()) == {0}
+
 
 # ============================================================================
 # CompositeScore Tests
@@ -771,11 +789,57 @@ class TestCalculateScoresForUniverse:
 
         assert abs(results[0].composite_score - expected_composite) < 0.01
 
+    def test_matches_scalar_percentile_rank(self):
+        """Vectorized ranking should match calculate_percentile_rank, ties included."""
+        calc = CompositeScoreCalculator()
+
+        pillar_values = [(40, 50, 60), (80, 70, 60), (40, 50, 60), (90, 20, 55),
+                         (10, 95, 30), (66, 66, 66), (80, 70, 60), (25, 35, 45)]
+        stock_scores = {
+            f"S{i}": {'fundamental': f, 'technical': t, 'sentiment': s}
+            for i, (f, t, s) in enumerate(pillar_values)
+        }
+
+        results = calc.calculate_scores_for_universe(stock_scores)
+
+        composites = [
+            calc.calculate_composite_score(*values) for values in pillar_values
+        ]
+        for result in results:
+            expected = calc.calculate_percentile_rank(result.composite_score, composites)
+            assert result.composite_percentile == expected
+            assert isinstance(result.composite_score, float)
+            assert isinstance(result.composite_percentile, float)
+
+    def test_empty_universe(self):
+        """Empty input yields no results."""
+        calc = CompositeScoreCalculator()
+        assert calc.calculate_scores_for_universe({}) == []
+
 
 # ============================================================================
 # Report Generation Tests
 # ============================================================================
 
+    def test_array_form_matches_dict_form(self):
+        """Test (N, 3) matrix input gives the same results as the dict input."""
+        calc = CompositeScoreCalculator()
+        stock_scores = {
+            'AAPL': {'fundamental': 75.0, 'technical': 82.0, 'sentiment': 68.0},
+            'MSFT': {'fundamental': 60.5, 'technical': 55.25, 'sentiment': 50.0},
+            'PG': {'fundamental': 40.0, 'technical': 30.0, 'sentiment': 45.0},
+        }
+        matrix = np.array([[s['fundamental'], s['technical'], s['sentiment']]
+                           for s in stock_scores.values()])
+
+        from_array = calc.calculate_scores_for_universe_array(list(stock_scores), matrix)
+        assert from_array == calc.calculate_scores_for_universe(stock_scores)
+
+    def test_array_form_empty(self):
+        calc = CompositeScoreCalculator()
+        assert calc.calculate_scores_for_universe_array([], np.empty((0, 3))) == []
+
+
 class TestGenerateReport:
     """Test report generation functionality."""
 
@@ -832,6 +896,23 @@ class TestGenerateReport:
         assert "SELL:" in report
         assert "STRONG SELL:" in report
 
+    def test_report_distribution_counts(self):
+        """Test that each recommendation bucket reports its count."""
+        calc = CompositeScoreCalculator()
+        results = [
+            CompositeScore('A', 90, 90, 90, 90, 95.0, Recommendation.STRONG_BUY),
+            CompositeScore('B', 80, 80, 80, 80, 90.0, Recommendation.STRONG_BUY),
+            CompositeScore('C', 50, 50, 50, 50, 50.0, Recommendation.HOLD),
+            CompositeScore('D', 10, 10, 10, 10, 5.0, Recommendation.STRONG_SELL),
+        ]
+        report = calc.generate_report(results)
+
+        assert "  STRONG BUY:   2 stocks ( 50.0%)" in report
+        assert "  BUY:          0 stocks (  0.0%)" in report
+        assert "  HOLD:         1 stocks ( 25.0%)" in report
+        assert "  SELL:         0 stocks (  0.0%)" in report
+        assert "  STRONG SELL:  1 stocks ( 25.0%)" in report
+
     def test_report_with_custom_weights(self):
         """Test report shows custom weights correctly."""
         calc = CompositeScoreCalculator(
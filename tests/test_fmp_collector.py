@@ -130,13 +130,25 @@ class TestFMPCollectorInit:
         assert fmp.rate_limiter.max_calls == 10
         assert fmp.rate_limiter.period == 60
 
+    def test_http_retries_limited_to_connect_errors(self, fmp):
+        """Retries must not send extra requests past the rate limiter."""
+        retries = fmp._session.get_adapter(fmp.BASE_URL).max_retries
+        assert retries.connect == 3
+        assert retries.read == 0
+        assert retries.status == 0
+
 
 # --- API Request Tests ---
 
 class TestMakeRequest:
     """Test _make_request error handling."""
 
-    @patch('src.data_collection.fmp.requests.get')
+    @pytest.fixture
+    def mock_get(self, fmp):
+        """Patch the collector's HTTP session."""
+        with patch.object(fmp._session, 'get') as mock_get:
+            yield mock_get
+
     def test_successful_request(self, mock_get, fmp):
         """Successful API call returns parsed JSON."""
         mock_response = MagicMock()
@@ -148,7 +160,6 @@ class TestMakeRequest:
         result = fmp._make_request('grades', {'symbol': 'AAPL'})
         assert result == [{'symbol': 'AAPL'}]
 
-    @patch('src.data_collection.fmp.requests.get')
     def test_402_premium_endpoint(self, mock_get, fmp):
         """402 status raises DataValidationError for premium endpoints."""
         mock_response = MagicMock()
@@ -158,7 +169,6 @@ class TestMakeRequest:
         with pytest.raises(DataValidationError, match="premium subscription"):
             fmp._make_request('insider-trading/search', {'symbol': 'AAPL'})
 
-    @patch('src.data_collection.fmp.requests.get')
     def test_429_rate_limit(self, mock_get, fmp):
         """429 status raises DataValidationError for rate limit."""
         mock_response = MagicMock()
@@ -168,7 +178,6 @@ class TestMakeRequest:
         with pytest.raises(DataValidationError, match="rate limit"):
             fmp._make_request('grades', {'symbol': 'AAPL'})
 
-    @patch('src.data_collection.fmp.requests.get')
     def test_network_timeout(self, mock_get, fmp):
         """Network timeout raises DataValidationError."""
         import requests
@@ -177,7 +186,6 @@ class TestMakeRequest:
         with pytest.raises(DataValidationError, match="request failed"):
             fmp._make_request('grades', {'symbol': 'AAPL'})
 
-    @patch('src.data_collection.fmp.requests.get')
     def test_error_message_in_response(self, mock_get, fmp):
         """FMP error message in response raises DataValidationError."""
         mock_response = MagicMock()
@@ -190,6 +198,51 @@ class TestMakeRequest:
             fmp._make_request('grades', {'symbol': 'AAPL'})
 
 
+class TestResponseCache:
+    """Test the optional on-disk response cache."""
+
+    @staticmethod
+    def _ok(data):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = data
+        return response
+
+    def test_fresh_response_served_from_cache(self, tmp_path):
+        fmp = FMPCollector(api_key='test_key', cache_dir=tmp_path)
+        with patch.object(fmp._session, 'get', return_value=self._ok([{'symbol': 'AAPL'}])):
+            first = fmp._make_request('grades', {'symbol': 'AAPL'})
+
+        # A new collector (next run) reads the same cache without calling the API
+        fmp = FMPCollector(api_key='other_key', cache_dir=tmp_path)
+        with patch.object(fmp._session, 'get') as mock_get:
+            second = fmp._make_request('grades', {'symbol': 'AAPL'})
+            mock_get.assert_not_called()
+        assert second == first == [{'symbol': 'AAPL'}]
+
+    def test_cache_keyed_by_params(self, tmp_path):
+        fmp = FMPCollector(api_key='test_key', cache_dir=tmp_path)
+        with patch.object(fmp._session, 'get', return_value=self._ok([])) as mock_get:
+            fmp._make_request('grades', {'symbol': 'AAPL'})
+            fmp._make_request('grades', {'symbol': 'MSFT'})
+        assert mock_get.call_count == 2
+
+    def test_expired_response_refetched(self, tmp_path):
+        fmp = FMPCollector(api_key='test_key', cache_dir=tmp_path, cache_ttl=timedelta(0))
+        with patch.object(fmp._session, 'get', return_value=self._ok([])) as mock_get:
+            fmp._make_request('grades', {'symbol': 'AAPL'})
+            fmp._make_request('grades', {'symbol': 'AAPL'})
+        assert mock_get.call_count == 2
+
+    def test_errors_not_cached(self, tmp_path):
+        fmp = FMPCollector(api_key='test_key', cache_dir=tmp_path)
+        error = MagicMock(status_code=429)
+        with patch.object(fmp._session, 'get', return_value=error):
+            with pytest.raises(DataValidationError):
+                fmp._make_request('grades', {'symbol': 'AAPL'})
+        assert list(tmp_path.iterdir()) == []
+
+
 # --- Analyst Estimates Tests ---
 
 class TestAnalystEstimates:
@@ -0,0 +1,64 @@
+"""
+Tests for FundamentalCalculator bulk scoring.
+
+Framework Reference: Section 3
+Checks that calculate_fundamental_scores_bulk reproduces the per-stock
+calculate_fundamental_score results exactly.
+"""
+
+import random
+
+from calculators.fundamental import FundamentalCalculator
+
+
+METRICS = [
+    'pe_ratio', 'pb_ratio', 'ps_ratio', 'ev_ebitda', 'dividend_yield',
+    'roe', 'roa', 'net_margin', 'operating_margin', 'gross_margin',
+    'revenue_growth', 'earnings_growth',
+]
+
+
+def _universe(stocks):
+    universe = {}
+    for metric in METRICS:
+        values = [s[metric] for s in stocks.values() if s.get(metric) is not None]
+        if values:
+            universe[metric] = values
+    return universe
+
+
+class TestFundamentalScoresBulk:
+
+    def test_matches_per_stock_scoring(self):
+        rng = random.Random(7)
+        stocks = {}
+        for i in range(40):
+            stocks[f'T{i}'] = {
+                metric: None if rng.random() < 0.2 else round(rng.uniform(-0.5, 40.0), 2)
+                for metric in METRICS
+            }
+        stocks['T0']['pe_ratio'] = 0.0  # zero values are skipped like None
+        universe = _universe(stocks)
+
+        calc = FundamentalCalculator()
+        bulk = calc.calculate_fundamental_scores_bulk(stocks, universe)
+
+        assert list(bulk) == list(stocks)
+        for ticker, metrics in stocks.items():
+            assert bulk[ticker] == calc.calculate_fundamental_score(metrics, universe)
+
+    def test_missing_component_is_none(self):
+        stocks = {
+            'AAPL': {'pe_ratio': 28.5, 'roe': 0.80},
+            'MSFT': {'pe_ratio': 32.0, 'roe': 0.35},
+        }
+        result = FundamentalCalculator().calculate_fundamental_scores_bulk(
+            stocks, _universe(stocks)
+        )
+        assert result['AAPL']['growth_score'] is None
+        assert result['AAPL']['value_score'] == 50.0
+        assert result['AAPL']['quality_score'] == 50.0
+        assert result['AAPL']['fundamental_score'] == 50.0
+
+    def test_empty(self):
+        assert FundamentalCalculator().calculate_fundamental_scores_bulk({}, {}) == {}
@@ -102,6 +102,22 @@ class TestCompute:
         assert (valid_rsi >= 0).all()
         assert (valid_rsi <= 100).all()
 
+    def test_rsi_uses_wilder_smoothing(self, builder, price_df):
+        result = builder.compute(price_df)
+        changes = np.diff(price_df['close'].to_numpy())
+        gains = np.maximum(changes, 0)
+        losses = np.maximum(-changes, 0)
+        avg_gain, avg_loss = gains[:14].mean(), losses[:14].mean()
+        for gain, loss in zip(gains[14:], losses[14:]):
+            avg_gain = (avg_gain * 13 + gain) / 14
+            avg_loss = (avg_loss * 13 + loss) / 14
+        expected = 100 - 100 / (1 + avg_gain / avg_loss)
+
+        assert result['rsi_14'].iloc[-1] == pytest.approx(expected, rel=1e-9)
+        # First value needs 14 price changes (15 closes)
+        assert result['rsi_14'].iloc[:14].isna().all()
+        assert pd.notna(result['rsi_14'].iloc[14])
+
     def test_momentum_1m(self, builder, price_df):
         result = builder.compute(price_df)
         idx = 50
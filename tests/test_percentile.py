@@ -10,8 +10,10 @@ import numpy as np
 from calculators.percentile import (
     percentile_rank,
     percentile_rank_inverted,
+    percentile_rank_array,
     rank_universe,
     average_percentile_ranks,
+    average_percentile_ranks_array,
     validate_percentile_score,
     handle_missing_data
 )
@@ -244,6 +246,64 @@ class TestAveragePercentileRanks:
         assert avg == 80.0
 
 
+class TestPercentileRankArray:
+    """Test vectorized ranking of many values against one universe"""
+
+    def test_matches_scalar_ranking(self):
+        universe = [10, 20, 30, 40, 50]
+        values = np.array([5.0, 30.0, 35.0, 60.0])
+        ranks = percentile_rank_array(values, universe)
+        assert ranks.tolist() == [percentile_rank(v, universe) for v in values]
+
+    def test_matches_scalar_inverted_ranking(self):
+        universe = [10, 20, 30, 40, 50]
+        values = np.array([15.0, 30.0, 55.0])
+        ranks = percentile_rank_array(values, universe, inverted=True)
+        assert ranks.tolist() == [percentile_rank_inverted(v, universe) for v in values]
+
+    def test_ties_and_duplicates_match_scalar(self):
+        universe = [10, 20, 20, 20, 30, 30, 40]
+        values = np.array([20.0, 30.0, 10.0, 40.0, 25.0])
+        assert percentile_rank_array(values, universe).tolist() == [
+            percentile_rank(v, universe) for v in values
+        ]
+        assert percentile_rank_array(values, universe, inverted=True).tolist() == [
+            percentile_rank_inverted(v, universe) for v in values
+        ]
+
+    def test_missing_values_stay_nan(self):
+        ranks = percentile_rank_array(np.array([np.nan, 35.0]), [10, None, 30, 40, 50])
+        assert np.isnan(ranks[0])
+        assert ranks[1] == 50.0
+
+    def test_empty_universe(self):
+        ranks = percentile_rank_array(np.array([1.0, 2.0]), [None])
+        assert np.isnan(ranks).all()
+
+
+class TestAveragePercentileRanksArray:
+    """Test row-wise averaging of rank matrices"""
+
+    def test_matches_scalar_average(self):
+        rows = [[78, 82, np.nan, 88], [np.nan, 70, 60, np.nan]]
+        avg = average_percentile_ranks_array(np.array(rows))
+        assert avg.tolist() == [
+            average_percentile_ranks([r if not np.isnan(r) else None for r in row])
+            for row in rows
+        ]
+
+    def test_weights_renormalized_per_row(self):
+        ranks = np.array([[80, 90, 70], [80, np.nan, 70]])
+        avg = average_percentile_ranks_array(ranks, [2, 1, 1])
+        assert avg[0] == 80.0
+        assert avg[1] == average_percentile_ranks([80, 70], [2, 1])
+
+    def test_row_without_ranks_is_nan(self):
+        avg = average_percentile_ranks_array(np.array([[np.nan, np.nan], [50, np.nan]]))
+        assert np.isnan(avg[0])
+        assert avg[1] == 50.0
+
+
 class TestValidatePercentileScore:
     """Test percentile score validation"""
 
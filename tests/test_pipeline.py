@@ -6,11 +6,21 @@ Scoring logic is tested via existing calculator tests;
 these tests focus on the pipeline orchestration layer.
 """
 
+import json
+from datetime import date
+
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 from scoring.pipeline import ScoringPipeline, PipelineResult
 from models.composite import CompositeScore, Recommendation
+from database.models import (
+    Base, Stock, FundamentalData, TechnicalIndicator, SentimentData,
+    PriceData, MarketSentiment,
+)
 
 
 class TestPipelineDataPreparation:
@@ -111,6 +121,22 @@ class TestPipelineDataPreparation:
         assert stock_data['AAPL']['short_term_uptrend'] is None
         assert stock_data['AAPL']['long_term_uptrend'] is None
 
+    def test_prepare_technical_flags_per_stock(self):
+        records = {
+            'AAPL': {'current_price': 185.0, 'sma_20': 180.0, 'sma_50': 175.0},
+            'MSFT': {'current_price': 400.0, 'sma_20': 400.0, 'sma_50': 390.0,
+                     'sma_200': 380.0},
+            'PG': {},
+        }
+        stock_data, _ = ScoringPipeline._prepare_technical(records)
+        assert stock_data['AAPL']['short_term_uptrend'] is True
+        assert stock_data['AAPL']['long_term_uptrend'] is None
+        # Price equal to SMA20 is not an uptrend
+        assert stock_data['MSFT']['short_term_uptrend'] is False
+        assert stock_data['MSFT']['long_term_uptrend'] is True
+        assert stock_data['PG']['short_term_uptrend'] is None
+        assert stock_data['PG']['long_term_uptrend'] is None
+
     def test_prepare_sentiment_computes_recommendation_mean(self):
         records = {
             'AAPL': {
@@ -158,6 +184,17 @@ class TestPipelineDataPreparation:
         stock_data, _ = ScoringPipeline._prepare_sentiment(records)
         assert stock_data['AAPL']['recommendation_mean'] is None
 
+    def test_prepare_sentiment_recommendation_mean_per_stock(self):
+        records = {
+            'AAPL': {'num_buy_ratings': 3, 'num_hold_ratings': None, 'num_sell_ratings': 1},
+            'MSFT': {},
+            'PG': {'num_hold_ratings': 4},
+        }
+        stock_data, _ = ScoringPipeline._prepare_sentiment(records)
+        assert stock_data['AAPL']['recommendation_mean'] == (3 * 1.0 + 1 * 5.0) / 4
+        assert stock_data['MSFT']['recommendation_mean'] is None
+        assert stock_data['PG']['recommendation_mean'] == 3.0
+
     def test_prepare_sentiment_field_mapping(self):
         records = {
             'AAPL': {
@@ -184,6 +221,296 @@ class TestPipelineDataPreparation:
         assert stock_data['AAPL']['analyst_count'] == 17
         assert stock_data['AAPL']['insider_net_shares'] == -100000
 
+    def test_build_universe_drops_missing_per_metric(self):
+        stock_data = {
+            'AAPL': {'pe_ratio': 28.5, 'roe': None},
+            'MSFT': {'pe_ratio': 32.0, 'roe': 0.35},
+            'PG': {'roe': 0.30},
+        }
+        universe = ScoringPipeline._build_universe(stock_data, ('pe_ratio', 'roe', 'roa'))
+        assert universe == {'pe_ratio': [28.5, 32.0], 'roe': [0.35, 0.30]}
+
+    def test_build_universe_empty(self):
+        assert ScoringPipeline._build_universe({}, ('pe_ratio',)) == {}
+
+    def test_prepare_pillars_matches_individual_prepares(self):
+        fundamental = {
+            'AAPL': {'pe_ratio': 28.5, 'roe': 0.0},
+            'MSFT': {'pe_ratio': 32.0, 'roe': 0.35},
+        }
+        technical = {
+            'AAPL': {'current_price': 150.0, 'sma_20': 145.0, 'sma_50': 140.0, 'rsi_14': 55.0},
+            'NVDA': {'current_price': 800.0, 'sma_50': 700.0, 'rsi_14': 70.0},
+        }
+        sentiment = {
+            'MSFT': {'num_buy_ratings': 3, 'num_hold_ratings': 1, 'num_sell_ratings': 0,
+                     'market_cap': 3.0e12},
+        }
+        prepared = ScoringPipeline._prepare_pillars(fundamental, technical, sentiment)
+
+        expected = {
+            'fundamental': ScoringPipeline._prepare_fundamental(fundamental),
+            'technical': ScoringPipeline._prepare_technical(technical),
+            'sentiment': ScoringPipeline._prepare_sentiment(sentiment),
+        }
+        for pillar, (stock_data, universe) in expected.items():
+            assert prepared[pillar][0] == stock_data
+            assert {m: sorted(v) for m, v in prepared[pillar][1].items()} == \
+                {m: sorted(v) for m, v in universe.items()}
+
+    def test_prepare_pillars_empty_pillar(self):
+        prepared = ScoringPipeline._prepare_pillars({}, {'AAPL': {'rsi_14': 55.0}}, {})
+        assert prepared['fundamental'] == ({}, {})
+        assert prepared['sentiment'] == ({}, {})
+        assert prepared['technical'][1] == {'rsi_14': [55.0]}
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session seeded with a small universe."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Stock(ticker='AAPL', market_cap=3000000000000, is_active=True),
+        Stock(ticker='MSFT', market_cap=2500000000000, is_active=True),
+        Stock(ticker='OLD', market_cap=1000000, is_active=False),
+    ])
+    session.add_all([
+        FundamentalData(ticker='AAPL', report_date=date(2026, 1, 31),
+                        pe_ratio=28.5, pb_ratio=10.0, roe=0.80,
+                        revenue_growth_yoy=0.08),
+        FundamentalData(ticker='MSFT', report_date=date(2026, 1, 31),
+                        pe_ratio=32.0, roe=0.35),
+        TechnicalIndicator(ticker='AAPL', calculation_date=date(2026, 2, 1),
+                           sma_50=170.0, rsi_14=40.0, momentum_12_1=0.05),
+        TechnicalIndicator(ticker='AAPL', calculation_date=date(2026, 2, 13),
+                           sma_50=175.0, rsi_14=55.0, momentum_12_1=0.15,
+                           price_vs_200ma=True),
+        TechnicalIndicator(ticker='MSFT', calculation_date=date(2026, 2, 13),
+                           sma_50=400.0, rsi_14=60.0),
+        PriceData(ticker='AAPL', date=date(2026, 2, 12), close=180.0),
+        PriceData(ticker='AAPL', date=date(2026, 2, 13), close=185.0),
+        PriceData(ticker='MSFT', date=date(2026, 2, 13), close=410.0),
+        SentimentData(ticker='AAPL', data_date=date(2026, 2, 13),
+                      consensus_price_target=200.0, num_buy_ratings=20,
+                      num_hold_ratings=5, num_analyst_opinions=25,
+                      insider_net_shares_6m=-100000),
+        MarketSentiment(date=date(2026, 2, 6), market_sentiment_score=40.0,
+                        num_indicators_available=3, vix_score=35.0),
+        MarketSentiment(date=date(2026, 2, 13), market_sentiment_score=55.0,
+                        num_indicators_available=4, vix_score=60.0),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestPipelineLoadData:
+    """Tests for load_data against an in-memory database."""
+
+    def test_loads_active_tickers_only(self, db_session):
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        assert sorted(data['tickers']) == ['AAPL', 'MSFT']
+        assert data['market_caps']['AAPL'] == 3000000000000.0
+
+    def test_ticker_filter(self, db_session):
+        data = ScoringPipeline(verbose=False).load_data(db_session, tickers=['MSFT'])
+        assert data['tickers'] == ['MSFT']
+        assert list(data['fundamental_data']) == ['MSFT']
+        assert list(data['technical_data']) == ['MSFT']
+        assert data['sentiment_data'] == {}
+
+    def test_fundamental_values(self, db_session):
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        aapl = data['fundamental_data']['AAPL']
+        assert aapl['pe_ratio'] == 28.5
+        assert isinstance(aapl['pe_ratio'], float)
+        assert aapl['revenue_growth_yoy'] == 0.08
+        assert aapl['ps_ratio'] is None
+
+    def test_zero_values_are_kept(self, db_session):
+        db_session.add_all([
+            FundamentalData(ticker='MSFT', report_date=date(2026, 2, 1),
+                            dividend_yield=0, revenue_growth_yoy=0),
+            SentimentData(ticker='MSFT', data_date=date(2026, 2, 13),
+                          num_sell_ratings=0, estimate_revisions_up_90d=12,
+                          estimate_revisions_down_90d=0),
+        ])
+        db_session.query(FundamentalData).filter_by(
+            ticker='MSFT', report_date=date(2026, 1, 31)).delete()
+        db_session.commit()
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        assert data['fundamental_data']['MSFT']['dividend_yield'] == 0.0
+        assert data['fundamental_data']['MSFT']['revenue_growth_yoy'] == 0.0
+        msft = data['sentiment_data']['MSFT']
+        assert msft['num_sell_ratings'] == 0
+        assert msft['estimate_revisions_down_90d'] == 0
+
+    def test_latest_fundamental_and_sentiment_rows(self, db_session):
+        db_session.add_all([
+            FundamentalData(ticker='MSFT', report_date=date(2026, 2, 10), pe_ratio=30.0),
+            FundamentalData(ticker='MSFT', report_date=date(2025, 12, 31), pe_ratio=35.0),
+            SentimentData(ticker='MSFT', data_date=date(2026, 2, 13), num_buy_ratings=7),
+            SentimentData(ticker='MSFT', data_date=date(2026, 1, 13), num_buy_ratings=3),
+        ])
+        db_session.commit()
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        assert data['fundamental_data']['MSFT']['pe_ratio'] == 30.0
+        assert data['sentiment_data']['MSFT']['num_buy_ratings'] == 7
+
+    def test_latest_technical_with_current_price(self, db_session):
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        aapl = data['technical_data']['AAPL']
+        assert aapl['rsi_14'] == 55.0
+        assert aapl['momentum_12_1'] == 0.15
+        assert aapl['price_vs_200ma'] is True
+        assert aapl['current_price'] == 185.0
+        assert data['latest_prices'] == {'AAPL': 185.0, 'MSFT': 410.0}
+
+    def test_latest_price_ignores_insert_order(self, db_session):
+        db_session.add_all([
+            PriceData(ticker='MSFT', date=date(2026, 2, 14), close=415.0),
+            PriceData(ticker='MSFT', date=date(2026, 2, 10), close=400.0),
+        ])
+        db_session.commit()
+        data = ScoringPipeline(verbose=False).load_data(db_session, tickers=['MSFT'])
+        assert data['tickers'] == ['MSFT']
+        assert data['latest_prices'] == {'MSFT': 415.0}
+
+    def test_stock_without_prices_has_no_latest_price(self, db_session):
+        db_session.add(Stock(ticker='NEW', is_active=True))
+        db_session.commit()
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        assert 'NEW' in data['tickers']
+        assert 'NEW' not in data['latest_prices']
+        assert data['market_caps']['NEW'] is None
+
+    def test_sentiment_enriched_with_market_cap(self, db_session):
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        aapl = data['sentiment_data']['AAPL']
+        assert aapl['num_buy_ratings'] == 20
+        assert aapl['insider_net_shares_6m'] == -100000
+        assert aapl['consensus_price_target'] == 200.0
+        assert aapl['market_cap'] == 3000000000000.0
+        assert aapl['num_sell_ratings'] is None
+
+    def test_zero_market_sentiment_score_is_kept(self, db_session):
+        db_session.add(MarketSentiment(date=date(2026, 2, 14), market_sentiment_score=20.0,
+                                       num_indicators_available=4, vix_score=0))
+        db_session.commit()
+        ms = ScoringPipeline(verbose=False).load_data(db_session)['market_sentiment']
+        assert ms['vix_score'] == 0.0
+
+    def test_streaming_batch_size_does_not_change_result(self, db_session):
+        expected = ScoringPipeline(verbose=False).load_data(db_session)
+        pipeline = ScoringPipeline(verbose=False)
+        pipeline.LOAD_BATCH_SIZE = 1
+        assert pipeline.load_data(db_session) == expected
+
+    def test_latest_market_sentiment(self, db_session):
+        data = ScoringPipeline(verbose=False).load_data(db_session)
+        ms = data['market_sentiment']
+        assert ms['date'] == date(2026, 2, 13)
+        assert ms['market_sentiment_score'] == 55.0
+        assert ms['num_indicators_available'] == 4
+        assert ms['aaii_score'] is None
+
+
+class TestPipelineCalculateScores:
+    """Tests for calculate_scores orchestration."""
+
+    def _data(self):
+        tech = {'momentum_12_1': 0.10, 'mad': 0.02, 'price_vs_200ma': True,
+                'rsi_14': 55.0, 'current_price': 100.0}
+        sent = {'num_buy_ratings': 10, 'num_hold_ratings': 5,
+                'num_analyst_opinions': 15, 'consensus_price_target': 120.0}
+        return {
+            'tickers': ['AAA', 'BBB', 'CCC'],
+            'fundamental_data': {
+                'AAA': {'pe_ratio': 20.0, 'roe': 0.2},
+                'BBB': {'pe_ratio': 25.0, 'roe': 0.3},
+                'CCC': {'pe_ratio': 30.0, 'roe': 0.1},
+            },
+            'technical_data': {t: dict(tech) for t in ('AAA', 'BBB', 'CCC')},
+            'sentiment_data': {t: dict(sent) for t in ('AAA', 'BBB', 'CCC')},
+            'latest_prices': {'AAA': 100.0, 'BBB': 100.0, 'CCC': 90.0},
+            'market_sentiment': None,
+        }
+
+    def test_identical_inputs_score_once(self):
+        pipeline = ScoringPipeline(verbose=False)
+        tech_calc = pipeline._technical_calc
+        sent_calc = pipeline._sentiment_calc
+        with patch.object(tech_calc, 'calculate_technical_score',
+                          wraps=tech_calc.calculate_technical_score) as tech_spy, \
+             patch.object(sent_calc, 'calculate_sentiment_score',
+                          wraps=sent_calc.calculate_sentiment_score) as sent_spy:
+            pillar_scores, composite = pipeline.calculate_scores(self._data())
+
+        assert tech_spy.call_count == 1
+        # CCC has a different price, so its sentiment is computed separately
+        assert sent_spy.call_count == 2
+        assert len(composite) == 3
+        assert pillar_scores['AAA']['technical'] == pillar_scores['CCC']['technical']
+
+    def test_process_pool_matches_serial(self):
+        data = self._data()
+        for i, ticker in enumerate(data['tickers']):
+            data['technical_data'][ticker]['momentum_12_1'] = 0.05 * i
+        serial_scores, _ = ScoringPipeline(verbose=False).calculate_scores(data)
+
+        pipeline = ScoringPipeline(verbose=False, workers=2)
+        pipeline.PARALLEL_MIN_STOCKS = 0
+        parallel_scores, _ = pipeline.calculate_scores(data)
+        assert parallel_scores == serial_scores
+
+    def test_score_cache_reused_for_unchanged_inputs(self, tmp_path):
+        cache_path = tmp_path / 'scores.pkl'
+        first = ScoringPipeline(verbose=False, cache_path=cache_path).calculate_scores(self._data())
+        assert cache_path.exists()
+
+        pipeline = ScoringPipeline(verbose=False, cache_path=cache_path)
+        with patch.object(pipeline, '_compute_scores',
+                          side_effect=AssertionError("should not recompute")):
+            second = pipeline.calculate_scores(self._data())
+        assert second == first
+
+    def test_score_cache_misses_on_changed_inputs(self, tmp_path):
+        cache_path = tmp_path / 'scores.pkl'
+        ScoringPipeline(verbose=False, cache_path=cache_path).calculate_scores(self._data())
+
+        data = self._data()
+        data['latest_prices']['CCC'] = 95.0
+        pipeline = ScoringPipeline(verbose=False, cache_path=cache_path)
+        with patch.object(pipeline, '_compute_scores',
+                          wraps=pipeline._compute_scores) as compute:
+            pipeline.calculate_scores(data)
+        assert compute.call_count == 1
+
+    def test_score_cache_key_includes_weights(self, tmp_path):
+        cache_path = tmp_path / 'scores.pkl'
+        ScoringPipeline(verbose=False, cache_path=cache_path).calculate_scores(self._data())
+        pipeline = ScoringPipeline(
+            weights={'fundamental': 0.5, 'technical': 0.3, 'sentiment': 0.2},
+            verbose=False, cache_path=cache_path,
+        )
+        with patch.object(pipeline, '_compute_scores',
+                          wraps=pipeline._compute_scores) as compute:
+            pipeline.calculate_scores(self._data())
+        assert compute.call_count == 1
+
+    def test_score_cache_misses_on_version_bump(self, tmp_path):
+        cache_path = tmp_path / 'scores.pkl'
+        ScoringPipeline(verbose=False, cache_path=cache_path).calculate_scores(self._data())
+
+        pipeline = ScoringPipeline(verbose=False, cache_path=cache_path)
+        with patch('scoring.pipeline.SCORE_CACHE_VERSION', -1), \
+                patch.object(pipeline, '_compute_scores',
+                             wraps=pipeline._compute_scores) as compute:
+            pipeline.calculate_scores(self._data())
+        assert compute.call_count == 1
+
 
 class TestPipelineResult:
     """Tests for the PipelineResult container."""
@@ -229,6 +556,43 @@ class TestPipelineResult:
         assert 'composite_score' in ranked[0]
         assert 'recommendation' in ranked[0]
 
+    def test_as_arrays_columns_aligned(self):
+        result = self._make_result()
+        arrays = result.as_arrays()
+        assert list(arrays['ticker']) == ['AAPL', 'GOOGL', 'PG']
+        assert arrays['ticker'].dtype == np.dtype('U10')
+        assert arrays['composite_percentile'].dtype == np.float32
+        assert arrays['composite_percentile'].tolist() == [70.0, 80.0, 20.0]
+        assert arrays['fundamental'].tolist() == [50.0, 55.0, 40.0]
+        assert arrays['recommendation'].tolist() == ['BUY', 'BUY', 'SELL']
+
+    def test_as_arrays_empty(self):
+        result = PipelineResult(composite_results=[], pillar_scores={}, data={}, weights={})
+        arrays = result.as_arrays()
+        assert arrays['composite_percentile'].shape == (0,)
+        assert arrays['recommendation'].shape == (0,)
+
+    def test_persist_to_json_roundtrip(self, tmp_path):
+        result = self._make_result()
+        result.pillar_scores['AAPL']['fundamental_detail'] = {
+            'value_score': np.float64(61.5), 'quality_score': None,
+        }
+        result.pillar_scores['TSLA'] = {
+            'fundamental': 40.0, 'technical': None, 'sentiment': None,
+            'data_status': {'technical': 'no_data'},
+        }
+        pipeline = ScoringPipeline(verbose=False)
+        path = pipeline.persist_to_json(result, output_path=tmp_path / 'latest_scores.json')
+
+        data = json.loads(path.read_text())
+        assert data['scored_count'] == 3
+        assert data['unscored_count'] == 1
+        by_ticker = {s['ticker']: s for s in data['scores']}
+        assert by_ticker['AAPL']['recommendation'] == 'BUY'
+        assert by_ticker['AAPL']['sub_components']['fundamental']['value_score'] == 61.5
+        assert by_ticker['TSLA']['recommendation'] == 'INSUFFICIENT DATA'
+        assert by_ticker['TSLA']['composite_score'] is None
+
     def test_weights_preserved(self):
         result = self._make_result()
         assert result.weights['fundamental'] == 0.45
@@ -98,3 +98,18 @@ def test_rate_limiter_reset():
     elapsed = time.time() - start
 
     assert elapsed < 0.1
+
+
+def test_rate_limiter_enforces_limit_across_threads():
+    """Test that concurrent callers share one limit."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    limiter = RateLimiter(calls=3, period=0.5)
+
+    # 6 calls from 6 threads: the second batch of 3 must wait for the window
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(lambda _: limiter.wait_if_needed(), range(6)))
+    elapsed = time.time() - start
+
+    assert elapsed >= 0.45
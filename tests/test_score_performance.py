@@ -314,3 +314,25 @@ class TestPriceLookup:
         )
         assert result['1m'] is None
         assert result['3m'] is None
+
+    def test_build_price_cache_groups_sorted_prices(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from database.models import Base, PriceData
+
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add_all([
+            PriceData(ticker='MSFT', date=date(2025, 1, 2), close=410.0),
+            PriceData(ticker='AAPL', date=date(2025, 1, 3), close=186.0),
+            PriceData(ticker='AAPL', date=date(2025, 1, 2), close=185.0),
+        ])
+        session.commit()
+
+        cache = ScorePerformanceAnalyzer._build_price_cache(session)
+        assert cache == {
+            'AAPL': ([date(2025, 1, 2), date(2025, 1, 3)], [185.0, 186.0]),
+            'MSFT': ([date(2025, 1, 2)], [410.0]),
+        }
+        session.close()
@@ -0,0 +1,73 @@
+"""
+Tests for calculate_technical_indicators.py.
+
+Covers the per-ticker fallback in process_all_stocks. Database access
+(price loading, storage, sector-relative returns) is patched out.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.calculate_technical_indicators import TechnicalIndicatorCalculator
+
+
+def _price_history(ticker, closes):
+    """Daily price rows for one ticker, oldest first."""
+    dates = pd.date_range('2024-01-01', periods=len(closes), freq='B')
+    return pd.DataFrame({
+        'ticker': ticker,
+        'date': dates,
+        'close': closes,
+        'volume': 1_000_000.0,
+    })
+
+
+def _run(prices):
+    """Run process_all_stocks on ``prices``; return (calculator, stored records)."""
+    calculator = TechnicalIndicatorCalculator()
+    tickers = list(dict.fromkeys(prices['ticker']))
+    with patch.object(calculator, 'get_price_data', return_value=prices), \
+         patch.object(calculator, 'store_indicators') as store, \
+         patch.object(calculator, 'calculate_sector_relative_returns'):
+        calculator.process_all_stocks(tickers=tickers)
+    store.assert_called_once()
+    return calculator, store.call_args.args[0]
+
+
+class TestProcessAllStocks:
+
+    def test_all_tickers_stored(self):
+        prices = pd.concat([
+            _price_history('AAA', np.linspace(100, 120, 260)),
+            _price_history('BBB', np.linspace(50, 40, 260)),
+        ], ignore_index=True)
+
+        calculator, stored = _run(prices)
+
+        assert [r['ticker'] for r in stored] == ['AAA', 'BBB']
+        assert calculator.stats['stocks_processed'] == 2
+        assert calculator.stats['errors'] == []
+
+    def test_malformed_ticker_does_not_drop_others(self):
+        """A ticker whose closes cannot be parsed fails alone."""
+        bad_closes = np.linspace(10, 12, 260).astype(object)
+        bad_closes[-1] = 'n/a'
+        prices = pd.concat([
+            _price_history('AAA', np.linspace(100, 120, 260)),
+            _price_history('BAD', bad_closes),
+            _price_history('CCC', np.linspace(30, 35, 260)),
+        ], ignore_index=True)
+
+        calculator, stored = _run(prices)
+
+        assert [r['ticker'] for r in stored] == ['AAA', 'CCC']
+        assert calculator.stats['stocks_processed'] == 2
+        assert calculator.stats['indicators_calculated'] == 2
+        assert len(calculator.stats['errors']) == 1
+        assert calculator.stats['errors'][0].startswith('BAD: ')